@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Замер времени холодного старта лаунчера через `python -X importtime`.
+
+Пути запуска:
+  launcher — `import launcher` (команда run без графического интерфейса)
+  runner   — `import launcher_runner` (процесс, который запускает бота)
+  gui      — `import launcher` + импорт tkinter/customtkinter для графического интерфейса
+
+Пример:
+  python benchmarks/bench_import.py --repeat 7 --top 10
+"""
+
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+import json
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PATHS = {
+    "launcher": "import launcher",
+    "runner": "import launcher_runner",
+    "gui": "import launcher; launcher.import_gui_modules()",
+}
+
+
+def run_importtime(code, use_bytecode=True):
+    """Запуск интерпретатора с -X importtime, возвращает записи (self_us, cumulative_us, depth, name)"""
+    env = dict(os.environ)
+    if use_bytecode:
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+    else:
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "ошибка запуска")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return entries
+
+
+def measure(code, repeat, use_bytecode):
+    """Медианное суммарное время импорта и самые тяжелые модули верхнего уровня"""
+    if use_bytecode:
+        # Прогрев: заполняем __pycache__, чтобы замер отражал обычный повторный запуск
+        run_importtime(code, use_bytecode=True)
+
+    totals = []
+    heavy = {}
+    for _ in range(repeat):
+        entries = run_importtime(code, use_bytecode)
+        # Суммируем только модули первого уровня, вложенные уже входят в cumulative
+        top_level = [entry for entry in entries if entry[2] == 0]
+        totals.append(sum(entry[1] for entry in top_level))
+        for _, cumulative_us, _, name in top_level:
+            heavy.setdefault(name, []).append(cumulative_us)
+
+    heavy_median = {name: statistics.median(values) for name, values in heavy.items()}
+    return statistics.median(totals), heavy_median
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк времени импорта лаунчера")
+    parser.add_argument("--repeat", type=int, default=5, help="Количество замеров для каждого пути")
+    parser.add_argument("--top", type=int, default=8, help="Сколько самых тяжелых импортов показать")
+    parser.add_argument("--no-bytecode", action="store_true", help="Замер без кэша байткода (__pycache__)")
+    parser.add_argument("--json", help="Сохранить результаты в JSON-файл")
+    args = parser.parse_args()
+
+    results = {}
+    for path_name, code in PATHS.items():
+        try:
+            total_us, heavy = measure(code, args.repeat, not args.no_bytecode)
+        except RuntimeError as e:
+            print(f"[{path_name}] пропущен: {e}")
+            continue
+
+        results[path_name] = {"total_ms": round(total_us / 1000, 2), "top": {}}
+        print(f"\n=== {path_name}: {total_us / 1000:.1f} мс (медиана из {args.repeat}) ===")
+        for name, cumulative_us in sorted(heavy.items(), key=lambda item: -item[1])[:args.top]:
+            results[path_name]["top"][name] = round(cumulative_us / 1000, 2)
+            print(f"  {cumulative_us / 1000:8.1f} мс  {name}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=4, ensure_ascii=False)
+        print(f"\nРезультаты сохранены в {args.json}")
+
+
+if __name__ == "__main__":
+    main()
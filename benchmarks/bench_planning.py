@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк этапов подготовки запуска без графического интерфейса.
+
+Каждый этап замеряется для 100, 10 000 и 100 000 аккаунтов и для встроенного
+и большого каталога модулей: медианное время и пиковая память (tracemalloc).
+Лаунчер копируется во временную папку со своими tasks.py, config.yaml и
+private_keys.txt, поэтому файлы проекта не меняются.
+
+Этапы:
+  random_tasks   — generate_random_tasks (общий план для всех аккаунтов)
+  build_plans    — планы для всех аккаунтов (в одном процессе)
+  save_plans     — запись plans.json
+  load_plans     — чтение plans.json раннером
+  prepare_plans  — генерация и запись планов перед запуском (как в launch_app)
+  schedule       — generate_schedule (config.yaml, ключи, расписание, schedule.json)
+  load_schedule  — чтение schedule.json раннером
+  settings       — save_settings + load_settings
+  tasks_file     — запись CUSTOM_TASK в tasks.py
+  run_settings   — write_run_settings (файл настроек для раннера)
+
+Примеры:
+  python benchmarks/bench_planning.py --save benchmarks/results/base.json
+  python benchmarks/bench_planning.py --sizes 100,10000 --compare benchmarks/results/base.json
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import contextlib
+import tracemalloc
+import importlib
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCES = ("launcher.py", "launcher_plans.py", "launcher_runner.py")
+
+
+def make_catalog(size):
+    """Синтетический каталог модулей: size модулей в каждой категории"""
+    return {
+        "INITIAL": ["faucet"] + [f"initial_{i}" for i in range(size // 10)],
+        "SWAPS": ["collect_all_to_monad"] + [f"swap_{i}" for i in range(size)],
+        "STAKES": [f"stake_{i}" for i in range(size)],
+        "MINT": [f"mint_{i}" for i in range(size)],
+        "GAMES": [f"game_{i}" for i in range(size // 10)],
+        "OTHER": ["logs"] + [f"other_{i}" for i in range(size)],
+    }
+
+
+def prepare_workdir(workdir):
+    """Копия лаунчера во временной папке с минимальным окружением бота"""
+    for name in SOURCES:
+        shutil.copy(os.path.join(PROJECT_DIR, name), workdir)
+    os.makedirs(os.path.join(workdir, "data"), exist_ok=True)
+    with open(os.path.join(workdir, "config.yaml"), "w", encoding="utf-8") as file:
+        file.write("SETTINGS:\n  THREADS: 10\n  ACCOUNTS_RANGE: [0, 0]\n  EXACT_ACCOUNTS_TO_USE: []\n")
+    with open(os.path.join(workdir, "tasks.py"), "w", encoding="utf-8") as file:
+        file.write('TASKS = ["CUSTOM_TASK"]\n\n# Пресет для запуска\nCUSTOM_TASK = [\n    "faucet",\n]\n')
+
+
+def write_keys(workdir, accounts):
+    with open(os.path.join(workdir, "data", "private_keys.txt"), "w", encoding="utf-8") as file:
+        for i in range(accounts):
+            file.write(f"{i:064x}\n")
+
+
+class Context:
+    """Лаунчер с заданным каталогом и количеством аккаунтов"""
+
+    def __init__(self, launcher, workdir, catalog):
+        self.launcher = launcher
+        self.workdir = workdir
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.core = launcher.StarLabsLauncherCore()
+        self.core.update_info = lambda text: None
+        self.core.run_seed = 42
+        if catalog:
+            self.core.modules = make_catalog(catalog)
+            self.core.init_default_settings()
+        self.settings = self.core.settings_dict()
+        self.accounts = []
+        self.plans = None
+        self.toggle = False
+
+    def set_accounts(self, accounts):
+        write_keys(self.workdir, accounts)
+        self.accounts = list(range(1, accounts + 1))
+        self.plans, _ = self.launcher.build_plans(self.accounts, self.settings, self.core.modules, 42, workers=1)
+        self.launcher.save_plans(self.path("plans.json"), self.accounts, self.plans, 42)
+        self.core.generate_schedule("24")
+
+    def path(self, name):
+        return os.path.join(self.workdir, name)
+
+    def tasks_file(self):
+        # Чередуем планы, чтобы каждый вызов действительно перезаписывал файл
+        self.toggle = not self.toggle
+        self.core.tasks_file.update(CUSTOM_TASK=self.plans[0] if self.toggle else self.plans[-1])
+
+
+# Этап -> (функция, зависит ли от количества аккаунтов)
+STAGES = {
+    "random_tasks": (lambda ctx: ctx.core.generate_random_tasks(), False),
+    "build_plans": (lambda ctx: ctx.launcher.build_plans(ctx.accounts, ctx.settings, ctx.core.modules, 42, workers=1), True),
+    "save_plans": (lambda ctx: ctx.launcher.save_plans(ctx.path("plans.json"), ctx.accounts, ctx.plans, 42), True),
+    "load_plans": (lambda ctx: ctx.runner.load_plans(ctx.path("plans.json")), True),
+    "prepare_plans": (lambda ctx: ctx.core.prepare_plans(), True),
+    "schedule": (lambda ctx: ctx.core.generate_schedule("24"), True),
+    "load_schedule": (lambda ctx: ctx.runner.load_schedule(ctx.path("schedule.json")), True),
+    "settings": (lambda ctx: (ctx.core.save_settings(), ctx.core.load_settings()), False),
+    "tasks_file": (lambda ctx: ctx.tasks_file(), False),
+    "run_settings": (lambda ctx: ctx.core.write_run_settings(ctx.accounts), True),
+}
+
+
+def measure(func, ctx, repeat):
+    """Медианное и минимальное время (мс) и пиковая память (КБ) этапа"""
+    times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        func(ctx)  # прогрев
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func(ctx)
+            times.append((time.perf_counter() - started) * 1000)
+        # Память — отдельным прогоном: tracemalloc замедляет выполнение
+        tracemalloc.start()
+        func(ctx)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {"median_ms": round(statistics.median(times), 3), "min_ms": round(min(times), 3), "peak_kb": round(peak / 1024, 1)}
+
+
+def compare(results, baseline_path, threshold, min_ms):
+    """Сравнение с сохраненными результатами, возвращает количество регрессий"""
+    with open(baseline_path, "r", encoding="utf-8") as file:
+        baseline = json.load(file)["results"]
+
+    regressions = 0
+    print(f"\n=== Сравнение с {baseline_path} (порог x{threshold}) ===")
+    for key, current in results.items():
+        old = baseline.get(key)
+        if old is None:
+            continue
+        ratio = current["median_ms"] / old["median_ms"] if old["median_ms"] else 1.0
+        memory_ratio = current["peak_kb"] / old["peak_kb"] if old["peak_kb"] else 1.0
+        mark = ""
+        # Этапы короче min_ms по времени не сравниваем: там преобладает шум
+        slower = ratio > threshold and current["median_ms"] >= min_ms
+        if slower or memory_ratio > threshold:
+            mark = "  <-- регрессия"
+            regressions += 1
+        print(f"  {key:40} время x{ratio:5.2f}  память x{memory_ratio:5.2f}{mark}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк этапов подготовки запуска")
+    parser.add_argument("--sizes", default="100,10000,100000", help="Количества аккаунтов через запятую")
+    parser.add_argument("--catalogs", default="0,500", help="Размеры каталога модулей через запятую (0 — встроенный)")
+    parser.add_argument("--stages", help="Только указанные этапы через запятую")
+    parser.add_argument("--repeat", type=int, default=5, help="Количество замеров для каждого этапа")
+    parser.add_argument("--save", help="Сохранить результаты в JSON-файл")
+    parser.add_argument("--compare", help="Сравнить с результатами из JSON-файла")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Во сколько раз медленнее считается регрессией")
+    parser.add_argument("--min-ms", type=float, default=5.0, help="Более короткие этапы не считаются регрессией по времени")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    catalogs = [int(size) for size in args.catalogs.split(",")]
+    stages = args.stages.split(",") if args.stages else list(STAGES)
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        parser.error(f"неизвестные этапы: {', '.join(unknown)}")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        prepare_workdir(workdir)
+        sys.path.insert(0, workdir)
+        launcher = importlib.import_module("launcher")
+        runner = importlib.import_module("launcher_runner")
+
+        for catalog in catalogs:
+            ctx = Context(launcher, workdir, catalog)
+            ctx.runner = runner
+            catalog_name = "builtin" if not catalog else f"catalog{catalog}"
+            print(f"\n=== Каталог: {catalog_name} ===")
+            for index, accounts in enumerate(sizes):
+                ctx.set_accounts(accounts)
+                for stage in stages:
+                    func, per_accounts = STAGES[stage]
+                    # Этапы без зависимости от аккаунтов замеряем один раз на каталог
+                    if not per_accounts and index > 0:
+                        continue
+                    repeat = args.repeat if accounts < 100000 or not per_accounts else max(1, args.repeat // 2)
+                    key = f"{stage}/{accounts if per_accounts else '-'}/{catalog_name}"
+                    results[key] = measure(func, ctx, repeat)
+                    print(f"  {key:40} {results[key]['median_ms']:10.2f} мс  {results[key]['peak_kb']:10.1f} КБ")
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        data = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "repeat": args.repeat,
+            "results": results,
+        }
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=4, ensure_ascii=False)
+        print(f"\nРезультаты сохранены в {args.save}")
+
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold, args.min_ms) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,2326 +1,2673 @@
-#!/usr/bin/env python3
-"""
-StarLabs-Monad Launcher
-
-"""
-
-import os
-import sys
-import platform
-import random
-import asyncio
-import importlib.util
-import tkinter as tk
-from tkinter import messagebox, ttk
-import yaml
-import subprocess
-import re
-from datetime import datetime, timedelta
-import signal
-import json
-
-def handle_exit(signum, frame):
-    """Обработчик сигнала для корректного завершения приложения"""
-    print("\nЗавершение работы лаунчера...")
-    try:
-        if 'root' in globals() and hasattr(globals()['root'], 'quit'):
-            globals()['root'].quit()
-    except Exception:
-        pass
-    sys.exit(0)
-
-# Регистрируем обработчик сигнала
-signal.signal(signal.SIGINT, handle_exit)
-signal.signal(signal.SIGTERM, handle_exit)
-
-# Проверяем наличие необходимых библиотек
-try:
-    import customtkinter as ctk
-except ImportError:
-    print("Установка необходимых библиотек...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "customtkinter"])
-    import customtkinter as ctk
-
-# Определяем цветовую схему
-COLORS = {
-    "bg": "#121212",  # Слегка светлее черного фона
-    "frame_bg": "#1e1e1e",  # Слегка светлее фона фрейма
-    "accent": "#B8860B",  # Приглушенный золотой/желтый (DarkGoldenrod)
-    "text": "#ffffff",  # Белый текст
-    "entry_bg": "#1e1e1e",  # Темный фон ввода
-    "hover": "#8B6914",  # Более темный приглушенный желтый для наведения
-}
-
-class StarLabsLauncher:
-    def __init__(self):
-        # Настройка темы
-        ctk.set_appearance_mode("dark")
-        ctk.set_default_color_theme("blue")
-        
-        # Создание главного окна
-        self.root = ctk.CTk()
-        self.root.title("StarLabs Monad Launcher")
-        self.root.geometry("800x600")
-        self.root.minsize(800, 600)
-        self.root.configure(fg_color=COLORS["bg"])
-        
-        # Путь к файлу настроек
-        self.settings_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "launcher_settings.json")
-        
-        # Проверка и исправление файла tasks.py
-        self.check_tasks_file()
-        
-        # Загрузка доступных модулей
-        self.modules = self.load_available_modules()
-        
-        # Инициализация настроек рандомизации с дефолтными значениями
-        self.init_default_settings()
-        
-        # Загрузка сохраненных настроек (перезаписывает дефолтные значения)
-        self.load_settings()
-        
-        # Создание интерфейса
-        self.create_widgets()
-        
-        # Обновление интерфейса в соответствии с загруженными настройками
-        self.update_ui_from_settings()
-        
-        # Привязка обработчика закрытия окна
-        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
-        
-    def load_settings(self):
-        """Загрузка настроек из файла"""
-        try:
-            if os.path.exists(self.settings_path):
-                print(f"Загрузка настроек из {self.settings_path}")
-                with open(self.settings_path, "r", encoding="utf-8") as file:
-                    settings = json.load(file)
-                    
-                # Загрузка настроек для начальных модулей
-                if "initial" in settings:
-                    self.initial_modules = settings["initial"].get("modules", self.initial_modules)
-                
-                # Загрузка настроек для SWAPS
-                if "swaps" in settings:
-                    self.swaps_count_min = settings["swaps"].get("min", self.swaps_count_min)
-                    self.swaps_count_max = settings["swaps"].get("max", self.swaps_count_max)
-                    self.swaps_modules = settings["swaps"].get("modules", self.swaps_modules)
-                
-                # Загрузка настроек для STAKES
-                if "stakes" in settings:
-                    self.stakes_count_min = settings["stakes"].get("min", self.stakes_count_min)
-                    self.stakes_count_max = settings["stakes"].get("max", self.stakes_count_max)
-                    self.stakes_modules = settings["stakes"].get("modules", self.stakes_modules)
-                
-                # Загрузка настроек для MINT
-                if "mint" in settings:
-                    self.mint_count_min = settings["mint"].get("min", self.mint_count_min)
-                    self.mint_count_max = settings["mint"].get("max", self.mint_count_max)
-                    self.mint_modules = settings["mint"].get("modules", self.mint_modules)
-                    
-                if "games" in settings:
-                    self.games_modules = settings["games"].get("modules", self.games_modules)
-                
-                # Загрузка настроек для OTHER
-                if "other" in settings:
-                    self.other_probability = settings["other"].get("probability", self.other_probability)
-                    self.other_modules = settings["other"].get("modules", self.other_modules)
-                
-                # Загрузка настроек для collect_all_to_monad
-                if "collect" in settings:
-                    self.collect_probability = settings["collect"].get("probability", self.collect_probability)
-                
-                # Загрузка флага для генерации рандомных задач для каждого аккаунта
-                self.random_for_each_account = settings.get("random_for_each_account", self.random_for_each_account)
-                
-                # Загрузка состояния чекбоксов
-                self.random_modules_enabled = settings.get("random_modules_enabled", False)
-                self.schedule_enabled = settings.get("schedule_enabled", False)
-                
-                # Загрузка значения часов для расписания
-                self.hours_value = settings.get("hours_value", "24")
-                
-                print("Настройки успешно загружены")
-                return True
-            else:
-                print(f"Файл настроек {self.settings_path} не найден")
-                return False
-        except Exception as e:
-            print(f"Ошибка при загрузке настроек: {str(e)}")
-            import traceback
-            print(traceback.format_exc())
-            return False
-    
-    def save_settings(self):
-        """Сохранение настроек в файл"""
-        try:
-            settings = {
-                "initial": {  # Добавляем секцию для начальных модулей
-                    "modules": self.initial_modules
-                },
-                "swaps": {
-                    "min": self.swaps_count_min,
-                    "max": self.swaps_count_max,
-                    "modules": self.swaps_modules
-                },
-                "stakes": {
-                    "min": self.stakes_count_min,
-                    "max": self.stakes_count_max,
-                    "modules": self.stakes_modules
-                },
-                "mint": {
-                    "min": self.mint_count_min,
-                    "max": self.mint_count_max,
-                    "modules": self.mint_modules
-                },
-                "other": {
-                    "probability": self.other_probability,
-                    "modules": self.other_modules
-                },
-                
-                "games": {
-                    "modules": self.games_modules
-                },
-                "collect": {
-                    "probability": self.collect_probability
-                },
-                "random_for_each_account": self.random_for_each_account,
-                "random_modules_enabled": self.random_modules_var.get(),
-                "schedule_enabled": self.schedule_var.get(),
-                "hours_value": self.hours_entry.get()
-            }
-            
-            with open(self.settings_path, "w", encoding="utf-8") as file:
-                json.dump(settings, file, indent=4)
-            
-            print("Настройки успешно сохранены")
-        except Exception as e:
-            print(f"Ошибка при сохранении настроек: {str(e)}")
-    
-    def update_ui_from_settings(self):
-        """Обновление интерфейса в соответствии с загруженными настройками"""
-        try:
-            # Установка состояния чекбоксов
-            self.random_modules_var.set(self.random_modules_enabled)
-            self.toggle_random_modules()
-            
-            self.schedule_var.set(self.schedule_enabled)
-            self.toggle_schedule()
-            
-            # Установка значения часов для расписания
-            self.hours_entry.delete(0, "end")
-            self.hours_entry.insert(0, self.hours_value)
-            
-            # Выводим информацию о загруженных настройках
-            print(f"Интерфейс обновлен: random_modules={self.random_modules_enabled}, schedule={self.schedule_enabled}")
-            
-        except Exception as e:
-            print(f"Ошибка при обновлении интерфейса: {str(e)}")
-            import traceback
-            print(traceback.format_exc())
-    
-    def on_closing(self):
-        """Обработчик закрытия окна"""
-        self.save_settings()
-        self.root.destroy()
-    
-    def check_tasks_file(self):
-        """Проверка и исправление файла tasks.py"""
-        try:
-            # Путь к файлу tasks.py
-            tasks_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tasks.py")
-            
-            # Проверяем существование файла
-            if not os.path.exists(tasks_path):
-                print("Предупреждение: Файл tasks.py не найден.")
-                return
-            
-            # Читаем текущее содержимое файла
-            with open(tasks_path, "r", encoding="utf-8") as file:
-                content = file.read()
-            
-            # Проверяем наличие синтаксических ошибок в TASKS
-            tasks_pattern = r"TASKS = \[([\s\S]*?)\]"
-            tasks_match = re.search(tasks_pattern, content)
-            if tasks_match:
-                tasks_content = tasks_match.group(1)
-                
-                # Проверяем наличие лишних запятых
-                if ",," in tasks_content:
-                    # Исправляем лишние запятые
-                    tasks_content = re.sub(r",\s*,", ",", tasks_content)
-                    
-                    # Заменяем содержимое TASKS
-                    new_tasks_content = "TASKS = [" + tasks_content + "]"
-                    content = re.sub(tasks_pattern, new_tasks_content, content)
-                    
-                    # Записываем исправленное содержимое
-                    with open(tasks_path, "w", encoding="utf-8") as file:
-                        file.write(content)
-                    
-                    print("Исправлены синтаксические ошибки в файле tasks.py")
-        
-        except Exception as e:
-            print(f"Ошибка при проверке файла tasks.py: {str(e)}")
-        
-    def load_available_modules(self):
-        """Загрузка доступных модулей"""
-        modules = {
-            "INITIAL": [
-                "faucet",
-                "dusted",
-                "crusty_refuel",     
-                "memebridge",      
-            ],
-            "SWAPS": [
-                "collect_all_to_monad",
-                "swaps",
-                "bean",
-                "ambient",
-                "izumi",
-                "madness_swaps"
-            ],
-            "STAKES": [
-                "apriori",
-                "magma",
-                "shmonad",
-                "kintsu",
-                "nostra",
-                "multiplifi",
-                "flapsh"
-            ],
-            "MINT": [
-                "magiceden",
-                "owlto",
-                "lilchogstars",
-                "monadking",
-                "monadking_unlocked",
-                "easynode_deploy",
-                "onchaingm_deploy",
-                "morkie_monhog",
-                "morkie_monarch",
-                "monaigg",
-                "nerzo_soulbound"
-                "nerzo_monad",
-                "zkcodex"
-            ],
-            "GAMES": [ 
-                "frontrunner"  
-            ],
-            "OTHER": [
-                "logs",
-                "nad_domains",
-                "narwhal_finance",
-                "monsternad_whitelist"
-            ]
-        }
-        return modules
-        
-    def create_widgets(self):
-        """Создание виджетов интерфейса"""
-        # Создание фрейма для кнопок
-        button_frame = ctk.CTkFrame(self.root, fg_color=COLORS["frame_bg"])
-        button_frame.pack(fill="x", padx=20, pady=20)
-        
-        # Кнопка исправления бага с SelectorEventLoop
-        self.fix_button = ctk.CTkButton(
-            button_frame,
-            text="Исправить баг с SelectorEventLoop",
-            command=self.fix_selector_event_loop,
-            font=("Helvetica", 14, "bold"),
-            height=40,
-            fg_color=COLORS["accent"],
-            hover_color=COLORS["hover"],
-            text_color=COLORS["text"],
-            corner_radius=10
-        )
-        self.fix_button.pack(fill="x", padx=10, pady=10)
-        
-        # Кнопка открытия конфигурации
-        self.config_button = ctk.CTkButton(
-            button_frame,
-            text="Открыть конфигурацию",
-            command=self.open_config,
-            font=("Helvetica", 14, "bold"),
-            height=40,
-            fg_color=COLORS["accent"],
-            hover_color=COLORS["hover"],
-            text_color=COLORS["text"],
-            corner_radius=10
-        )
-        self.config_button.pack(fill="x", padx=10, pady=10)
-        
-        # Фрейм для настроек запуска
-        launch_frame = ctk.CTkFrame(self.root, fg_color=COLORS["frame_bg"])
-        launch_frame.pack(fill="x", padx=20, pady=10)
-        
-        # Чекбокс для рандомных модулей
-        self.random_modules_var = ctk.BooleanVar(value=False)
-        self.random_modules_check = ctk.CTkCheckBox(
-            launch_frame,
-            text="Использовать рандомные модули",
-            variable=self.random_modules_var,
-            font=("Helvetica", 12, "bold"),
-            text_color=COLORS["text"],
-            fg_color=COLORS["accent"],
-            hover_color=COLORS["hover"],
-            border_color=COLORS["accent"],
-            command=self.toggle_random_modules
-        )
-        self.random_modules_check.pack(anchor="w", padx=10, pady=10)
-        
-        # Кнопка настройки рандомных модулей
-        self.random_settings_button = ctk.CTkButton(
-            launch_frame,
-            text="Настройка рандомных модулей",
-            command=self.open_random_settings,
-            font=("Helvetica", 12),
-            height=30,
-            fg_color=COLORS["accent"],
-            hover_color=COLORS["hover"],
-            text_color=COLORS["text"],
-            corner_radius=8
-        )
-        self.random_settings_button.pack(anchor="w", padx=30, pady=5)
-        
-        # Чекбокс для генерации расписания
-        self.schedule_var = ctk.BooleanVar(value=False)
-        self.schedule_check = ctk.CTkCheckBox(
-            launch_frame,
-            text="Сгенерировать расписание",
-            variable=self.schedule_var,
-            font=("Helvetica", 12, "bold"),
-            text_color=COLORS["text"],
-            fg_color=COLORS["accent"],
-            hover_color=COLORS["hover"],
-            border_color=COLORS["accent"],
-            command=self.toggle_schedule
-        )
-        self.schedule_check.pack(anchor="w", padx=10, pady=10)
-        
-        # Фрейм для настройки часов (скрыт по умолчанию)
-        self.hours_frame = ctk.CTkFrame(launch_frame, fg_color=COLORS["frame_bg"])
-        
-        # Метка и поле для ввода часов
-        hours_label = ctk.CTkLabel(
-            self.hours_frame,
-            text="Количество часов:",
-            font=("Helvetica", 12),
-            text_color=COLORS["text"]
-        )
-        hours_label.pack(side="left", padx=10)
-        
-        self.hours_entry = ctk.CTkEntry(
-            self.hours_frame,
-            width=60,
-            font=("Helvetica", 12),
-            fg_color=COLORS["entry_bg"],
-            text_color=COLORS["text"],
-            border_color=COLORS["accent"]
-        )
-        self.hours_entry.pack(side="left", padx=10)
-        self.hours_entry.insert(0, "24")
-        
-        # Кнопка запуска
-        self.launch_button = ctk.CTkButton(
-            self.root,
-            text="Запустить",
-            command=self.launch_app,
-            font=("Helvetica", 16, "bold"),
-            height=50,
-            fg_color=COLORS["accent"],
-            hover_color=COLORS["hover"],
-            text_color=COLORS["text"],
-            corner_radius=10
-        )
-        self.launch_button.pack(fill="x", padx=20, pady=20)
-        
-        # Текстовое поле для вывода информации
-        self.info_text = ctk.CTkTextbox(
-            self.root,
-            font=("Consolas", 12),
-            fg_color=COLORS["entry_bg"],
-            text_color=COLORS["text"],
-            border_color=COLORS["accent"],
-            wrap="word"
-        )
-        self.info_text.pack(fill="both", expand=True, padx=20, pady=10)
-        self.info_text.insert("1.0", "StarLabs Monad Launcher готов к работе.\n")
-        
-        # Добавляем контекстное меню для копирования
-        self.create_context_menu()
-    
-
-    def create_context_menu(self):
-        """Создание контекстного меню для текстового поля"""
-        if platform.system() == "Windows":
-            self.info_text.bind("<Button-3>", self.show_context_menu)
-        else:
-            self.info_text.bind("<Button-2>", self.show_context_menu)
-        
-        self.context_menu = tk.Menu(self.root, tearoff=0)
-        self.context_menu.add_command(label="Копировать", command=self.copy_text)
-        self.context_menu.add_command(label="Выделить всё", command=self.select_all_text)
-    
-    def show_context_menu(self, event):
-        """Показать контекстное меню"""
-        self.context_menu.post(event.x_root, event.y_root)
-
-    def copy_text(self):
-        """Копировать выделенный текст"""
-        try:
-            selected_text = self.info_text.get("sel.first", "sel.last")
-            self.root.clipboard_clear()
-            self.root.clipboard_append(selected_text)
-        except tk.TclError:
-            # Если ничего не выделено
-            pass
-
-    def select_all_text(self):
-        """Выделить весь текст"""
-        self.info_text.tag_add("sel", "1.0", "end")
-        return "break"
-    
-    def init_default_settings(self):
-        """Инициализация настроек рандомизации с дефолтными значениями"""
-        self.initial_modules = {
-            "faucet": True,
-            "crusty_refuel" : False,       # По умолчанию выключен
-            "memebridge": False,  # По умолчанию выключен
-            "dusted": False      # Добавляем новый модуль, по умолчанию выключен
-        }
-        # Настройки для SWAPS
-        self.swaps_count_min = 1
-        self.swaps_count_max = 3
-        self.swaps_modules = {module: True for module in self.modules.get("SWAPS", []) if module != "collect_all_to_monad"}
-        
-        # Отдельная настройка для collect_all_to_monad
-        if "SWAPS" in self.modules and "collect_all_to_monad" in self.modules["SWAPS"]:
-            self.collect_probability = 50
-        else:
-            self.collect_probability = 0
-        
-        # Настройки для STAKES
-        self.stakes_count_min = 1
-        self.stakes_count_max = 3
-        self.stakes_modules = {module: True for module in self.modules.get("STAKES", [])}
-        
-        # Настройки для MINT
-        self.mint_count_min = 2
-        self.mint_count_max = 4
-        self.mint_modules = {module: True for module in self.modules.get("MINT", [])}
-        
-        self.games_modules = {module: True for module in self.modules.get("GAMES", [])}
-        
-        # Настройки для OTHER
-        self.other_probability = 30
-        self.other_modules = {module: True for module in self.modules.get("OTHER", []) if module != "logs"}
-        
-        # Флаг для генерации рандомных задач для каждого аккаунта
-        self.random_for_each_account = True
-        
-        # Флаги для чекбоксов
-        self.random_modules_enabled = False
-        self.schedule_enabled = False
-        
-        # Значение часов для расписания
-        self.hours_value = "24"
-    
-    def toggle_random_modules(self):
-        """Переключение видимости настроек рандомных модулей"""
-        if self.random_modules_var.get():
-            self.random_settings_button.configure(state="normal")
-        else:
-            self.random_settings_button.configure(state="disabled")
-    
-    def toggle_schedule(self):
-        """Переключение видимости настроек расписания"""
-        if self.schedule_var.get():
-            self.hours_frame.pack(fill="x", padx=10, pady=10)
-        else:
-            self.hours_frame.pack_forget()
-    
-    def open_random_settings(self):
-        """Открытие окна настроек рандомизации"""
-        settings_window = ctk.CTkToplevel(self.root)
-        settings_window.title("Настройки рандомизации")
-        settings_window.geometry("600x700")
-        settings_window.minsize(600, 700)
-        settings_window.configure(fg_color=COLORS["bg"])
-        settings_window.grab_set()  # Делаем окно модальным
-        
-        # Создаем прокручиваемый фрейм
-        scroll_frame = ctk.CTkScrollableFrame(settings_window, fg_color=COLORS["bg"])
-        scroll_frame.pack(fill="both", expand=True, padx=20, pady=20)
-
-        # НОВАЯ СЕКЦИЯ: Начальные модули
-        initial_frame = ctk.CTkFrame(scroll_frame, fg_color=COLORS["frame_bg"])
-        initial_frame.pack(fill="x", padx=10, pady=10)
-        
-        initial_label = ctk.CTkLabel(
-            initial_frame,
-            text="Начальные модули:",
-            font=("Helvetica", 14, "bold"),
-            text_color=COLORS["text"]
-        )
-        initial_label.pack(anchor="w", padx=10, pady=5)
-        
-        # Чекбоксы для начальных модулей
-        self.initial_vars = {}
-        for module in self.modules["INITIAL"]:
-            var = ctk.BooleanVar(value=self.initial_modules.get(module, False))
-            checkbox = ctk.CTkCheckBox(
-                initial_frame,
-                text=module,
-                variable=var,
-                font=("Helvetica", 12),
-                text_color=COLORS["text"],
-                fg_color=COLORS["accent"],
-                hover_color=COLORS["hover"],
-                border_color=COLORS["accent"]
-            )
-            checkbox.pack(anchor="w", padx=30, pady=2)
-            self.initial_vars[module] = var
-
-        # Настройки для SWAPS
-        if "SWAPS" in self.modules:
-            swaps_frame = ctk.CTkFrame(scroll_frame, fg_color=COLORS["frame_bg"])
-            swaps_frame.pack(fill="x", padx=10, pady=10)
-            
-            swaps_label = ctk.CTkLabel(
-                swaps_frame,
-                text="SWAPS (выбрать от-до):",
-                font=("Helvetica", 14, "bold"),
-                text_color=COLORS["text"]
-            )
-            swaps_label.pack(anchor="w", padx=10, pady=5)
-            
-            # Подсчитываем количество доступных модулей SWAPS (без collect_all_to_monad)
-            swaps_count = len([module for module in self.modules["SWAPS"] if module != "collect_all_to_monad"])
-            
-            # Слайдеры для выбора диапазона
-            swaps_range_frame = ctk.CTkFrame(swaps_frame, fg_color=COLORS["frame_bg"])
-            swaps_range_frame.pack(fill="x", padx=10, pady=5)
-            
-            swaps_min_label = ctk.CTkLabel(
-                swaps_range_frame,
-                text="Минимум:",
-                font=("Helvetica", 12),
-                text_color=COLORS["text"]
-            )
-            swaps_min_label.pack(side="left", padx=5)
-            
-            # Используем текущее значение из класса
-            self.swaps_min_var = ctk.IntVar(value=self.swaps_count_min)
-            swaps_min_slider = ctk.CTkSlider(
-                swaps_range_frame,
-                from_=0,
-                to=swaps_count,
-                number_of_steps=swaps_count,
-                variable=self.swaps_min_var,
-                width=100,
-                fg_color=COLORS["entry_bg"],
-                button_color=COLORS["accent"],
-                button_hover_color=COLORS["hover"],
-                progress_color=COLORS["accent"]
-            )
-            swaps_min_slider.pack(side="left", padx=5)
-            
-            swaps_min_value = ctk.CTkLabel(
-                swaps_range_frame,
-                textvariable=self.swaps_min_var,
-                font=("Helvetica", 12),
-                text_color=COLORS["text"],
-                width=20
-            )
-            swaps_min_value.pack(side="left", padx=5)
-            
-            swaps_max_label = ctk.CTkLabel(
-                swaps_range_frame,
-                text="Максимум:",
-                font=("Helvetica", 12),
-                text_color=COLORS["text"]
-            )
-            swaps_max_label.pack(side="left", padx=5)
-            
-            # Используем текущее значение из класса
-            self.swaps_max_var = ctk.IntVar(value=self.swaps_count_max)
-            swaps_max_slider = ctk.CTkSlider(
-                swaps_range_frame,
-                from_=0,
-                to=swaps_count,
-                number_of_steps=swaps_count,
-                variable=self.swaps_max_var,
-                width=100,
-                fg_color=COLORS["entry_bg"],
-                button_color=COLORS["accent"],
-                button_hover_color=COLORS["hover"],
-                progress_color=COLORS["accent"]
-            )
-            swaps_max_slider.pack(side="left", padx=5)
-            
-            swaps_max_value = ctk.CTkLabel(
-                swaps_range_frame,
-                textvariable=self.swaps_max_var,
-                font=("Helvetica", 12),
-                text_color=COLORS["text"],
-                width=20
-            )
-            swaps_max_value.pack(side="left", padx=5)
-            
-            # Чекбоксы для модулей
-            self.swaps_vars = {}
-            for module in self.modules["SWAPS"]:
-                if module != "collect_all_to_monad":  # Этот модуль обрабатывается отдельно
-                    # Используем текущее значение из класса
-                    var = ctk.BooleanVar(value=self.swaps_modules.get(module, True))
-                    checkbox = ctk.CTkCheckBox(
-                        swaps_frame,
-                        text=module,
-                        variable=var,
-                        font=("Helvetica", 12),
-                        text_color=COLORS["text"],
-                        fg_color=COLORS["accent"],
-                        hover_color=COLORS["hover"],
-                        border_color=COLORS["accent"]
-                    )
-                    checkbox.pack(anchor="w", padx=30, pady=2)
-                    self.swaps_vars[module] = var
-        
-        # Настройки для STAKES
-        if "STAKES" in self.modules:
-            stakes_frame = ctk.CTkFrame(scroll_frame, fg_color=COLORS["frame_bg"])
-            stakes_frame.pack(fill="x", padx=10, pady=10)
-            
-            stakes_label = ctk.CTkLabel(
-                stakes_frame,
-                text="STAKES (выбрать от-до):",
-                font=("Helvetica", 14, "bold"),
-                text_color=COLORS["text"]
-            )
-            stakes_label.pack(anchor="w", padx=10, pady=5)
-            
-            # Подсчитываем количество доступных модулей STAKES
-            stakes_count = len(self.modules["STAKES"])
-            
-            # Слайдеры для выбора диапазона
-            stakes_range_frame = ctk.CTkFrame(stakes_frame, fg_color=COLORS["frame_bg"])
-            stakes_range_frame.pack(fill="x", padx=10, pady=5)
-            
-            stakes_min_label = ctk.CTkLabel(
-                stakes_range_frame,
-                text="Минимум:",
-                font=("Helvetica", 12),
-                text_color=COLORS["text"]
-            )
-            stakes_min_label.pack(side="left", padx=5)
-            
-            # Используем текущее значение из класса
-            self.stakes_min_var = ctk.IntVar(value=self.stakes_count_min)
-            stakes_min_slider = ctk.CTkSlider(
-                stakes_range_frame,
-                from_=0,
-                to=stakes_count,
-                number_of_steps=stakes_count,
-                variable=self.stakes_min_var,
-                width=100,
-                fg_color=COLORS["entry_bg"],
-                button_color=COLORS["accent"],
-                button_hover_color=COLORS["hover"],
-                progress_color=COLORS["accent"]
-            )
-            stakes_min_slider.pack(side="left", padx=5)
-            
-            stakes_min_value = ctk.CTkLabel(
-                stakes_range_frame,
-                textvariable=self.stakes_min_var,
-                font=("Helvetica", 12),
-                text_color=COLORS["text"],
-                width=20
-            )
-            stakes_min_value.pack(side="left", padx=5)
-            
-            stakes_max_label = ctk.CTkLabel(
-                stakes_range_frame,
-                text="Максимум:",
-                font=("Helvetica", 12),
-                text_color=COLORS["text"]
-            )
-            stakes_max_label.pack(side="left", padx=5)
-            
-            # Используем текущее значение из класса
-            self.stakes_max_var = ctk.IntVar(value=self.stakes_count_max)
-            stakes_max_slider = ctk.CTkSlider(
-                stakes_range_frame,
-                from_=0,
-                to=stakes_count,
-                number_of_steps=stakes_count,
-                variable=self.stakes_max_var,
-                width=100,
-                fg_color=COLORS["entry_bg"],
-                button_color=COLORS["accent"],
-                button_hover_color=COLORS["hover"],
-                progress_color=COLORS["accent"]
-            )
-            stakes_max_slider.pack(side="left", padx=5)
-            
-            stakes_max_value = ctk.CTkLabel(
-                stakes_range_frame,
-                textvariable=self.stakes_max_var,
-                font=("Helvetica", 12),
-                text_color=COLORS["text"],
-                width=20
-            )
-            stakes_max_value.pack(side="left", padx=5)
-            
-            # Чекбоксы для модулей
-            self.stakes_vars = {}
-            for module in self.modules["STAKES"]:
-                # Используем текущее значение из класса
-                var = ctk.BooleanVar(value=self.stakes_modules.get(module, True))
-                checkbox = ctk.CTkCheckBox(
-                    stakes_frame,
-                    text=module,
-                    variable=var,
-                    font=("Helvetica", 12),
-                    text_color=COLORS["text"],
-                    fg_color=COLORS["accent"],
-                    hover_color=COLORS["hover"],
-                    border_color=COLORS["accent"]
-                )
-                checkbox.pack(anchor="w", padx=30, pady=2)
-                self.stakes_vars[module] = var
-        
-        # Настройки для MINT
-        if "MINT" in self.modules:
-            mint_frame = ctk.CTkFrame(scroll_frame, fg_color=COLORS["frame_bg"])
-            mint_frame.pack(fill="x", padx=10, pady=10)
-            
-            mint_label = ctk.CTkLabel(
-                mint_frame,
-                text="MINT (выбрать от-до):",
-                font=("Helvetica", 14, "bold"),
-                text_color=COLORS["text"]
-            )
-            mint_label.pack(anchor="w", padx=10, pady=5)
-            
-            # Подсчитываем количество доступных модулей MINT
-            mint_count = len(self.modules["MINT"])
-            
-            # Слайдеры для выбора диапазона
-            mint_range_frame = ctk.CTkFrame(mint_frame, fg_color=COLORS["frame_bg"])
-            mint_range_frame.pack(fill="x", padx=10, pady=5)
-            
-            mint_min_label = ctk.CTkLabel(
-                mint_range_frame,
-                text="Минимум:",
-                font=("Helvetica", 12),
-                text_color=COLORS["text"]
-            )
-            mint_min_label.pack(side="left", padx=5)
-            
-            # Используем текущее значение из класса
-            self.mint_min_var = ctk.IntVar(value=self.mint_count_min)
-            mint_min_slider = ctk.CTkSlider(
-                mint_range_frame,
-                from_=0,
-                to=mint_count,
-                number_of_steps=mint_count,
-                variable=self.mint_min_var,
-                width=100,
-                fg_color=COLORS["entry_bg"],
-                button_color=COLORS["accent"],
-                button_hover_color=COLORS["hover"],
-                progress_color=COLORS["accent"]
-            )
-            mint_min_slider.pack(side="left", padx=5)
-            
-            mint_min_value = ctk.CTkLabel(
-                mint_range_frame,
-                textvariable=self.mint_min_var,
-                font=("Helvetica", 12),
-                text_color=COLORS["text"],
-                width=20
-            )
-            mint_min_value.pack(side="left", padx=5)
-            
-            mint_max_label = ctk.CTkLabel(
-                mint_range_frame,
-                text="Максимум:",
-                font=("Helvetica", 12),
-                text_color=COLORS["text"]
-            )
-            mint_max_label.pack(side="left", padx=5)
-            
-            # Используем текущее значение из класса
-            self.mint_max_var = ctk.IntVar(value=self.mint_count_max)
-            mint_max_slider = ctk.CTkSlider(
-                mint_range_frame,
-                from_=0,
-                to=mint_count,
-                number_of_steps=mint_count,
-                variable=self.mint_max_var,
-                width=100,
-                fg_color=COLORS["entry_bg"],
-                button_color=COLORS["accent"],
-                button_hover_color=COLORS["hover"],
-                progress_color=COLORS["accent"]
-            )
-            mint_max_slider.pack(side="left", padx=5)
-            
-            mint_max_value = ctk.CTkLabel(
-                mint_range_frame,
-                textvariable=self.mint_max_var,
-                font=("Helvetica", 12),
-                text_color=COLORS["text"],
-                width=20
-            )
-            mint_max_value.pack(side="left", padx=5)
-            
-            # Чекбоксы для модулей
-            self.mint_vars = {}
-            for module in self.modules["MINT"]:
-                # Используем текущее значение из класса
-                var = ctk.BooleanVar(value=self.mint_modules.get(module, True))
-                checkbox = ctk.CTkCheckBox(
-                    mint_frame,
-                    text=module,
-                    variable=var,
-                    font=("Helvetica", 12),
-                    text_color=COLORS["text"],
-                    fg_color=COLORS["accent"],
-                    hover_color=COLORS["hover"],
-                    border_color=COLORS["accent"]
-                )
-                checkbox.pack(anchor="w", padx=30, pady=2)
-                self.mint_vars[module] = var
-                
-        if "GAMES" in self.modules:
-            games_frame = ctk.CTkFrame(scroll_frame, fg_color=COLORS["frame_bg"])
-            games_frame.pack(fill="x", padx=10, pady=10)
-            
-            games_label = ctk.CTkLabel(
-                games_frame,
-                text="Игровые модули:",
-                font=("Helvetica", 14, "bold"),
-                text_color=COLORS["text"]
-            )
-            games_label.pack(anchor="w", padx=10, pady=5)
-            
-            # Чекбоксы для модулей
-            self.games_vars = {}
-            for module in self.modules["GAMES"]:
-                var = ctk.BooleanVar(value=self.games_modules.get(module, True))
-                checkbox = ctk.CTkCheckBox(
-                    games_frame,
-                    text=module,
-                    variable=var,
-                    font=("Helvetica", 12),
-                    text_color=COLORS["text"],
-                    fg_color=COLORS["accent"],
-                    hover_color=COLORS["hover"],
-                    border_color=COLORS["accent"]
-                )
-                checkbox.pack(anchor="w", padx=30, pady=2)
-                self.games_vars[module] = var
-        
-        # Настройка для OTHER с вероятностью
-        if "OTHER" in self.modules:
-            other_frame = ctk.CTkFrame(scroll_frame, fg_color=COLORS["frame_bg"])
-            other_frame.pack(fill="x", padx=10, pady=10)
-            
-            other_label = ctk.CTkLabel(
-                other_frame,
-                text="Другие модули:",
-                font=("Helvetica", 14, "bold"),
-                text_color=COLORS["text"]
-            )
-            other_label.pack(anchor="w", padx=10, pady=5)
-            
-            # Слайдер для вероятности
-            other_prob_frame = ctk.CTkFrame(other_frame, fg_color=COLORS["frame_bg"])
-            other_prob_frame.pack(fill="x", padx=10, pady=5)
-            
-            other_prob_label = ctk.CTkLabel(
-                other_prob_frame,
-                text="Вероятность (%):",
-                font=("Helvetica", 12),
-                text_color=COLORS["text"]
-            )
-            other_prob_label.pack(side="left", padx=5)
-            
-            # Используем текущее значение из класса
-            self.other_prob_var = ctk.IntVar(value=self.other_probability)
-            other_prob_slider = ctk.CTkSlider(
-                other_prob_frame,
-                from_=0,
-                to=100,
-                number_of_steps=10,
-                variable=self.other_prob_var,
-                width=200,
-                fg_color=COLORS["entry_bg"],
-                button_color=COLORS["accent"],
-                button_hover_color=COLORS["hover"],
-                progress_color=COLORS["accent"]
-            )
-            other_prob_slider.pack(side="left", padx=5)
-            
-            other_prob_value = ctk.CTkLabel(
-                other_prob_frame,
-                textvariable=self.other_prob_var,
-                font=("Helvetica", 12),
-                text_color=COLORS["text"],
-                width=30
-            )
-            other_prob_value.pack(side="left", padx=5)
-            
-            # Чекбоксы для модулей
-            self.other_vars = {}
-            for module in self.modules["OTHER"]:
-                if module != "logs":  # logs всегда будет в конце
-                    # Используем текущее значение из класса
-                    var = ctk.BooleanVar(value=self.other_modules.get(module, True))
-                    checkbox = ctk.CTkCheckBox(
-                        other_frame,
-                        text=module,
-                        variable=var,
-                        font=("Helvetica", 12),
-                        text_color=COLORS["text"],
-                        fg_color=COLORS["accent"],
-                        hover_color=COLORS["hover"],
-                        border_color=COLORS["accent"]
-                    )
-                    checkbox.pack(anchor="w", padx=30, pady=2)
-                    self.other_vars[module] = var
-                    
-        # Настройка для collect_all_to_monad с вероятностью
-        if "SWAPS" in self.modules and "collect_all_to_monad" in self.modules["SWAPS"]:
-            collect_frame = ctk.CTkFrame(scroll_frame, fg_color=COLORS["frame_bg"])
-            collect_frame.pack(fill="x", padx=10, pady=10)
-            
-            collect_label = ctk.CTkLabel(
-                collect_frame,
-                text="Использовать collect_all_to_monad:",
-                font=("Helvetica", 14, "bold"),
-                text_color=COLORS["text"]
-            )
-            collect_label.pack(anchor="w", padx=10, pady=5)
-            
-            # Слайдер для вероятности
-            collect_prob_frame = ctk.CTkFrame(collect_frame, fg_color=COLORS["frame_bg"])
-            collect_prob_frame.pack(fill="x", padx=10, pady=5)
-            
-            collect_prob_label = ctk.CTkLabel(
-                collect_prob_frame,
-                text="Вероятность (%):",
-                font=("Helvetica", 12),
-                text_color=COLORS["text"]
-            )
-            collect_prob_label.pack(side="left", padx=5)
-            
-            # Используем текущее значение из класса
-            self.collect_prob_var = ctk.IntVar(value=self.collect_probability)
-            collect_prob_slider = ctk.CTkSlider(
-                collect_prob_frame,
-                from_=0,
-                to=100,
-                number_of_steps=10,
-                variable=self.collect_prob_var,
-                width=200,
-                fg_color=COLORS["entry_bg"],
-                button_color=COLORS["accent"],
-                button_hover_color=COLORS["hover"],
-                progress_color=COLORS["accent"]
-            )
-            collect_prob_slider.pack(side="left", padx=5)
-            
-            collect_prob_value = ctk.CTkLabel(
-                collect_prob_frame,
-                textvariable=self.collect_prob_var,
-                font=("Helvetica", 12),
-                text_color=COLORS["text"],
-                width=30
-            )
-            collect_prob_value.pack(side="left", padx=5)
-        
-        # Настройка для генерации рандомных задач для каждого аккаунта
-        account_frame = ctk.CTkFrame(scroll_frame, fg_color=COLORS["frame_bg"])
-        account_frame.pack(fill="x", padx=10, pady=10)
-        
-        # Используем текущее значение из класса
-        self.random_account_var = ctk.BooleanVar(value=self.random_for_each_account)
-        random_account_check = ctk.CTkCheckBox(
-            account_frame,
-            text="Генерировать рандомные задачи для каждого аккаунта",
-            variable=self.random_account_var,
-            font=("Helvetica", 12, "bold"),
-            text_color=COLORS["text"],
-            fg_color=COLORS["accent"],
-            hover_color=COLORS["hover"],
-            border_color=COLORS["accent"]
-        )
-        random_account_check.pack(anchor="w", padx=10, pady=10)
-        
-        # Кнопка сохранения настроек
-        save_button = ctk.CTkButton(
-            settings_window,
-            text="Сохранить настройки",
-            command=lambda: self.save_random_settings(settings_window),
-            font=("Helvetica", 14, "bold"),
-            height=40,
-            fg_color=COLORS["accent"],
-            hover_color=COLORS["hover"],
-            text_color=COLORS["text"],
-            corner_radius=10
-        )
-        save_button.pack(fill="x", padx=20, pady=20)
-    
-    def save_random_settings(self, window):
-        """Сохранение настроек рандомизации"""
-        # Сохраняем настройки начальных модулей
-        if hasattr(self, "initial_vars"):
-            self.initial_modules = {module: var.get() for module, var in self.initial_vars.items()}
-        # Сохраняем настройки SWAPS
-        if hasattr(self, "swaps_min_var") and hasattr(self, "swaps_max_var"):
-            self.swaps_count_min = self.swaps_min_var.get()
-            self.swaps_count_max = self.swaps_max_var.get()
-            
-            # Проверяем, что минимум не больше максимума
-            if self.swaps_count_min > self.swaps_count_max:
-                self.swaps_count_min = self.swaps_count_max
-        
-        if hasattr(self, "swaps_vars"):
-            self.swaps_modules = {module: var.get() for module, var in self.swaps_vars.items()}
-        
-        # Сохраняем настройки STAKES
-        if hasattr(self, "stakes_min_var") and hasattr(self, "stakes_max_var"):
-            self.stakes_count_min = self.stakes_min_var.get()
-            self.stakes_count_max = self.stakes_max_var.get()
-            
-            # Проверяем, что минимум не больше максимума
-            if self.stakes_count_min > self.stakes_count_max:
-                self.stakes_count_min = self.stakes_count_max
-        
-        if hasattr(self, "stakes_vars"):
-            self.stakes_modules = {module: var.get() for module, var in self.stakes_vars.items()}
-        
-        # Сохраняем настройки MINT
-        if hasattr(self, "mint_min_var") and hasattr(self, "mint_max_var"):
-            self.mint_count_min = self.mint_min_var.get()
-            self.mint_count_max = self.mint_max_var.get()
-            
-            # Проверяем, что минимум не больше максимума
-            if self.mint_count_min > self.mint_count_max:
-                self.mint_count_min = self.mint_count_max
-        
-        if hasattr(self, "mint_vars"):
-            self.mint_modules = {module: var.get() for module, var in self.mint_vars.items()}
-        
-        if hasattr(self, "games_vars"):
-            self.games_modules = {module: var.get() for module, var in self.games_vars.items()}
-        
-        # Сохраняем настройки OTHER
-        if hasattr(self, "other_prob_var"):
-            self.other_probability = self.other_prob_var.get()
-        
-        if hasattr(self, "other_vars"):
-            self.other_modules = {module: var.get() for module, var in self.other_vars.items()}
-        
-        # Сохраняем настройки collect_all_to_monad
-        if hasattr(self, "collect_prob_var"):
-            self.collect_probability = self.collect_prob_var.get()
-        
-        # Сохраняем настройку для генерации рандомных задач для каждого аккаунта
-        if hasattr(self, "random_account_var"):
-            self.random_for_each_account = self.random_account_var.get()
-        
-        # Закрываем окно настроек
-        window.destroy()
-        
-        self.update_info("Настройки рандомизации сохранены.")
-    
-    def fix_selector_event_loop(self):
-        """Исправление бага с SelectorEventLoop в main.py"""
-        try:
-            # Путь к файлу main.py
-            main_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
-            
-            # Проверяем существование файла
-            if not os.path.exists(main_path):
-                self.update_info("Ошибка: Файл main.py не найден.")
-                return
-            
-            # Читаем содержимое файла
-            with open(main_path, "r", encoding="utf-8") as file:
-                content = file.read()
-            
-            # Проверяем, закомментирована ли строка с исправлением
-            pattern = r"# if platform\.system\(\) == \"Windows\":"
-            if re.search(pattern, content):
-                # Раскомментируем строки
-                content = content.replace(
-                    "# if platform.system() == \"Windows\":",
-                    "if platform.system() == \"Windows\":"
-                )
-                content = content.replace(
-                    "#     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())",
-                    "    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())"
-                )
-                
-                # Записываем изменения обратно в файл
-                with open(main_path, "w", encoding="utf-8") as file:
-                    file.write(content)
-                
-                self.update_info("Баг с SelectorEventLoop успешно исправлен.")
-            else:
-                # Проверяем, возможно строки уже раскомментированы
-                pattern = r"if platform\.system\(\) == \"Windows\":"
-                if re.search(pattern, content):
-                    self.update_info("Баг с SelectorEventLoop уже исправлен.")
-                else:
-                    self.update_info("Не удалось найти строки для исправления бага.")
-        
-        except Exception as e:
-            self.update_info(f"Ошибка при исправлении бага: {str(e)}")
-    
-    def open_config(self):
-        """Открытие конфигурации через интерфейс"""
-        try:
-            # Импортируем ConfigUI
-            spec = importlib.util.spec_from_file_location(
-                "config_ui", 
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "utils", "config_ui.py")
-            )
-            config_ui_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(config_ui_module)
-            
-            # Создаем и запускаем интерфейс конфигурации
-            self.update_info("Открываю интерфейс конфигурации...")
-            
-            # Сохраняем текущие обработчики after
-            old_after_ids = self.root.tk.call('after', 'info')
-            
-            # Создаем и запускаем интерфейс конфигурации
-            config_ui = config_ui_module.ConfigUI()
-            config_ui.run()
-            
-            # Отменяем все новые обработчики after, которые могли быть созданы
-            new_after_ids = self.root.tk.call('after', 'info')
-            for after_id in new_after_ids:
-                if after_id not in old_after_ids:
-                    try:
-                        self.root.after_cancel(after_id)
-                    except Exception:
-                        pass
-            
-            self.update_info("Конфигурация сохранена.")
-        
-        except Exception as e:
-            self.update_info(f"Ошибка при открытии конфигурации: {str(e)}")
-    
-    def generate_random_tasks(self):
-        """Генерация рандомных задач на основе настроек"""
-        tasks = []
-        other_tasks = []
-        
-        # Добавляем начальные модули, если они включены
-        if "INITIAL" in self.modules:
-            for module in self.modules["INITIAL"]:
-                if self.initial_modules.get(module, False):
-                    tasks.append(module)
-        
-        # Выбираем рандомные модули из SWAPS
-        if "SWAPS" in self.modules:
-            swaps_modules = [module for module, enabled in self.swaps_modules.items() if enabled and module != "collect_all_to_monad"]
-            if swaps_modules:
-                count = random.randint(self.swaps_count_min, self.swaps_count_max)
-                count = min(count, len(swaps_modules))
-                if count > 0:
-                    selected_swaps = random.sample(swaps_modules, count)
-                    # Добавляем каждый модуль отдельно
-                    for module in selected_swaps:
-                        other_tasks.append(module)
-        
-        # Выбираем рандомные модули из STAKES
-        if "STAKES" in self.modules:
-            stakes_modules = [module for module, enabled in self.stakes_modules.items() if enabled]
-            if stakes_modules:
-                count = random.randint(self.stakes_count_min, self.stakes_count_max)
-                count = min(count, len(stakes_modules))
-                if count > 0:
-                    selected_stakes = random.sample(stakes_modules, count)
-                    # Добавляем каждый модуль отдельно
-                    for module in selected_stakes:
-                        other_tasks.append(module)
-        
-        # Выбираем рандомные модули из MINT
-        if "MINT" in self.modules:
-            mint_modules = [module for module, enabled in self.mint_modules.items() if enabled]
-            if mint_modules:
-                count = random.randint(self.mint_count_min, self.mint_count_max)
-                count = min(count, len(mint_modules))
-                if count > 0:
-                    selected_mint = random.sample(mint_modules, count)
-                    # Добавляем каждый модуль отдельно
-                    for module in selected_mint:
-                        other_tasks.append(module)
-                        
-        if "GAMES" in self.modules:
-            games_modules = [module for module, enabled in self.games_modules.items() if enabled]
-            for module in games_modules:
-                other_tasks.append(module)
-        
-        # Добавляем OTHER модули с заданной вероятностью
-        if "OTHER" in self.modules:
-            other_modules = [module for module, enabled in self.other_modules.items() if enabled]
-            if other_modules and random.random() * 100 < self.other_probability:
-                selected_other = random.choice(other_modules)
-                other_tasks.append(selected_other)
-        
-        # Перемешиваем только остальные задачи
-        random.shuffle(other_tasks)
-        
-        # Добавляем остальные задачи после начальных
-        tasks.extend(other_tasks)
-        
-        # Добавляем collect_all_to_monad с заданной вероятностью
-        if "SWAPS" in self.modules and "collect_all_to_monad" in self.modules["SWAPS"] and random.random() * 100 < self.collect_probability:
-            tasks.append("collect_all_to_monad")
-        
-        # Всегда добавляем logs в конец
-        if "OTHER" in self.modules and "logs" in self.modules["OTHER"]:
-            tasks.append("logs")
-        
-        # Выводим сгенерированные задачи в лог
-        self.update_info(f"Сгенерированы задачи:\n{tasks}")
-        
-        return tasks
-    
-    def update_tasks_file(self, tasks):
-        """Обновление файла tasks.py с новыми задачами"""
-        try:
-            # Путь к файлу tasks.py
-            tasks_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tasks.py")
-            
-            # Проверяем существование файла
-            if not os.path.exists(tasks_path):
-                self.update_info("Ошибка: Файл tasks.py не найден.")
-                return False
-            
-            # Читаем текущее содержимое файла
-            with open(tasks_path, "r", encoding="utf-8") as file:
-                content = file.read()
-            
-            # Отладка: выводим первые 500 символов содержимого
-            self.update_info(f"Содержимое tasks.py (первые 500 символов):\n{content[:500]}")
-            
-            # Создаем строку с новыми задачами
-            custom_task_content = "CUSTOM_TASK = [\n"
-            
-            for task in tasks:
-                if isinstance(task, tuple) or isinstance(task, list):
-                    # Если это список задач для рандома, используем квадратные скобки
-                    task_str = "    [" + ", ".join(f'"{t}"' for t in task) + "],\n"
-                else:
-                    # Если это одиночная задача
-                    task_str = f'    "{task}",\n'
-                custom_task_content += task_str
-            
-            custom_task_content += "]"
-            
-            # Заменяем определение CUSTOM_TASK в файле
-            pattern = r"CUSTOM_TASK = \[[\s\S]*?\]"
-            match = re.search(pattern, content)
-            
-            if match:
-                self.update_info(f"Найдено определение CUSTOM_TASK в позиции {match.start()}-{match.end()}")
-                new_content = re.sub(pattern, custom_task_content, content)
-                
-                # Записываем изменения в файл
-                with open(tasks_path, "w", encoding="utf-8") as file:
-                    file.write(new_content)
-                
-                self.update_info("Файл tasks.py успешно обновлен с новыми задачами.")
-                
-                # Выводим содержимое обновленного файла для проверки
-                self.update_info(f"Обновленное содержимое CUSTOM_TASK:\n{custom_task_content}")
-                
-                return True
-            else:
-                self.update_info("Ошибка: В файле tasks.py не найдено определение CUSTOM_TASK.")
-                
-                # Попробуем найти с другим шаблоном
-                alt_pattern = r"CUSTOM_TASK\s*=\s*\["
-                alt_match = re.search(alt_pattern, content)
-                if alt_match:
-                    self.update_info(f"Найдено начало CUSTOM_TASK с альтернативным шаблоном в позиции {alt_match.start()}")
-                
-                return False
-            
-        except Exception as e:
-            self.update_info(f"Ошибка при обновлении файла tasks.py: {str(e)}")
-            import traceback
-            self.update_info(traceback.format_exc())
-            return False
-    
-    def create_random_tasks_script(self):
-        try:
-            # Путь к временному скрипту
-            script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "random_tasks_for_accounts.py")
-            
-            # Получаем только включенные модули для передачи в скрипт
-            enabled_swaps_modules = {}
-            for module in self.modules.get("SWAPS", []):
-                if module != "collect_all_to_monad":
-                    enabled_swaps_modules[module] = self.swaps_modules.get(module, True)
-                    
-            enabled_stakes_modules = {}
-            for module in self.modules.get("STAKES", []):
-                enabled_stakes_modules[module] = self.stakes_modules.get(module, True)
-                    
-            enabled_mint_modules = {}
-            for module in self.modules.get("MINT", []):
-                enabled_mint_modules[module] = self.mint_modules.get(module, True)
-            
-            # Добавляем игровые модули
-            enabled_games_modules = {}
-            for module in self.modules.get("GAMES", []):
-                enabled_games_modules[module] = self.games_modules.get(module, True)
-                    
-            enabled_other_modules = {}
-            for module in self.modules.get("OTHER", []):
-                if module != "logs":
-                    enabled_other_modules[module] = self.other_modules.get(module, True)
-                
-            # Создаем скрипт с использованием raw-строки (r-префикс)
-            script_content = r"""#!/usr/bin/env python3
-import os
-import sys
-import random
-import importlib
-import asyncio
-import platform
-import traceback
-import re
-import time
-import shutil
-
-# Настраиваем логирование
-import logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("random_tasks_log.txt", mode='w'),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger("RandomTasks")
-
-# Исправляем SelectorEventLoop на Windows
-if platform.system() == "Windows":
-    try:
-        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-        logger.info("Установлена политика WindowsSelectorEventLoopPolicy")
-    except Exception as e:
-        logger.error(f"Ошибка при установке политики WindowsSelectorEventLoopPolicy: {e}")
-
-# Путь к директории проекта
-project_dir = os.path.dirname(os.path.abspath(__file__))
-logger.info(f"Директория проекта: {project_dir}")
-
-# Добавляем директорию проекта в sys.path
-sys.path.insert(0, project_dir)
-"""
-
-            # Добавляем настройки модулей и рандомизации
-            script_content += f"""
-# Захардкоженные модули по категориям
-INITIAL_MODULES = {self.initial_modules} 
-SWAPS_MODULES = {enabled_swaps_modules}
-STAKES_MODULES = {enabled_stakes_modules}
-MINT_MODULES = {enabled_mint_modules}
-GAMES_MODULES = {enabled_games_modules}
-OTHER_MODULES = {enabled_other_modules}
-
-# Настройки рандомизации
-SWAPS_MIN = {self.swaps_count_min}
-SWAPS_MAX = {self.swaps_count_max}
-STAKES_MIN = {self.stakes_count_min}
-STAKES_MAX = {self.stakes_count_max}
-MINT_MIN = {self.mint_count_min}
-MINT_MAX = {self.mint_count_max}
-OTHER_PROBABILITY = {self.other_probability}
-COLLECT_PROBABILITY = {self.collect_probability}
-
-logger.info("Настройки рандомизации загружены")
-"""
-
-            # Добавляем остальную часть скрипта как raw-строку
-            script_content += r"""
-# Глобальный счетчик аккаунтов и словарь задач
-account_index = 0
-account_tasks = {}
-
-# Функция для генерации рандомных задач
-# Функция для генерации рандомных задач
-def generate_random_tasks():
-    tasks = []
-    other_tasks = []
-    
-    # Добавляем начальные модули, если они включены
-    for module, enabled in INITIAL_MODULES.items():
-        if enabled:
-            tasks.append(module)
-
-    # Выбираем рандомные модули из SWAPS
-    swaps_modules = [module for module in SWAPS_MODULES.keys() if SWAPS_MODULES[module] and module != "collect_all_to_monad"]
-    if swaps_modules:
-        max_swaps = min(SWAPS_MAX, len(swaps_modules))
-        min_swaps = min(SWAPS_MIN, max_swaps)
-        
-        if max_swaps > 0 and min_swaps > 0:
-            count = random.randint(min_swaps, max_swaps)
-            if count > 0:
-                selected_swaps = random.sample(swaps_modules, count)
-                for module in selected_swaps:
-                    other_tasks.append(module)
-    
-    # Выбираем рандомные модули из STAKES
-    stakes_modules = [module for module in STAKES_MODULES.keys() if STAKES_MODULES[module]]
-    if stakes_modules:
-        max_stakes = min(STAKES_MAX, len(stakes_modules))
-        min_stakes = min(STAKES_MIN, max_stakes)
-        
-        if max_stakes > 0 and min_stakes > 0:
-            count = random.randint(min_stakes, max_stakes)
-            if count > 0:
-                selected_stakes = random.sample(stakes_modules, count)
-                for module in selected_stakes:
-                    other_tasks.append(module)
-    
-    # Выбираем рандомные модули из MINT
-    mint_modules = [module for module in MINT_MODULES.keys() if MINT_MODULES[module]]
-    if mint_modules:
-        max_mint = min(MINT_MAX, len(mint_modules))
-        min_mint = min(MINT_MIN, max_mint)
-        
-        if max_mint > 0 and min_mint > 0:
-            count = random.randint(min_mint, max_mint)
-            if count > 0:
-                selected_mint = random.sample(mint_modules, count)
-                for module in selected_mint:
-                    other_tasks.append(module)
-    
-    # Добавляем GAMES модули, если они включены
-    games_modules = [module for module in GAMES_MODULES.keys() if GAMES_MODULES[module]]
-    for module in games_modules:
-        other_tasks.append(module)
-    
-    # Добавляем OTHER модули с заданной вероятностью
-    other_modules = [module for module in OTHER_MODULES.keys() if OTHER_MODULES[module]]
-    if other_modules and random.random() * 100 < OTHER_PROBABILITY:
-        selected_other = random.choice(other_modules)
-        other_tasks.append(selected_other)
-    
-    # Перемешиваем только остальные задачи
-    random.shuffle(other_tasks)
-    
-    # Добавляем остальные задачи после начальных
-    tasks.extend(other_tasks)
-    
-    # Добавляем collect_all_to_monad с заданной вероятностью
-    if random.random() * 100 < COLLECT_PROBABILITY:
-        tasks.append("collect_all_to_monad")
-    
-    # Всегда добавляем logs в конец
-    tasks.append("logs")
-    
-    return tasks
-
-# Патчим модуль src.model.start для поддержки динамических задач
-# Патчим модуль src.model.start для поддержки динамических задач
-def patch_start_module():
-    try:
-        # Импортируем модуль start
-        from src.model import start
-        
-        # Сохраняем оригинальный метод flow
-        original_flow = start.Start.flow
-        
-        # Создаем патч для метода flow
-        async def patched_flow(self):
-            try:
-                monad = start.MonadXYZ(
-                    self.account_index,
-                    self.proxy,
-                    self.private_key,
-                    self.discord_token,
-                    self.config,
-                    self.session,
-                )
-
-                if "farm_faucet" in self.config.FLOW.TASKS:
-                    await monad.faucet()
-                    return True
-                
-                # Если это первый вызов для этого аккаунта, генерируем задачи
-                if self.account_index not in account_tasks:
-                    tasks = generate_random_tasks()
-                    account_tasks[self.account_index] = tasks
-                    task_str = str(tasks)
-                    formatted_tasks = task_str.replace("'", '"')
-                    print(f"\nСгенерированы задачи для аккаунта {self.account_index}:\n{formatted_tasks}\n")
-                    logger.info(f"Сгенерированы задачи для аккаунта {self.account_index}: {tasks}")
-                else:
-                    tasks = account_tasks[self.account_index]
-                
-                # Используем сгенерированные задачи вместо задач из конфигурации
-                planned_tasks = []
-                task_plan_msg = []
-                task_index = 1
-
-                for task in tasks:
-                    planned_tasks.append((task_index, task, "single"))
-                    task_plan_msg.append(f"{task_index}. {task}")
-                    task_index += 1
-                
-                logger.info(
-                    f"[{self.account_index}] Task execution plan: {' | '.join(task_plan_msg)}"
-                )
-                
-                for i, task, task_type in planned_tasks:
-                    logger.info(f"[{self.account_index}] Executing task {i}: {task}")
-                    await self.execute_task(task, monad)
-                    await self.sleep(task)
-
-                return True
-            except Exception as e:
-                logger.error(f"[{self.account_index}] | Error: {e}")
-                return False
-        
-        # Добавляем атрибут account_index в класс Start
-        start.Start.account_index = 0
-        
-        # Сохраняем оригинальный метод __init__
-        original_init = start.Start.__init__
-        
-        # Создаем патч для метода __init__
-        def patched_init(self, *args, **kwargs):
-            # Вызываем оригинальный метод
-            original_init(self, *args, **kwargs)
-            
-            # Устанавливаем индекс аккаунта
-            self.account_index = start.Start.account_index
-            
-            # Увеличиваем глобальный счетчик
-            start.Start.account_index += 1
-        
-        # Заменяем методы на наши патчи
-        start.Start.__init__ = patched_init
-        start.Start.flow = patched_flow
-        
-        logger.info("Модуль start успешно пропатчен")
-        
-        return True
-    except Exception as e:
-        logger.error(f"Ошибка при патче модуля start: {e}")
-        logger.error(traceback.format_exc())
-        return False
-
-
-# Патчим модуль src.utils.config для поддержки динамических задач
-def patch_config_module():
-    try:
-        # Импортируем модуль config
-        from src.utils import config
-        
-        # Проверяем, есть ли метод get_tasks
-        if not hasattr(config.Config, 'get_tasks'):
-            logger.error("Метод get_tasks не найден в классе Config")
-            # Добавляем метод get_tasks, если его нет
-            def get_tasks(self):
-                return []
-            config.Config.get_tasks = get_tasks
-            logger.info("Добавлен метод get_tasks в класс Config")
-        
-        # Сохраняем оригинальный метод load
-        original_load = config.Config.load
-        
-        # Создаем патч для метода load
-        def patched_load(cls):
-            try:
-                # Пытаемся загрузить конфигурацию обычным способом
-                return original_load.__func__(cls)
-            except Exception as e:
-                logger.info(f"Перехвачена ошибка при загрузке конфигурации: {e}")
-                # Возвращаем конфигурацию с пустыми задачами
-                config_obj = cls()
-                config_obj.preset = "CUSTOM_TASK"
-                return config_obj
-        
-        # Заменяем метод load на наш патч
-        config.Config.load = classmethod(patched_load)
-        
-        # Патчим метод get_tasks, если он существует
-        if hasattr(config.Config, 'get_tasks'):
-            original_get_tasks = config.Config.get_tasks
-            
-            def patched_get_tasks(self):
-                # Возвращаем пустой список задач, который будет заменен в методе flow
-                return []
-            
-            # Заменяем метод get_tasks на наш патч
-            config.Config.get_tasks = patched_get_tasks
-        
-        logger.info("Модуль config успешно пропатчен")
-        
-        return True
-    except Exception as e:
-        logger.error(f"Ошибка при патче модуля config: {e}")
-        logger.error(traceback.format_exc())
-        return False
-
-# Функция для запуска процесса с рандомными задачами для каждого аккаунта
-# Функция для запуска процесса с рандомными задачами для каждого аккаунта
-def run_with_random_tasks():
-    try:
-        logger.info("Запуск с рандомными задачами для каждого аккаунта")
-        
-        # Патчим необходимые модули
-        logger.info("Патчим модуль config...")
-        if not patch_config_module():
-            logger.error("Не удалось пропатчить модуль config")
-            print("Не удалось пропатчить модуль config. Проверьте лог-файл.")
-            return
-        
-        logger.info("Патчим модуль start...")
-        if not patch_start_module():
-            logger.error("Не удалось пропатчить модуль start")
-            print("Не удалось пропатчить модуль start. Проверьте лог-файл.")
-            return
-        
-        # Импортируем main и запускаем
-        logger.info("Импорт main.py")
-        try:
-            import main
-            logger.info("Запуск функции main")
-            asyncio.run(main.main())
-        except ImportError as e:
-            logger.error(f"Ошибка импорта main.py: {e}")
-            print(f"Ошибка импорта main.py: {e}")
-        except Exception as e:
-            logger.error(f"Ошибка при запуске main.py: {e}")
-            logger.error(traceback.format_exc())
-            print(f"Ошибка при запуске main.py: {e}")
-            print(traceback.format_exc())
-        
-    except Exception as e:
-        logger.error(f"Ошибка при запуске: {e}")
-        logger.error(traceback.format_exc())
-        print(f"Ошибка при запуске: {e}")
-        print(traceback.format_exc())
-
-if __name__ == "__main__":
-    try:
-        # Запускаем с рандомными задачами
-        run_with_random_tasks()
-    except Exception as e:
-        logger.critical(f"Критическая ошибка: {e}")
-        logger.critical(traceback.format_exc())
-        print(f"Критическая ошибка: {e}")
-        print(traceback.format_exc())
-    finally:
-        # Добавляем паузу, чтобы консоль не закрывалась
-        print("\nНажмите Enter для выхода...")
-        input()
-"""
-        
-            # Записываем скрипт в файл
-            with open(script_path, "w", encoding="utf-8") as file:
-                file.write(script_content)
-                    
-            return script_path
-        
-        except Exception as e:
-            self.update_info(f"Ошибка при создании скрипта для рандомных задач: {str(e)}")
-            import traceback
-            error_trace = traceback.format_exc()
-            self.update_info(f"Подробная информация об ошибке:\n{error_trace}")
-            return None
-        
-        
-    def reload_tasks_module(self):
-        """Перезагрузка модуля tasks.py"""
-        try:
-            import importlib
-            import sys
-            
-            # Удаляем модуль tasks из кэша, если он там есть
-            if 'tasks' in sys.modules:
-                del sys.modules['tasks']
-            
-            # Импортируем модуль заново
-            import tasks
-            
-            self.update_info("Модуль tasks.py успешно перезагружен")
-            return True
-        except Exception as e:
-            self.update_info(f"Ошибка при перезагрузке модуля tasks.py: {str(e)}")
-            return False
-        
-    
-    def create_temp_tasks_file(self, tasks):
-        """Создание временного файла с задачами"""
-        
-        try:
-            # Путь к временному файлу
-            temp_tasks_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp_tasks.py")
-            
-            # Создаем содержимое файла
-            content = "# Временный файл с задачами\n\n"
-            content += "TASKS = [\n    \"CUSTOM_TASK\"\n]\n\n"
-            
-            # Добавляем CUSTOM_TASK
-            content += "CUSTOM_TASK = [\n"
-            for task in tasks:
-                if isinstance(task, tuple):
-                    # Если это кортеж задач
-                    task_str = "    (" + ", ".join(f'"{t}"' for t in task) + "),\n"
-                elif isinstance(task, list):
-                    # Если это список задач
-                    task_str = "    [" + ", ".join(f'"{t}"' for t in task) + "],\n"
-                else:
-                    # Если это одиночная задача
-                    task_str = f'    "{task}",\n'
-                content += task_str
-            content += "]\n\n"
-            
-            # Добавляем функцию get_tasks
-            content += "def get_tasks():\n    return CUSTOM_TASK\n"
-            
-            # Записываем в файл
-            with open(temp_tasks_path, "w", encoding="utf-8") as file:
-                file.write(content)
-            
-            self.update_info(f"Создан временный файл с задачами: {temp_tasks_path}")
-            return temp_tasks_path
-        except Exception as e:
-            self.update_info(f"Ошибка при создании временного файла с задачами: {str(e)}")
-            return None
-        
-    def generate_schedule(self, hours_str):
-        """Генерация расписания запуска аккаунтов на указанное количество часов"""
-        try:
-            # Преобразуем строку с часами в число
-            hours = int(hours_str)
-            if hours <= 0:
-                self.update_info("Ошибка: Количество часов должно быть положительным числом.")
-                return False
-            
-            # Загружаем конфигурацию для определения количества аккаунтов
-            config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.yaml")
-            if not os.path.exists(config_path):
-                self.update_info("Ошибка: Файл конфигурации не найден.")
-                return False
-            
-            with open(config_path, "r", encoding="utf-8") as file:
-                config_data = yaml.safe_load(file)
-            
-            # Получаем диапазон аккаунтов
-            accounts_range = config_data["SETTINGS"]["ACCOUNTS_RANGE"]
-            exact_accounts = config_data["SETTINGS"]["EXACT_ACCOUNTS_TO_USE"]
-            
-            # Определяем количество аккаунтов
-            if accounts_range[0] == 0 and accounts_range[1] == 0:
-                if exact_accounts:
-                    # Используем конкретные аккаунты
-                    num_accounts = len(exact_accounts)
-                else:
-                    # Используем все аккаунты
-                    private_keys_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "private_keys.txt")
-                    if not os.path.exists(private_keys_path):
-                        self.update_info("Ошибка: Файл с приватными ключами не найден.")
-                        return False
-                    
-                    with open(private_keys_path, "r", encoding="utf-8") as file:
-                        private_keys = [line.strip() for line in file if line.strip()]
-                    
-                    num_accounts = len(private_keys)
-            else:
-                # Используем указанный диапазон
-                start_idx = accounts_range[0]
-                end_idx = accounts_range[1]
-                num_accounts = end_idx - start_idx + 1
-            
-            if num_accounts <= 0:
-                self.update_info("Ошибка: Не найдено аккаунтов для запуска.")
-                return False
-            
-            # Преобразуем часы в минуты
-            total_minutes = hours * 60
-            
-            # Определяем минимальный интервал между запусками
-            # Если аккаунтов много, а времени мало, увеличиваем минимальный интервал
-            min_interval = max(5, total_minutes // (num_accounts * 2))
-            
-            # Создаем список задержек для запуска аккаунтов (в секундах)
-            # Первый аккаунт запускается сразу (задержка 0)
-            delays = [0]  # Первый аккаунт без задержки
-            
-            # Распределяем оставшиеся аккаунты по времени
-            remaining_accounts = num_accounts - 1
-            if remaining_accounts > 0:
-                # Распределяем оставшееся время между аккаунтами
-                remaining_time = total_minutes * 60  # в секундах
-                
-                # Генерируем случайные задержки для оставшихся аккаунтов
-                for i in range(remaining_accounts):
-                    # Если это последний аккаунт, используем оставшееся время
-                    if i == remaining_accounts - 1:
-                        delay = remaining_time
-                    else:
-                        # Иначе выбираем случайную задержку в пределах оставшегося времени
-                        max_delay = remaining_time // (remaining_accounts - i)
-                        min_delay = min(min_interval * 60, max_delay)  # минимум 5 минут или максимально возможное
-                        delay = random.randint(min_delay, max_delay)
-                    
-                    delays.append(delay)
-                    remaining_time -= delay
-            
-            # Преобразуем задержки в абсолютное время от начала
-            absolute_delays = [0]  # Первый аккаунт без задержки
-            for i in range(1, len(delays)):
-                absolute_delays.append(absolute_delays[i-1] + delays[i])
-            
-            # Создаем расписание запуска
-            now = datetime.now()
-            schedule = []
-            
-            for i, delay in enumerate(absolute_delays):
-                launch_time = now + timedelta(seconds=delay)
-                schedule.append((i+1, launch_time, delay))
-            
-            # Выводим расписание
-            self.update_info("\n=== Расписание запуска аккаунтов ===")
-            self.update_info(f"Всего аккаунтов: {num_accounts}")
-            self.update_info(f"Период запуска: {hours} часов ({total_minutes} минут)")
-            
-            for account_idx, launch_time, delay in schedule:
-                hours_from_now = delay // 3600
-                mins_from_now = (delay % 3600) // 60
-                secs_from_now = delay % 60
-                
-                if delay == 0:
-                    time_str = "сразу"
-                else:
-                    time_str = f"через {hours_from_now}ч {mins_from_now}м {secs_from_now}с"
-                    
-                self.update_info(f"Аккаунт {account_idx}: {launch_time.strftime('%H:%M:%S')} ({time_str})")
-            
-            # Сохраняем расписание для использования в патч-скрипте
-            schedule_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "schedule.json")
-            import json
-            with open(schedule_path, "w", encoding="utf-8") as file:
-                # Сохраняем только задержки в секундах
-                json.dump(absolute_delays, file)
-            
-            self.update_info(f"\nРасписание сохранено в файл: {schedule_path}")
-            
-            # Создаем патч-скрипт для запуска с расписанием
-            self.create_schedule_launcher()
-            
-            return True
-        
-        except Exception as e:
-            self.update_info(f"Ошибка при генерации расписания: {str(e)}")
-            import traceback
-            self.update_info(traceback.format_exc())
-            return False
-        
-    def create_schedule_launcher(self):
-        """Создание скрипта для запуска с расписанием"""
-        try:
-            # Путь к скрипту запуска по расписанию
-            script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "schedule_runner.py")
-            self.update_info(f"Создаю скрипт: {script_path}")
-            
-            # Создаем содержимое скрипта
-            script_content = """#!/usr/bin/env python3
-import os
-import sys
-import json
-import asyncio
-import platform
-import traceback
-import importlib.util
-from datetime import datetime, timedelta
-
-# Путь к директории проекта
-project_dir = os.path.dirname(os.path.abspath(__file__))
-
-# Исправляем SelectorEventLoop на Windows
-if platform.system() == "Windows":
-    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-
-# Загружаем расписание
-schedule_path = os.path.join(project_dir, "schedule.json")
-try:
-    with open(schedule_path, "r", encoding="utf-8") as file:
-        schedule_delays = json.load(file)
-    print(f"Загружено расписание с {len(schedule_delays)} задержками")
-except Exception as e:
-    print(f"Ошибка при загрузке расписания: {e}")
-    print(traceback.format_exc())
-    print("\\nНажмите Enter для выхода...")
-    input()
-    sys.exit(1)
-
-# Определяем, нужно ли использовать рандомные модули
-use_random_modules = {random_modules}
-
-# Словарь для отслеживания запущенных аккаунтов
-launched_accounts = set()
-first_account_launched = False
-
-# Патчим модуль process.py для поддержки расписания
-def patch_process_module():
-    try:
-        # Импортируем модуль process
-        import process
-        
-        # Сохраняем оригинальный метод account_flow
-        original_account_flow = process.account_flow
-        
-        # Создаем патч для метода account_flow
-        # В schedule_runner.py
-        async def patched_account_flow(account_index, proxy, private_key, discord_token, twitter_token, email, config, lock, progress_tracker):
-            global first_account_launched, launched_accounts
-            
-            # Если это первый запускаемый аккаунт (независимо от его индекса)
-            if not first_account_launched:
-                print(f"Запуск первого аккаунта {account_index} без задержки")
-                first_account_launched = True
-                launched_accounts.add(account_index)
-            else:
-                # Для всех последующих аккаунтов применяем задержку из расписания
-                # Определяем порядковый номер запуска (1, 2, 3, ...)
-                launch_order = len(launched_accounts)
-                
-                if launch_order < len(schedule_delays):
-                    # Вычисляем время запуска
-                    if launch_order == 0:
-                        delay = schedule_delays[0]
-                    else:
-                        delay = schedule_delays[launch_order] - schedule_delays[launch_order-1]
-                    
-                    hours = delay // 3600
-                    minutes = (delay % 3600) // 60
-                    seconds = delay % 60
-                    
-                    print(f"Ожидание перед запуском аккаунта {account_index} (#{launch_order+1}): {hours}ч {minutes}м {seconds}с")
-                    await asyncio.sleep(delay)
-                
-                launched_accounts.add(account_index)
-            
-            # Вызываем оригинальный метод со всеми параметрами
-            return await original_account_flow(account_index, proxy, private_key, discord_token, twitter_token, email, config, lock, progress_tracker)
-        
-        # Заменяем методы на наши патчи
-        process.account_flow = patched_account_flow
-        
-        print("Модуль process.py успешно пропатчен для работы с расписанием")
-        return True
-    except Exception as e:
-        print(f"Ошибка при патче модуля process.py: {e}")
-        print(traceback.format_exc())
-        return False
-
-# Главная функция
-async def main():
-    try:
-        print("=== Запуск аккаунтов по расписанию ===")
-        
-        # Патчим необходимые модули
-        if not patch_process_module():
-            print("Ошибка при патче модуля process.py")
-            return
-        
-        # Если нужно использовать рандомные модули
-        if use_random_modules:
-            # Запускаем скрипт с рандомными задачами
-            print("Запуск с рандомными модулями...")
-            
-            # Путь к скрипту с рандомными задачами
-            random_script_path = os.path.join(project_dir, "random_tasks_for_accounts.py")
-            
-            # Проверяем существование скрипта
-            if not os.path.exists(random_script_path):
-                print(f"Ошибка: Скрипт {random_script_path} не найден.")
-                print("Создаем скрипт с рандомными задачами...")
-                
-                # Импортируем лаунчер и создаем скрипт
-                launcher_path = os.path.join(project_dir, "launcher.py")
-                spec = importlib.util.spec_from_file_location("launcher", launcher_path)
-                launcher_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(launcher_module)
-                
-                # Создаем экземпляр лаунчера и вызываем метод создания скрипта
-                launcher = launcher_module.StarLabsLauncher()
-                random_script_path = launcher.create_random_tasks_script()
-                
-                if not random_script_path or not os.path.exists(random_script_path):
-                    print("Ошибка при создании скрипта с рандомными задачами.")
-                    return
-            
-            # Импортируем скрипт с рандомными задачами
-            print("Импортируем скрипт с рандомными задачами...")
-            spec = importlib.util.spec_from_file_location("random_tasks", random_script_path)
-            random_tasks_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(random_tasks_module)
-            
-            # Патчим необходимые модули для рандомных задач
-            print("Патчим модули для рандомных задач...")
-            if hasattr(random_tasks_module, 'patch_config_module'):
-                if not random_tasks_module.patch_config_module():
-                    print("Ошибка при патче модуля config.py")
-                    return
-            
-            if hasattr(random_tasks_module, 'patch_start_module'):
-                if not random_tasks_module.patch_start_module():
-                    print("Ошибка при патче модуля start.py")
-                    return
-        
-        # Импортируем main.py и запускаем
-        print("Импортируем main.py...")
-        spec = importlib.util.spec_from_file_location("main", os.path.join(project_dir, "main.py"))
-        main_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(main_module)
-        
-        # Запускаем main без указания аккаунта, чтобы использовать все аккаунты
-        print("Запускаем main.py...")
-        await main_module.main()
-        
-    except Exception as e:
-        print(f"Ошибка при запуске: {e}")
-        print(traceback.format_exc())
-
-if __name__ == "__main__":
-    try:
-        print("Скрипт запущен")
-        asyncio.run(main())
-    except KeyboardInterrupt:
-        print("\\nПрограмма остановлена пользователем")
-    except Exception as e:
-        print(f"Критическая ошибка: {e}")
-        print(traceback.format_exc())
-    finally:
-        print("\\nНажмите Enter для выхода...")
-        input()
-"""
-
-                
-            # Заменяем переменные в скрипте
-            script_content = script_content.replace("{random_modules}", str(self.random_modules_var.get()))
-            
-            # Записываем скрипт в файл
-            with open(script_path, "w", encoding="utf-8") as file:
-                file.write(script_content)
-            
-            self.update_info(f"Скрипт успешно записан: {script_path}")
-            
-            # Делаем скрипт исполняемым на Unix-системах
-            if platform.system() != "Windows":
-                os.chmod(script_path, 0o755)
-            
-            self.update_info(f"Создан скрипт для запуска с расписанием: {script_path}")
-            
-            # Если выбрана рандомизация модулей, создаем скрипт для рандомных задач
-            if self.random_modules_var.get():
-                random_script_path = self.create_random_tasks_script()
-                if random_script_path:
-                    self.update_info(f"Создан скрипт для рандомных задач: {random_script_path}")
-            
-            return True
-        
-        except Exception as e:
-            self.update_info(f"Ошибка при создании скрипта для запуска с расписанием: {str(e)}")
-            import traceback
-            self.update_info(traceback.format_exc())
-            return False
-    
-    
-    def launch_app(self):
-        """Запуск приложения"""
-        try:
-            # Проверяем содержимое tasks.py перед запуском
-            tasks_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tasks.py")
-            if os.path.exists(tasks_path):
-                with open(tasks_path, "r", encoding="utf-8") as file:
-                    content = file.read()
-                
-                # Ищем CUSTOM_TASK в файле
-                custom_task_pattern = r"CUSTOM_TASK = \[([\s\S]*?)\]"
-                custom_task_match = re.search(custom_task_pattern, content)
-                if custom_task_match:
-                    custom_task_content = custom_task_match.group(0)
-                    self.update_info(f"Текущее содержимое CUSTOM_TASK:\n{custom_task_content}")
-            
-            # Создаем лог-файл для ошибок
-            log_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "launcher_log.txt")
-            
-            # Получаем текущую директорию
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            
-            # Проверяем, нужно ли генерировать расписание
-            if self.schedule_var.get():
-                hours = self.hours_entry.get()
-                if not self.generate_schedule(hours):
-                    return
-                
-                # Запускаем с расписанием
-                self.update_info("Запуск StarLabs Monad с расписанием...")
-                
-                # Создаем прямой запуск Python-скрипта вместо использования bat-файла
-                schedule_runner_path = os.path.join(current_dir, "schedule_runner.py")
-                
-                if not os.path.exists(schedule_runner_path):
-                    self.update_info(f"Ошибка: Файл {schedule_runner_path} не найден.")
-                    return
-                
-                # Запускаем Python напрямую с указанием полного пути к интерпретатору и скрипту
-                if platform.system() == "Windows":
-                    # На Windows используем subprocess.Popen напрямую с Python
-                    cmd = [sys.executable, schedule_runner_path]
-                    process = subprocess.Popen(
-                        cmd,
-                        creationflags=subprocess.CREATE_NEW_CONSOLE
-                    )
-                else:
-                    # На Unix-системах
-                    cmd = [sys.executable, schedule_runner_path]
-                    process = subprocess.Popen(cmd)
-                
-                self.update_info(f"Приложение запущено с расписанием (PID: {process.pid}).")
-                return
-            
-            # Если расписание не используется, продолжаем обычный запуск
-            # Проверяем, нужно ли использовать рандомные модули
-            if self.random_modules_var.get():
-                # Проверяем, нужно ли генерировать рандомные задачи для каждого аккаунта
-                if self.random_for_each_account:
-                    # Создаем скрипт для генерации рандомных задач для каждого аккаунта
-                    script_path = self.create_random_tasks_script()
-                    if not script_path:
-                        return
-                    
-                    # Запускаем скрипт
-                    self.update_info("Запуск StarLabs Monad с рандомными задачами для каждого аккаунта...")
-                    
-                    # На Windows запускаем в отдельном окне консоли
-                    if platform.system() == "Windows":
-                        # Запускаем Python напрямую
-                        cmd = [sys.executable, script_path]
-                        process = subprocess.Popen(
-                            cmd,
-                            creationflags=subprocess.CREATE_NEW_CONSOLE
-                        )
-                    else:
-                        # На Unix-системах
-                        cmd = [sys.executable, script_path]
-                        process = subprocess.Popen(cmd)
-                    
-                    self.update_info(f"Приложение запущено успешно (PID: {process.pid}).")
-                else:
-                    # Генерируем одинаковые рандомные задачи для всех аккаунтов
-                    tasks = self.generate_random_tasks()
-                    if not self.update_tasks_file(tasks):
-                        return
-                    
-                    # Перезагружаем модуль tasks
-                    self.reload_tasks_module()
-                    
-                    # Создаем временный файл с задачами
-                    temp_tasks_path = self.create_temp_tasks_file(tasks)
-                    if not temp_tasks_path:
-                        return
-                    
-                    # Запускаем приложение обычным способом
-                    self.update_info("Запуск StarLabs Monad с рандомными задачами...")
-                    
-                    # На Windows запускаем в отдельном окне консоли
-                    if platform.system() == "Windows":
-                        # Запускаем Python напрямую с импортом временного модуля
-                        cmd = [sys.executable, "-c", 
-                            f"import sys; sys.path.insert(0, '{current_dir}'); "
-                            f"import importlib.util; "
-                            f"spec = importlib.util.spec_from_file_location('tasks', '{temp_tasks_path}'); "
-                            f"tasks = importlib.util.module_from_spec(spec); "
-                            f"spec.loader.exec_module(tasks); "
-                            f"from main import main; import asyncio; asyncio.run(main())"]
-                        process = subprocess.Popen(
-                            cmd,
-                            creationflags=subprocess.CREATE_NEW_CONSOLE
-                        )
-                    else:
-                        # На Unix-системах
-                        cmd = [sys.executable, "-c", 
-                            f"import sys; sys.path.insert(0, '{current_dir}'); "
-                            f"import importlib.util; "
-                            f"spec = importlib.util.spec_from_file_location('tasks', '{temp_tasks_path}'); "
-                            f"tasks = importlib.util.module_from_spec(spec); "
-                            f"spec.loader.exec_module(tasks); "
-                            f"from main import main; import asyncio; asyncio.run(main())"]
-                        process = subprocess.Popen(cmd)
-                    
-                    self.update_info(f"Приложение запущено успешно (PID: {process.pid}).")
-            else:
-                # Запускаем приложение обычным способом
-                self.update_info("Запуск StarLabs Monad...")
-                
-                # Запускаем main.py в отдельном процессе
-                main_path = os.path.join(current_dir, "main.py")
-                
-                # На Windows запускаем в отдельном окне консоли
-                if platform.system() == "Windows":
-                    # Запускаем Python напрямую
-                    cmd = [sys.executable, main_path]
-                    process = subprocess.Popen(
-                        cmd,
-                        creationflags=subprocess.CREATE_NEW_CONSOLE
-                    )
-                else:
-                    # На Unix-системах
-                    cmd = [sys.executable, main_path]
-                    process = subprocess.Popen(cmd)
-                
-                self.update_info(f"Приложение запущено успешно (PID: {process.pid}).")
-
-        except Exception as e:
-            self.update_info(f"Ошибка при запуске приложения: {str(e)}")
-            import traceback
-            error_trace = traceback.format_exc()
-            self.update_info(f"Подробная информация об ошибке:\n{error_trace}")
-            
-            # Сохраняем ошибку в лог-файл
-            log_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "launcher_error.txt")
-            with open(log_path, "w", encoding="utf-8") as log_file:
-                log_file.write(f"Ошибка при запуске приложения: {str(e)}\n\n")
-                log_file.write(error_trace)
-            
-            self.update_info(f"Информация об ошибке сохранена в: {log_path}")
-    
-    def update_info(self, text):
-        """Обновление текстового поля с информацией"""
-        self.info_text.configure(state="normal")
-        self.info_text.insert("end", f"\n{text}")
-        self.info_text.see("end")
-    
-    def run(self):
-        """Запуск лаунчера"""
-        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
-        self.root.mainloop()
-
-if __name__ == "__main__":
-    launcher = StarLabsLauncher()
-    launcher.run()
\ No newline at end of file
+#!/usr/bin/env python3
+"""
+StarLabs-Monad Launcher
+
+"""
+
+import os
+import sys
+import platform
+import random
+import importlib.util
+import argparse
+import subprocess
+import re
+from datetime import datetime, timedelta
+import signal
+import json
+import time
+
+from launcher_plans import TaskSampler, seeded_rng, build_plans, save_plans, load_module_stats, DEFAULT_MODULE_MINUTES
+
+# GUI-библиотеки импортируются только при запуске графического интерфейса
+tk = None
+ctk = None
+
+def handle_exit(signum, frame):
+    """Обработчик сигнала для корректного завершения приложения"""
+    print("\nЗавершение работы лаунчера...")
+    try:
+        if 'root' in globals() and hasattr(globals()['root'], 'quit'):
+            globals()['root'].quit()
+    except Exception:
+        pass
+    sys.exit(0)
+
+# Регистрируем обработчик сигнала
+signal.signal(signal.SIGINT, handle_exit)
+signal.signal(signal.SIGTERM, handle_exit)
+
+# Внешние зависимости: имя модуля -> имя пакета для pip
+GUI_DEPENDENCIES = {"customtkinter": "customtkinter", "yaml": "pyyaml"}
+SCHEDULE_DEPENDENCIES = {"yaml": "pyyaml"}
+
+def check_dependencies(dependencies):
+    """Проверка наличия библиотек без их импорта"""
+    missing = [package for module, package in dependencies.items() if importlib.util.find_spec(module) is None]
+    if missing:
+        print(f"Не найдены необходимые библиотеки: {', '.join(missing)}")
+        print(f"Установите их командой: {sys.executable} -m pip install {' '.join(missing)}")
+    return not missing
+
+def import_gui_modules():
+    """Импорт tkinter и customtkinter (нужны только для графического интерфейса)"""
+    global tk, ctk
+    import tkinter as tk
+    import customtkinter as ctk
+
+# Определяем цветовую схему
+COLORS = {
+    "bg": "#121212",  # Слегка светлее черного фона
+    "frame_bg": "#1e1e1e",  # Слегка светлее фона фрейма
+    "accent": "#B8860B",  # Приглушенный золотой/желтый (DarkGoldenrod)
+    "text": "#ffffff",  # Белый текст
+    "entry_bg": "#1e1e1e",  # Темный фон ввода
+    "hover": "#8B6914",  # Более темный приглушенный желтый для наведения
+}
+
+# Минимальный интервал между запусками аккаунтов по расписанию (в секундах)
+MIN_SCHEDULE_GAP = 300
+
+# Сколько строк хранит окно лаунчера (полный лог пишется в LOG_FILE)
+MAX_LOG_LINES = 2000
+LOG_FILE = "launcher_log.txt"
+# Период переноса накопленных сообщений в окно (в миллисекундах)
+LOG_FLUSH_INTERVAL = 100
+
+def generate_schedule_offsets(num_accounts, total_seconds, min_gap, rng=random):
+    """Смещения запуска (в секундах от начала) для всех аккаунтов за один проход
+
+    Первый аккаунт запускается сразу, остальные — равномерно случайно в окне
+    total_seconds с интервалом не меньше min_gap. Возвращает (смещения, интервал):
+    если интервал не помещается в окно, он уменьшается до максимально возможного.
+    """
+    if num_accounts <= 1:
+        return [0] * num_accounts, min_gap
+    
+    remaining = num_accounts - 1
+    min_gap = min(min_gap, total_seconds // remaining)
+    
+    # Упорядоченная равномерная выборка в окне без минимальных интервалов,
+    # затем i-му аккаунту добавляем i * min_gap — интервалы не меньше min_gap
+    slack = total_seconds - remaining * min_gap
+    rand = rng.random
+    points = sorted([int(rand() * (slack + 1)) for _ in range(remaining)])
+    offsets = [0]
+    offsets.extend([point + i * min_gap for i, point in enumerate(points, start=1)])
+    return offsets, min_gap
+
+def build_schedule(num_accounts, total_seconds, threads, duration, rng=random):
+    """Расписание с учетом количества потоков и ожидаемой длительности аккаунта
+
+    Интервал между запусками не меньше duration / threads: так одновременно
+    работает не больше threads аккаунтов и никто не ждет свободный поток.
+    Если все аккаунты не успевают за окно, запуски идут подряд с этим
+    интервалом (все потоки заняты). Возвращает (смещения, интервал, завершение).
+    """
+    threads = max(1, threads)
+    capacity_gap = -(-duration // threads)
+    # Последний аккаунт должен успеть отработать до конца окна
+    start_window = max(0, total_seconds - duration)
+    preferred_gap = max(MIN_SCHEDULE_GAP, total_seconds // (num_accounts * 2))
+    
+    if (num_accounts - 1) * capacity_gap > start_window:
+        offsets = [i * capacity_gap for i in range(num_accounts)]
+        min_gap = capacity_gap
+    else:
+        offsets, min_gap = generate_schedule_offsets(num_accounts, start_window, max(capacity_gap, preferred_gap), rng)
+    
+    completion = offsets[-1] + duration if offsets else 0
+    return offsets, min_gap, completion
+
+def save_schedule(path, offsets, **meta):
+    """Сохранение расписания в компактном виде (интервалы между запусками)"""
+    # Без времени создания: при том же сиде файл совпадает побайтно
+    schedule = {"version": 2, **meta}
+    schedule["accounts"] = len(offsets)
+    schedule["gaps"] = [b - a for a, b in zip(offsets, offsets[1:])]
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(schedule, file, separators=(",", ":"))
+
+def format_duration(seconds):
+    """Форматирование длительности для вывода"""
+    return f"{seconds // 3600}ч {(seconds % 3600) // 60}м {seconds % 60}с"
+
+def format_delay(delay):
+    """Форматирование задержки запуска для вывода"""
+    if delay == 0:
+        return "сразу"
+    return f"через {format_duration(delay)}"
+
+def new_run_seed():
+    """Случайный сид запуска"""
+    return random.SystemRandom().randrange(2 ** 32)
+
+# Пустая строка (только пробельные символы, которые убирает str.strip()):
+# в начале блока и после перевода строки
+BLANK_LINE = re.compile(rb"[ \t\r\x0b\x0c\x1c-\x1f]*\n")
+NEXT_BLANK_LINE = re.compile(rb"\n[ \t\r\x0b\x0c\x1c-\x1f]*(?=\n)")
+
+def count_nonblank_lines(path, chunk_size=1 << 20):
+    """Количество непустых строк файла
+
+    Файл читается блоками, строки не разбираются и не копируются по одной:
+    считаются переводы строк за вычетом пустых строк.
+    """
+    count = 0
+    tail = b""
+    with open(path, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            # Обрабатываем только целые строки, недописанную переносим в следующий блок
+            end = chunk.rfind(b"\n") + 1
+            if not end:
+                tail += chunk
+                continue
+            block = tail + chunk[:end] if tail else chunk[:end]
+            tail = chunk[end:]
+            count += block.count(b"\n") - len(NEXT_BLANK_LINE.findall(block))
+            if BLANK_LINE.match(block):
+                count -= 1
+    if tail.strip():
+        count += 1
+    return count
+
+def count_accounts(keys_path, cache_path):
+    """Количество ключей в файле; результат кэшируется по размеру и времени изменения файла"""
+    stat = os.stat(keys_path)
+    key = {"path": os.path.abspath(keys_path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    try:
+        with open(cache_path, "r", encoding="utf-8") as file:
+            cache = json.load(file)
+        if all(cache.get(name) == value for name, value in key.items()):
+            return cache["count"]
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    count = count_nonblank_lines(keys_path)
+    try:
+        with open(cache_path, "w", encoding="utf-8") as file:
+            json.dump({**key, "count": count}, file)
+    except OSError:
+        pass
+    return count
+
+def format_task_list(tasks):
+    """Список задач в виде Python-литерала для tasks.py"""
+    lines = ["["]
+    for task in tasks:
+        if isinstance(task, (list, tuple)):
+            # Список задач для рандома — в квадратных скобках
+            lines.append("    [" + ", ".join(json.dumps(t, ensure_ascii=False) for t in task) + "],")
+        else:
+            lines.append(f"    {json.dumps(task, ensure_ascii=False)},")
+    lines.append("]")
+    return "\n".join(lines)
+
+class TasksFile:
+    """Чтение и правка списков задач в tasks.py через синтаксическое дерево
+
+    Меняются только значения присваиваний верхнего уровня (CUSTOM_TASK, TASKS),
+    остальной текст файла не трогается. Разобранный файл кэшируется по
+    mtime и размеру, запись пропускается, если содержимое не изменилось.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.stat_key = None
+        self.content = None
+        self.digest = None
+        # Имя -> (начало значения, конец значения, значение) в байтах файла
+        self.nodes = {}
+
+    def load(self):
+        """Разбор файла (из кэша, если он не менялся). Возвращает False, если файла нет"""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        if (stat.st_mtime_ns, stat.st_size) == self.stat_key:
+            return True
+        
+        with open(self.path, "rb") as file:
+            content = file.read()
+        self.parse(content)
+        self.stat_key = (stat.st_mtime_ns, stat.st_size)
+        return True
+
+    def parse(self, content):
+        import ast
+        import hashlib
+        
+        tree = ast.parse(content)
+        # Смещения строк в байтах: col_offset в ast считается в байтах UTF-8
+        line_starts = [0]
+        for line in content.splitlines(keepends=True):
+            line_starts.append(line_starts[-1] + len(line))
+        
+        nodes = {}
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                value = node.value
+                start = line_starts[value.lineno - 1] + value.col_offset
+                end = line_starts[value.end_lineno - 1] + value.end_col_offset
+                try:
+                    literal = ast.literal_eval(value)
+                except ValueError:
+                    literal = None
+                nodes[node.targets[0].id] = (start, end, literal)
+        
+        self.content = content
+        self.digest = hashlib.sha1(content).hexdigest()
+        self.nodes = nodes
+
+    def get(self, name):
+        """Значение присваивания name или None"""
+        if not self.load() or name not in self.nodes:
+            return None
+        return self.nodes[name][2]
+
+    def update(self, **values):
+        """Замена значений присваиваний; возвращает True, если файл перезаписан"""
+        import hashlib
+        
+        if not self.load():
+            raise FileNotFoundError(self.path)
+        missing = [name for name in values if name not in self.nodes]
+        if missing:
+            raise KeyError(f"В файле tasks.py не найдено определение {', '.join(missing)}")
+        
+        # Заменяем с конца файла, чтобы смещения остальных узлов не сдвигались
+        content = self.content
+        for name in sorted(values, key=lambda name: self.nodes[name][0], reverse=True):
+            start, end, _ = self.nodes[name]
+            content = content[:start] + format_task_list(values[name]).encode("utf-8") + content[end:]
+        
+        if hashlib.sha1(content).hexdigest() == self.digest:
+            return False
+        
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "wb") as file:
+            file.write(content)
+        os.replace(temp_path, self.path)
+        self.parse(content)
+        stat = os.stat(self.path)
+        self.stat_key = (stat.st_mtime_ns, stat.st_size)
+        return True
+
+class RunnerSupervisor:
+    """Надзор за процессами-раннерами (по одному на шард)
+
+    Раннер, завершившийся с ошибкой, перезапускается с экспоненциальной
+    задержкой и получает оставшуюся часть расписания. После MAX_FAILURES
+    сбоев за FAILURE_WINDOW секунд перезапуски прекращаются.
+    """
+
+    MAX_FAILURES = 5
+    FAILURE_WINDOW = 1800
+    BACKOFF_BASE = 5
+    BACKOFF_MAX = 300
+    # Раннер, проработавший дольше, считается стабильным: задержка сбрасывается
+    STABLE_RUNTIME = 600
+
+    def __init__(self, spawn, commands, restart_args=None, log=print, elapsed=None):
+        self.spawn = spawn
+        self.commands = commands
+        # restart_args(elapsed) — аргументы для перезапуска; None — перезапуск небезопасен
+        self.restart_args = restart_args
+        self.log = log
+        # Продолжение прерванного запуска: сколько секунд расписания уже прошло,
+        # первый запуск раннеров тогда тоже получает restart_args(elapsed)
+        self.elapsed = elapsed
+        self.processes = []
+        self.codes = [None] * len(commands)
+        self.threads = []
+
+    def start(self):
+        import threading
+        
+        self.started = time.monotonic() - (self.elapsed or 0)
+        extra = self.restart_args(self.elapsed) if self.elapsed is not None else []
+        self.processes = [self.spawn(command + extra) for command in self.commands]
+        for index in range(len(self.commands)):
+            thread = threading.Thread(target=self.supervise, args=(index,), daemon=True)
+            thread.start()
+            self.threads.append(thread)
+        return self
+
+    def name(self, index):
+        return f"Раннер {index + 1}/{len(self.commands)}" if len(self.commands) > 1 else "Раннер"
+
+    def supervise(self, index):
+        failures = []
+        consecutive = 0
+        while True:
+            process = self.processes[index]
+            launched = time.monotonic()
+            code = process.wait()
+            if code == 0:
+                self.codes[index] = 0
+                return
+            
+            now = time.monotonic()
+            self.log(f"{self.name(index)} (PID {process.pid}) завершился с кодом {code}")
+            if self.restart_args is None:
+                self.codes[index] = code
+                return
+            
+            failures = [moment for moment in failures if now - moment < self.FAILURE_WINDOW] + [now]
+            if len(failures) >= self.MAX_FAILURES:
+                self.log(f"{self.name(index)}: {len(failures)} сбоев за {self.FAILURE_WINDOW // 60} мин, перезапуски остановлены")
+                self.codes[index] = code
+                return
+            
+            consecutive = 1 if now - launched > self.STABLE_RUNTIME else consecutive + 1
+            delay = min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** (consecutive - 1))
+            self.log(f"{self.name(index)} будет перезапущен через {delay} с")
+            time.sleep(delay)
+            
+            elapsed = int(time.monotonic() - self.started)
+            self.processes[index] = self.spawn(self.commands[index] + self.restart_args(elapsed))
+            self.log(f"{self.name(index)} перезапущен (PID {self.processes[index].pid})")
+
+    @property
+    def pid(self):
+        return ", ".join(str(process.pid) for process in self.processes)
+
+    def poll(self):
+        """None, пока работает хотя бы один раннер, иначе общий код выхода"""
+        if any(thread.is_alive() for thread in self.threads):
+            return None
+        return next((code for code in self.codes if code), 0)
+
+    def wait(self):
+        """Ожидание всех раннеров: 0, если все завершились успешно, иначе первый ненулевой код"""
+        for thread in self.threads:
+            thread.join()
+        return next((code for code in self.codes if code), 0)
+
+class OutputPump:
+    """Вывод дочерних процессов: фоновое чтение в ограниченный кольцевой буфер
+
+    Читатели постоянно опустошают каналы, поэтому дочерний процесс не
+    блокируется на переполненном pipe. При переполнении буфера старые строки
+    отбрасываются, а получатель забирает накопленное пачками через drain().
+    Если задан log_file, каждая строка сразу дописывается в него, поэтому
+    в файле остается полный вывод. Сообщения самого лаунчера (message())
+    хранятся отдельно от буфера и не вытесняются выводом процессов.
+    """
+
+    def __init__(self, capacity=5000, log_file=None):
+        import threading
+        import collections
+        
+        self.lines = collections.deque(maxlen=capacity)
+        self.messages = []
+        self.log_file = log_file
+        self.lock = threading.Lock()
+        self.print_lock = threading.Lock()
+        self.dropped = 0
+        self.readers = []
+
+    def push(self, line):
+        with self.lock:
+            if self.log_file is not None:
+                self.log_file.write(line + "\n")
+            if len(self.lines) == self.lines.maxlen:
+                self.dropped += 1
+            self.lines.append(line)
+
+    def message(self, text):
+        """Сообщение лаунчера (можно вызывать из любого потока)"""
+        with self.lock:
+            if self.log_file is not None:
+                self.log_file.write(text + "\n")
+            self.messages.append(text)
+
+    def attach(self, process, prefix=""):
+        """Фоновое чтение stdout процесса (stderr перенаправлен туда же)"""
+        import threading
+        reader = threading.Thread(target=self.read, args=(process.stdout, prefix), daemon=True)
+        reader.start()
+        self.readers.append(reader)
+
+    def read(self, stream, prefix):
+        for raw in iter(stream.readline, b""):
+            self.push(prefix + raw.decode("utf-8", errors="replace").rstrip("\r\n"))
+        stream.close()
+
+    def drain(self):
+        """Все накопленные строки одной пачкой (файл лога при этом сбрасывается на диск)"""
+        with self.lock:
+            lines = list(self.lines)
+            self.lines.clear()
+            lines.extend(self.messages)
+            self.messages = []
+            dropped, self.dropped = self.dropped, 0
+            if self.log_file is not None:
+                self.log_file.flush()
+        if dropped:
+            lines.insert(0, f"... пропущено строк вывода: {dropped}")
+        return lines
+
+    def print_pending(self):
+        """Печать накопленного вывода в консоль одной пачкой"""
+        with self.print_lock:
+            lines = self.drain()
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+
+    def print_forever(self, interval=0.2):
+        """Печать вывода в консоль пачками (в фоновом потоке)"""
+        import threading
+        
+        def loop():
+            while True:
+                self.print_pending()
+                time.sleep(interval)
+        threading.Thread(target=loop, daemon=True).start()
+
+    def join(self, timeout=5):
+        """Ожидание, пока читатели дочитают вывод завершившихся процессов"""
+        for reader in self.readers:
+            reader.join(timeout)
+
+    def close_log(self):
+        """Закрытие файла лога (строки после этого в файл не пишутся)"""
+        with self.lock:
+            if self.log_file is not None:
+                self.log_file.close()
+                self.log_file = None
+
+    def finish(self, timeout=5):
+        """Дочитать вывод завершившихся процессов и напечатать остаток"""
+        self.join(timeout)
+        self.print_pending()
+
+class StarLabsLauncherCore:
+    """Логика лаунчера без графического интерфейса (используется GUI и командой run)"""
+    
+    # Отдельное окно консоли для запущенного софта (только Windows)
+    new_console = False
+
+    def __init__(self, settings_path=None):
+        # Путь к файлу настроек
+        self.settings_path = settings_path or os.path.join(os.path.dirname(os.path.abspath(__file__)), "launcher_settings.json")
+        
+        # Проверка и исправление файла tasks.py
+        self.tasks_file = TasksFile(os.path.join(os.path.dirname(os.path.abspath(__file__)), "tasks.py"))
+        self.check_tasks_file()
+        
+        # Загрузка доступных модулей
+        self.modules = self.load_available_modules()
+        
+        # Инициализация настроек рандомизации с дефолтными значениями
+        self.init_default_settings()
+        
+        # Загрузка сохраненных настроек (перезаписывает дефолтные значения)
+        self.load_settings()
+        
+        # Вывод дочерних процессов (None — процессы пишут прямо в консоль);
+        # streaming — вывод текущего запуска читает лаунчер
+        self.output = None
+        self.streaming = False
+        
+        # Продолжить прерванный запуск по журналу задач (не сохраняется между запусками)
+        self.resume = False
+        self.plans_path = None
+        # Сид запуска (None — новый случайный при каждом запуске)
+        self.seed = None
+        self.run_seed = None
+        
+        # Оценки длительности модулей по прошлым запускам, оценки текущего
+        # запуска (в секундах) и ожидаемая длительность аккаунта по ним
+        # (None — берется из настроек)
+        self.module_stats = {}
+        self.estimates = {}
+        self.expected_duration = None
+    
+    def load_module_stats(self):
+        """Загрузка оценок длительности модулей (module_stats.json, пишет раннер)"""
+        self.module_stats = load_module_stats(os.path.dirname(os.path.abspath(__file__)))
+        return self.module_stats
+    
+    def module_estimates(self):
+        """Ожидаемая длительность модулей (в секундах) по прошлым запускам"""
+        return {module: entry["ewma"] for module, entry in self.module_stats.items()}
+    
+    def resolve_run_seed(self):
+        """Сид запуска и повторяется ли им прежний запуск: (сид, повтор)
+
+        Продолжение (--resume) берет сид прерванного запуска из plans.json,
+        затем — заданный сид (--seed). Сохраненные планы по кошелькам
+        (random_tasks_cache.jsonl) действуют только для своего сида, поэтому
+        в режиме рандомных задач для каждого аккаунта новый сид выбирается,
+        лишь когда истек срок хранения плана (plan_cache_hours): до этого
+        каждый запуск повторяет планы аккаунтов.
+        """
+        per_account = self.random_modules_enabled and self.random_for_each_account
+        plans_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plans.json")
+        if self.resume and per_account and os.path.exists(plans_path):
+            with open(plans_path, "r", encoding="utf-8") as file:
+                seed = json.load(file).get("seed")
+            if seed is not None:
+                return seed, True
+        if self.seed is not None:
+            return self.seed, True
+        horizon = float(self.plan_cache_hours or 0) * 3600
+        if not per_account or horizon <= 0:
+            return new_run_seed(), False
+        
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plan_seed.json")
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            data = {}
+        age = time.time() - data.get("created", 0)
+        if "seed" in data and 0 <= age < horizon:
+            self.update_info(f"Планы аккаунтов хранятся еще {format_duration(int(horizon - age))}: используется их сид {data['seed']}")
+            return data["seed"], True
+        
+        seed = new_run_seed()
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            # Округление вниз: возраст сида сразу после записи не отрицательный
+            json.dump({"seed": seed, "created": int(time.time())}, file)
+        os.replace(temp_path, path)
+        return seed, False
+    
+    def resolve_estimates(self, replay=False):
+        """Оценки длительности модулей для запуска с сидом run_seed
+
+        Оценки меняются после каждого запуска, поэтому повтор запуска (replay)
+        берет оценки, записанные рядом с тем же сидом в schedule.json или
+        plans.json, и повторяет планы и расписание один в один. Иначе —
+        текущие оценки по module_stats.json.
+        """
+        if replay:
+            current_dir = os.path.dirname(os.path.abspath(__file__))
+            # schedule.json небольшой, plans.json растет с количеством аккаунтов
+            for name in ("schedule.json", "plans.json"):
+                try:
+                    with open(os.path.join(current_dir, name), "r", encoding="utf-8") as file:
+                        data = json.load(file)
+                except (OSError, ValueError):
+                    continue
+                if isinstance(data, dict) and data.get("seed") == self.run_seed and "estimates" in data:
+                    self.update_info(f"Оценки длительности модулей взяты из {name} (сид {self.run_seed})")
+                    return data["estimates"]
+        return self.module_estimates()
+    
+    def load_settings(self):
+        """Загрузка настроек из файла"""
+        try:
+            if os.path.exists(self.settings_path):
+                print(f"Загрузка настроек из {self.settings_path}")
+                with open(self.settings_path, "r", encoding="utf-8") as file:
+                    settings = json.load(file)
+                    
+                # Загрузка настроек для начальных модулей
+                if "initial" in settings:
+                    self.initial_modules = settings["initial"].get("modules", self.initial_modules)
+                
+                # Загрузка настроек для SWAPS
+                if "swaps" in settings:
+                    self.swaps_count_min = settings["swaps"].get("min", self.swaps_count_min)
+                    self.swaps_count_max = settings["swaps"].get("max", self.swaps_count_max)
+                    self.swaps_modules = settings["swaps"].get("modules", self.swaps_modules)
+                
+                # Загрузка настроек для STAKES
+                if "stakes" in settings:
+                    self.stakes_count_min = settings["stakes"].get("min", self.stakes_count_min)
+                    self.stakes_count_max = settings["stakes"].get("max", self.stakes_count_max)
+                    self.stakes_modules = settings["stakes"].get("modules", self.stakes_modules)
+                
+                # Загрузка настроек для MINT
+                if "mint" in settings:
+                    self.mint_count_min = settings["mint"].get("min", self.mint_count_min)
+                    self.mint_count_max = settings["mint"].get("max", self.mint_count_max)
+                    self.mint_modules = settings["mint"].get("modules", self.mint_modules)
+                    
+                if "games" in settings:
+                    self.games_modules = settings["games"].get("modules", self.games_modules)
+                
+                # Загрузка настроек для OTHER
+                if "other" in settings:
+                    self.other_probability = settings["other"].get("probability", self.other_probability)
+                    self.other_modules = settings["other"].get("modules", self.other_modules)
+                
+                # Загрузка настроек для collect_all_to_monad
+                if "collect" in settings:
+                    self.collect_probability = settings["collect"].get("probability", self.collect_probability)
+                
+                # Загрузка флага для генерации рандомных задач для каждого аккаунта
+                self.random_for_each_account = settings.get("random_for_each_account", self.random_for_each_account)
+                self.plan_cache_hours = settings.get("plan_cache_hours", self.plan_cache_hours)
+                
+                # Загрузка бюджета аккаунта
+                if "budget" in settings:
+                    budget = settings["budget"]
+                    self.budget_minutes = budget.get("minutes", self.budget_minutes)
+                    self.budget_transactions = budget.get("transactions", self.budget_transactions)
+                    self.default_module_minutes = budget.get("default_minutes", self.default_module_minutes)
+                    self.module_minutes = budget.get("module_minutes", self.module_minutes)
+                    self.module_transactions = budget.get("module_transactions", self.module_transactions)
+                self.module_limits = settings.get("module_limits", self.module_limits)
+                
+                # Загрузка состояния чекбоксов
+                self.random_modules_enabled = settings.get("random_modules_enabled", False)
+                self.schedule_enabled = settings.get("schedule_enabled", False)
+                
+                # Загрузка значения часов для расписания
+                self.hours_value = settings.get("hours_value", "24")
+                self.schedule_details = settings.get("schedule_details", self.schedule_details)
+                self.account_duration_minutes = settings.get("account_duration_minutes", self.account_duration_minutes)
+                self.shards = settings.get("shards", self.shards)
+                self.stream_output = settings.get("stream_output", self.stream_output)
+                self.profile = settings.get("profile", self.profile)
+                self.profile_shard = settings.get("profile_shard", self.profile_shard)
+                self.profile_accounts = settings.get("profile_accounts", self.profile_accounts)
+                self.concurrency = {**self.concurrency, **settings.get("concurrency", {})}
+                
+                print("Настройки успешно загружены")
+                return True
+            else:
+                print(f"Файл настроек {self.settings_path} не найден")
+                return False
+        except Exception as e:
+            print(f"Ошибка при загрузке настроек: {str(e)}")
+            import traceback
+            print(traceback.format_exc())
+            return False
+    
+    def settings_dict(self):
+        """Текущие настройки в виде словаря (формат launcher_settings.json)"""
+        return {
+            "initial": {  # Добавляем секцию для начальных модулей
+                "modules": self.initial_modules
+            },
+            "swaps": {
+                "min": self.swaps_count_min,
+                "max": self.swaps_count_max,
+                "modules": self.swaps_modules
+            },
+            "stakes": {
+                "min": self.stakes_count_min,
+                "max": self.stakes_count_max,
+                "modules": self.stakes_modules
+            },
+            "mint": {
+                "min": self.mint_count_min,
+                "max": self.mint_count_max,
+                "modules": self.mint_modules
+            },
+            "other": {
+                "probability": self.other_probability,
+                "modules": self.other_modules
+            },
+            
+            "games": {
+                "modules": self.games_modules
+            },
+            "collect": {
+                "probability": self.collect_probability
+            },
+            "budget": {
+                "minutes": self.budget_minutes,
+                "transactions": self.budget_transactions,
+                "default_minutes": self.default_module_minutes,
+                "module_minutes": self.module_minutes,
+                "module_transactions": self.module_transactions
+            },
+            "module_limits": self.module_limits,
+            "random_for_each_account": self.random_for_each_account,
+            "plan_cache_hours": self.plan_cache_hours,
+            "random_modules_enabled": self.random_modules_enabled,
+            "schedule_enabled": self.schedule_enabled,
+            "hours_value": self.hours_value,
+            "schedule_details": self.schedule_details,
+            "account_duration_minutes": self.account_duration_minutes,
+            "shards": self.shards,
+            "stream_output": self.stream_output,
+            "profile": self.profile,
+            "profile_shard": self.profile_shard,
+            "profile_accounts": self.profile_accounts,
+            "concurrency": self.concurrency
+        }
+    
+    def save_settings(self):
+        """Сохранение настроек в файл"""
+        try:
+            settings = self.settings_dict()
+            
+            # Атомарная запись: раннер может перечитать файл во время сохранения
+            temp_path = self.settings_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(settings, file, indent=4)
+            os.replace(temp_path, self.settings_path)
+            
+            print("Настройки успешно сохранены")
+        except Exception as e:
+            print(f"Ошибка при сохранении настроек: {str(e)}")
+    
+    def check_tasks_file(self):
+        """Проверка и исправление файла tasks.py"""
+        try:
+            if not self.tasks_file.load():
+                print("Предупреждение: Файл tasks.py не найден.")
+        except SyntaxError as e:
+            # Лишние запятые — след прежних правок файла регулярными выражениями
+            with open(self.tasks_file.path, "r", encoding="utf-8") as file:
+                content = file.read()
+            fixed_content = re.sub(r",\s*,", ",", content)
+            try:
+                compile(fixed_content, self.tasks_file.path, "exec")
+            except SyntaxError:
+                print(f"Ошибка синтаксиса в файле tasks.py: {e}")
+                return
+            
+            with open(self.tasks_file.path, "w", encoding="utf-8") as file:
+                file.write(fixed_content)
+            print("Исправлены синтаксические ошибки в файле tasks.py")
+        except Exception as e:
+            print(f"Ошибка при проверке файла tasks.py: {str(e)}")
+        
+    def load_available_modules(self):
+        """Загрузка доступных модулей"""
+        modules = {
+            "INITIAL": [
+                "faucet",
+                "dusted",
+                "crusty_refuel",     
+                "memebridge",      
+            ],
+            "SWAPS": [
+                "collect_all_to_monad",
+                "swaps",
+                "bean",
+                "ambient",
+                "izumi",
+                "madness_swaps"
+            ],
+            "STAKES": [
+                "apriori",
+                "magma",
+                "shmonad",
+                "kintsu",
+                "nostra",
+                "multiplifi",
+                "flapsh"
+            ],
+            "MINT": [
+                "magiceden",
+                "owlto",
+                "lilchogstars",
+                "monadking",
+                "monadking_unlocked",
+                "easynode_deploy",
+                "onchaingm_deploy",
+                "morkie_monhog",
+                "morkie_monarch",
+                "monaigg",
+                "nerzo_soulbound"
+                "nerzo_monad",
+                "zkcodex"
+            ],
+            "GAMES": [ 
+                "frontrunner"  
+            ],
+            "OTHER": [
+                "logs",
+                "nad_domains",
+                "narwhal_finance",
+                "monsternad_whitelist"
+            ]
+        }
+        return modules
+        
+    def init_default_settings(self):
+        """Инициализация настроек рандомизации с дефолтными значениями"""
+        self.initial_modules = {
+            "faucet": True,
+            "crusty_refuel" : False,       # По умолчанию выключен
+            "memebridge": False,  # По умолчанию выключен
+            "dusted": False      # Добавляем новый модуль, по умолчанию выключен
+        }
+        # Настройки для SWAPS
+        self.swaps_count_min = 1
+        self.swaps_count_max = 3
+        self.swaps_modules = {module: True for module in self.modules.get("SWAPS", []) if module != "collect_all_to_monad"}
+        
+        # Отдельная настройка для collect_all_to_monad
+        if "SWAPS" in self.modules and "collect_all_to_monad" in self.modules["SWAPS"]:
+            self.collect_probability = 50
+        else:
+            self.collect_probability = 0
+        
+        # Настройки для STAKES
+        self.stakes_count_min = 1
+        self.stakes_count_max = 3
+        self.stakes_modules = {module: True for module in self.modules.get("STAKES", [])}
+        
+        # Настройки для MINT
+        self.mint_count_min = 2
+        self.mint_count_max = 4
+        self.mint_modules = {module: True for module in self.modules.get("MINT", [])}
+        
+        self.games_modules = {module: True for module in self.modules.get("GAMES", [])}
+        
+        # Настройки для OTHER
+        self.other_probability = 30
+        self.other_modules = {module: True for module in self.modules.get("OTHER", []) if module != "logs"}
+        
+        # Флаг для генерации рандомных задач для каждого аккаунта
+        self.random_for_each_account = True
+        
+        # Сколько часов план аккаунта переиспользуется между перезапусками (0 — не хранить)
+        self.plan_cache_hours = 24
+        
+        # Бюджет аккаунта (0 — без ограничения) и ожидаемые длительности модулей (в минутах)
+        self.budget_minutes = 0
+        self.budget_transactions = 0
+        self.default_module_minutes = DEFAULT_MODULE_MINUTES
+        self.module_minutes = {}
+        self.module_transactions = {}
+        
+        # Сколько аккаунтов могут одновременно выполнять модуль ({модуль: K})
+        self.module_limits = {}
+        
+        # Флаги для чекбоксов
+        self.random_modules_enabled = False
+        self.schedule_enabled = False
+        
+        # Значение часов для расписания
+        self.hours_value = "24"
+        
+        # Выводить расписание по каждому аккаунту (иначе только сводка)
+        self.schedule_details = False
+        
+        # Ожидаемая длительность работы одного аккаунта (в минутах) для расписания
+        self.account_duration_minutes = 30
+        
+        # Количество процессов-раннеров, между которыми делятся аккаунты
+        self.shards = 1
+        
+        # Вывод софта в окне лаунчера вместо отдельной консоли (ввод в софт недоступен)
+        self.stream_output = False
+        
+        # Профилирование запуска: None, "cprofile" или "sampling"; номер
+        # профилируемого процесса (с 1, None — все) и количество аккаунтов (0 — все)
+        self.profile = None
+        self.profile_shard = None
+        self.profile_accounts = 0
+        
+        # Регулятор параллельности: min/max аккаунтов в работе (max 0 — вдвое больше THREADS),
+        # целевая доля успешных аккаунтов и медианная длительность аккаунта (0 — не учитывается)
+        self.concurrency = {
+            "enabled": False,
+            "min": 1,
+            "max": 0,
+            "target_success": 0.9,
+            "target_latency_minutes": 0,
+            "window": 10
+        }
+    
+    def fix_selector_event_loop(self):
+        """Исправление бага с SelectorEventLoop в main.py"""
+        try:
+            # Путь к файлу main.py
+            main_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+            
+            # Проверяем существование файла
+            if not os.path.exists(main_path):
+                self.update_info("Ошибка: Файл main.py не найден.")
+                return
+            
+            # Читаем содержимое файла
+            with open(main_path, "r", encoding="utf-8") as file:
+                content = file.read()
+            
+            # Проверяем, закомментирована ли строка с исправлением
+            pattern = r"# if platform\.system\(\) == \"Windows\":"
+            if re.search(pattern, content):
+                # Раскомментируем строки
+                content = content.replace(
+                    "# if platform.system() == \"Windows\":",
+                    "if platform.system() == \"Windows\":"
+                )
+                content = content.replace(
+                    "#     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())",
+                    "    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())"
+                )
+                
+                # Записываем изменения обратно в файл
+                with open(main_path, "w", encoding="utf-8") as file:
+                    file.write(content)
+                
+                self.update_info("Баг с SelectorEventLoop успешно исправлен.")
+            else:
+                # Проверяем, возможно строки уже раскомментированы
+                pattern = r"if platform\.system\(\) == \"Windows\":"
+                if re.search(pattern, content):
+                    self.update_info("Баг с SelectorEventLoop уже исправлен.")
+                else:
+                    self.update_info("Не удалось найти строки для исправления бага.")
+        
+        except Exception as e:
+            self.update_info(f"Ошибка при исправлении бага: {str(e)}")
+    
+    def generate_random_tasks(self):
+        """Генерация рандомных задач на основе настроек"""
+        sampler = TaskSampler(self.settings_dict(), self.modules, self.estimates)
+        tasks = sampler.sample(seeded_rng(self.run_seed, "shared"))
+        if self.estimates:
+            self.expected_duration = int(sum(sampler.seconds(task) for task in tasks))
+        
+        # Выводим сгенерированные задачи в лог
+        self.update_info(f"Сгенерированы задачи:\n{tasks}")
+        
+        return tasks
+    
+    def load_config(self):
+        """Загрузка config.yaml бота"""
+        config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.yaml")
+        if not os.path.exists(config_path):
+            self.update_info("Ошибка: Файл конфигурации не найден.")
+            return None
+        
+        import yaml
+        with open(config_path, "r", encoding="utf-8") as file:
+            return yaml.safe_load(file)
+    
+    def resolve_accounts(self, config_data):
+        """Номера аккаунтов (с 1), которые запустит бот по config.yaml"""
+        accounts_range = config_data["SETTINGS"]["ACCOUNTS_RANGE"]
+        exact_accounts = config_data["SETTINGS"]["EXACT_ACCOUNTS_TO_USE"]
+        
+        if accounts_range[0] == 0 and accounts_range[1] == 0:
+            if exact_accounts:
+                # Используем конкретные аккаунты
+                return list(exact_accounts)
+            
+            # Используем все аккаунты
+            private_keys_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "private_keys.txt")
+            if not os.path.exists(private_keys_path):
+                self.update_info("Ошибка: Файл с приватными ключами не найден.")
+                return None
+            
+            # Ключи только считаются, в память лаунчера они не загружаются
+            cache_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "accounts_count.json")
+            return list(range(1, count_accounts(private_keys_path, cache_path) + 1))
+        
+        # Используем указанный диапазон
+        return list(range(accounts_range[0], accounts_range[1] + 1))
+    
+    def generate_schedule(self, hours_str):
+        """Генерация расписания запуска аккаунтов на указанное количество часов"""
+        try:
+            # Преобразуем строку с часами в число
+            hours = int(hours_str)
+            if hours <= 0:
+                self.update_info("Ошибка: Количество часов должно быть положительным числом.")
+                return False
+            
+            # Загружаем конфигурацию для определения количества аккаунтов
+            config_data = self.load_config()
+            if config_data is None:
+                return False
+            
+            accounts = self.resolve_accounts(config_data)
+            if accounts is None:
+                return False
+            num_accounts = len(accounts)
+            
+            if num_accounts <= 0:
+                self.update_info("Ошибка: Не найдено аккаунтов для запуска.")
+                return False
+            
+            # Преобразуем часы в секунды
+            total_seconds = hours * 3600
+            
+            # Количество потоков из config.yaml и ожидаемая длительность одного аккаунта
+            threads = int(config_data["SETTINGS"].get("THREADS", 1) or 1)
+            duration = int(float(self.account_duration_minutes) * 60)
+            if self.expected_duration:
+                duration = self.expected_duration
+                self.update_info(f"Длительность аккаунта по статистике модулей: {format_duration(duration)}")
+            if self.budget_minutes and self.random_modules_enabled and self.random_for_each_account:
+                # Планы укладываются в бюджет аккаунта — он и задает длительность
+                duration = min(duration, int(float(self.budget_minutes) * 60))
+            
+            # Генерируем смещения запуска одним проходом
+            absolute_delays, min_gap, completion = build_schedule(num_accounts, total_seconds, threads, duration, seeded_rng(self.run_seed, "schedule"))
+            
+            # Выводим сводку расписания
+            now = datetime.now()
+            gaps = sorted(b - a for a, b in zip(absolute_delays, absolute_delays[1:]))
+            self.update_info("\n=== Расписание запуска аккаунтов ===")
+            self.update_info(f"Всего аккаунтов: {num_accounts}")
+            self.update_info(f"Период запуска: {hours} часов ({hours * 60} минут)")
+            if gaps:
+                self.update_info(f"Интервалы между запусками: мин {format_duration(gaps[0])}, медиана {format_duration(gaps[len(gaps) // 2])}, макс {format_duration(gaps[-1])}")
+            last_delay = absolute_delays[-1]
+            self.update_info(f"Последний запуск: {(now + timedelta(seconds=last_delay)).strftime('%H:%M:%S')} ({format_delay(last_delay)})")
+            self.update_info(f"Потоков: {threads}, ожидаемая длительность аккаунта: {format_duration(duration)}, минимальный интервал: {format_duration(min_gap)}")
+            self.update_info(f"Достижимое завершение: {(now + timedelta(seconds=completion)).strftime('%d.%m %H:%M:%S')} ({format_delay(completion)})")
+            if completion > total_seconds:
+                self.update_info(f"Внимание: при {threads} потоках аккаунты не успеют за {hours} ч — увеличьте THREADS или количество часов")
+            
+            # Подробный вывод по каждому аккаунту — только по запросу
+            if self.schedule_details:
+                lines = []
+                for account_idx, delay in enumerate(absolute_delays, start=1):
+                    launch_time = now + timedelta(seconds=delay)
+                    lines.append(f"Аккаунт {account_idx}: {launch_time.strftime('%H:%M:%S')} ({format_delay(delay)})")
+                self.update_info("\n".join(lines))
+            
+            # Сохраняем расписание для использования в патч-скрипте
+            schedule_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "schedule.json")
+            save_schedule(schedule_path, absolute_delays, seed=self.run_seed, hours=hours, min_gap=min_gap, threads=threads, duration=duration, completion=completion,
+                          estimates=self.estimates)
+            
+            self.update_info(f"\nРасписание сохранено в файл: {schedule_path}")
+            
+            return True
+        
+        except Exception as e:
+            self.update_info(f"Ошибка при генерации расписания: {str(e)}")
+            import traceback
+            self.update_info(traceback.format_exc())
+            return False
+    
+    def spawn_process(self, cmd):
+        """Запуск дочернего процесса Python"""
+        if not self.streaming:
+            if self.new_console and platform.system() == "Windows":
+                # На Windows запускаем в отдельном окне консоли
+                return subprocess.Popen(cmd, creationflags=subprocess.CREATE_NEW_CONSOLE)
+            return subprocess.Popen(cmd)
+        
+        # Вывод читается лаунчером: без буферизации, в UTF-8, без ввода
+        # (ожидание Enter при выходе сразу получит EOF)
+        env = dict(os.environ, PYTHONUNBUFFERED="1", PYTHONIOENCODING="utf-8")
+        creationflags = subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
+        process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env, creationflags=creationflags)
+        
+        # Строки шардов помечаем номером процесса
+        prefix = f"[{int(cmd[cmd.index('--shard') + 1]) + 1}] " if "--shard" in cmd else ""
+        self.output.attach(process, prefix)
+        return process
+    
+    def prepare_plans(self):
+        """Планы задач для всех аккаунтов одним проходом перед запуском (путь к plans.json или None)"""
+        plans_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plans.json")
+        if self.resume and os.path.exists(plans_path):
+            # Сид и оценки прерванного запуска уже взяты из этого файла
+            self.update_info(f"Продолжение: используются ранее сгенерированные планы из plans.json (сид {self.run_seed})")
+            return plans_path
+        
+        try:
+            config_data = self.load_config()
+            accounts = self.resolve_accounts(config_data) if config_data is not None else None
+        except Exception as e:
+            self.update_info(f"Ошибка при чтении config.yaml: {e}")
+            accounts = None
+        if not accounts:
+            self.update_info("Планы будут генерироваться при запуске каждого аккаунта")
+            return None
+        
+        started = datetime.now()
+        estimates = self.estimates
+        plans, workers = build_plans(accounts, self.settings_dict(), self.modules, self.run_seed, estimates=estimates)
+        save_plans(plans_path, accounts, plans, self.run_seed, estimates)
+        elapsed = (datetime.now() - started).total_seconds()
+        self.update_info(f"Сгенерированы планы для {len(accounts)} аккаунтов за {elapsed:.2f} с (процессов: {workers})")
+        
+        if estimates:
+            # Длительность аккаунта для расписания — 90-й перцентиль оценок планов
+            sampler = TaskSampler(self.settings_dict(), self.modules, estimates)
+            durations = sorted(sum(sampler.seconds(task) for task in plan) for plan in plans)
+            self.expected_duration = int(durations[min(len(durations) - 1, len(durations) * 9 // 10)])
+        return plans_path
+    
+    def write_run_settings(self, accounts=None):
+        """Файл настроек для раннера: текущие настройки (с учетом аргументов
+        командной строки), каталог модулей из tasks.py и список аккаунтов для шардов"""
+        run_settings_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "run_settings.json")
+        settings = self.settings_dict()
+        if self.concurrency["enabled"]:
+            settings["concurrency"] = self.resolve_concurrency()
+        temp_path = run_settings_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump({"settings": settings, "modules": self.modules, "accounts": accounts,
+                       "settings_path": os.path.abspath(self.settings_path), "estimates": self.estimates}, file, ensure_ascii=False)
+        os.replace(temp_path, run_settings_path)
+        return run_settings_path
+    
+    def resolve_concurrency(self):
+        """Настройки регулятора параллельности для раннера: начальный лимит — THREADS из config.yaml"""
+        try:
+            threads = int(self.load_config()["SETTINGS"].get("THREADS", 1) or 1)
+        except Exception as e:
+            self.update_info(f"Не удалось прочитать THREADS из config.yaml: {e}")
+            threads = 1
+        concurrency = dict(self.concurrency)
+        concurrency["max"] = int(concurrency["max"]) or 2 * threads
+        concurrency["min"] = min(max(1, int(concurrency["min"])), concurrency["max"])
+        concurrency["initial"] = min(max(threads, concurrency["min"]), concurrency["max"])
+        self.update_info(f"Регулятор параллельности: от {concurrency['min']} до {concurrency['max']} аккаунтов, начало — {concurrency['initial']}")
+        return concurrency
+    
+    def runner_command(self, run_settings_path, schedule=False, shared_tasks=None):
+        """Команда запуска раннера (launcher_runner.py) с текущими настройками"""
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        args = [sys.executable, os.path.join(current_dir, "launcher_runner.py"), "--settings", run_settings_path, "--seed", str(self.run_seed)]
+        if schedule:
+            args += ["--schedule", os.path.join(current_dir, "schedule.json")]
+        if shared_tasks is not None:
+            args += ["--tasks", json.dumps(shared_tasks)]
+        elif self.random_modules_enabled:
+            args.append("--random")
+        if self.plans_path:
+            args += ["--plans", self.plans_path]
+        # --resume (и --elapsed) при продолжении добавляет надзор за раннерами
+        if self.resume and not (self.random_modules_enabled and self.random_for_each_account):
+            self.update_info("Продолжение по журналу доступно только с рандомными задачами для каждого аккаунта")
+        return args
+    
+    def shard_count(self):
+        """Количество процессов-раннеров из настроек"""
+        try:
+            return max(1, int(self.shards))
+        except (TypeError, ValueError):
+            self.update_info(f"Некорректное количество процессов: {self.shards}, используется 1")
+            return 1
+    
+    def shard_accounts(self):
+        """Аккаунты для разделения между процессами (None — один процесс)"""
+        if self.shard_count() <= 1:
+            return None
+        
+        try:
+            config_data = self.load_config()
+            accounts = self.resolve_accounts(config_data) if config_data is not None else None
+        except Exception as e:
+            self.update_info(f"Ошибка при чтении config.yaml: {e}")
+            accounts = None
+        if not accounts:
+            self.update_info("Не удалось определить аккаунты, запуск в одном процессе")
+            return None
+        return accounts
+    
+    def spawn_runners(self, schedule=False, shared_tasks=None):
+        """Запуск раннера или нескольких раннеров (шардов) под надзором лаунчера"""
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        if not self.resume:
+            # Журналы прошлого запуска (в том числе других шардов) убираем,
+            # чтобы следующее продолжение не смешало их с текущим
+            for name in os.listdir(current_dir):
+                if name.startswith("task_journal") and name.endswith(".jsonl"):
+                    os.replace(os.path.join(current_dir, name), os.path.join(current_dir, name + ".prev"))
+        
+        accounts = self.shard_accounts()
+        run_settings_path = self.write_run_settings(accounts)
+        # Под надзором раннер не ждет Enter при выходе, иначе сбой не будет замечен
+        command = self.runner_command(run_settings_path, schedule, shared_tasks) + ["--no-pause"]
+        
+        # Аккаунты, слоты расписания и планы делятся по кругу: шард k получает k-й, k+N-й, ...
+        commands = [command]
+        if accounts is not None:
+            shards = min(self.shard_count(), len(accounts))
+            commands = [command + ["--shard", str(shard), "--shards", str(shards)] for shard in range(shards)]
+            self.update_info(f"Аккаунты разделены между {shards} процессами")
+        
+        if self.profile:
+            if self.profile not in ("cprofile", "sampling"):
+                self.update_info(f"Неизвестный режим профилирования: {self.profile} (cprofile или sampling)")
+            else:
+                profile_args = ["--profile", self.profile]
+                if self.profile_accounts:
+                    profile_args += ["--profile-accounts", str(self.profile_accounts)]
+                commands = [shard_command + profile_args if self.profile_shard in (None, shard + 1) or len(commands) == 1 else shard_command
+                            for shard, shard_command in enumerate(commands)]
+        
+        # Перезапуск безопасен, если выполненное не повторится: журнал задач
+        # (рандомные задачи для каждого аккаунта) или пропуск прошедших слотов расписания
+        restart_args = None
+        elapsed = None
+        if self.random_modules_enabled and self.random_for_each_account:
+            restart_args = lambda elapsed: ["--resume", "--elapsed", str(elapsed)] if schedule else ["--resume"]
+            if self.resume:
+                # Продолжение — тот же перезапуск: выполненное пропускается по журналу,
+                # а расписание идет с того места, где запуск прервался
+                elapsed = self.schedule_elapsed() if schedule else 0
+        elif schedule:
+            restart_args = lambda elapsed: ["--elapsed", str(elapsed)]
+        if schedule and elapsed is None:
+            self.record_schedule_start()
+        
+        log = self.output.message if self.output is not None else print
+        return RunnerSupervisor(self.spawn_process, commands, restart_args, log, elapsed).start()
+    
+    def schedule_start_path(self):
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)), "schedule_start.json")
+    
+    def record_schedule_start(self):
+        """Время начала запуска по расписанию (schedule_start.json) для продолжения через --resume
+
+        Хранится отдельно от schedule.json, чтобы тот при том же сиде совпадал
+        побайтно. Время — по системным часам: прерванный запуск мог
+        завершиться вместе с системой.
+        """
+        path = self.schedule_start_path()
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump({"seed": self.run_seed, "started": round(time.time(), 3)}, file)
+        os.replace(temp_path, path)
+    
+    def schedule_elapsed(self):
+        """Сколько секунд расписания прошло с начала прерванного запуска (0, если неизвестно)"""
+        try:
+            with open(self.schedule_start_path(), "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            data = {}
+        if data.get("seed") != self.run_seed or "started" not in data:
+            self.update_info("Время начала прерванного запуска не найдено: расписание продолжится с начала")
+            self.record_schedule_start()
+            return 0
+        elapsed = max(0, int(time.time() - data["started"]))
+        self.update_info(f"Продолжение расписания: с начала прерванного запуска прошло {format_duration(elapsed)}, "
+                         f"аккаунты с наступившими слотами запускаются сразу")
+        return elapsed
+    
+    def launch_app(self):
+        """Запуск приложения (возвращает запущенный процесс или None)"""
+        try:
+            # Показываем текущие задачи из tasks.py перед запуском
+            try:
+                custom_task = self.tasks_file.get("CUSTOM_TASK")
+                if custom_task is not None:
+                    self.update_info(f"Текущее содержимое CUSTOM_TASK: {custom_task}")
+            except SyntaxError as e:
+                self.update_info(f"Ошибка синтаксиса в файле tasks.py: {e}")
+            
+            # Получаем текущую директорию
+            current_dir = os.path.dirname(os.path.abspath(__file__))
+            
+            # Все случайные решения запуска выводятся из одного сида
+            self.run_seed, replay = self.resolve_run_seed()
+            # Перезапуски раннеров в этом запуске выводят туда же, куда и первый запуск
+            self.streaming = self.stream_output and self.output is not None
+            self.load_module_stats()
+            self.estimates = self.resolve_estimates(replay)
+            self.expected_duration = None
+            self.update_info(f"Сид запуска: {self.run_seed} (повторить запуск: --seed {self.run_seed})")
+            
+            # Рандомные задачи для каждого аккаунта генерируем заранее одним проходом
+            self.plans_path = None
+            if self.random_modules_enabled and self.random_for_each_account:
+                self.plans_path = self.prepare_plans()
+            
+            # Одинаковые рандомные задачи для всех аккаунтов передаются раннеру
+            # аргументом, tasks.py на диске не меняется
+            shared_tasks = None
+            if self.random_modules_enabled and not self.random_for_each_account:
+                shared_tasks = self.generate_random_tasks()
+            
+            # Проверяем, нужно ли генерировать расписание
+            if self.schedule_enabled:
+                hours = self.hours_value
+                if not self.generate_schedule(hours):
+                    return None
+                
+                # Запускаем с расписанием
+                self.update_info("Запуск StarLabs Monad с расписанием...")
+                
+                process = self.spawn_runners(schedule=True, shared_tasks=shared_tasks)
+                
+                self.update_info(f"Приложение запущено с расписанием (PID: {process.pid}).")
+                return process
+            
+            # Если расписание не используется, продолжаем обычный запуск
+            # Проверяем, нужно ли использовать рандомные модули
+            if self.random_modules_enabled:
+                # Проверяем, нужно ли генерировать рандомные задачи для каждого аккаунта
+                if self.random_for_each_account:
+                    self.update_info("Запуск StarLabs Monad с рандомными задачами для каждого аккаунта...")
+                else:
+                    self.update_info("Запуск StarLabs Monad с рандомными задачами...")
+                process = self.spawn_runners(shared_tasks=shared_tasks)
+            else:
+                # Запускаем приложение обычным способом
+                self.update_info("Запуск StarLabs Monad...")
+                
+                if self.shard_count() > 1 or self.profile or self.concurrency["enabled"]:
+                    # Без рандомных задач раннер только делит аккаунты между процессами,
+                    # регулирует параллельность и профилирует запуск
+                    process = self.spawn_runners()
+                else:
+                    # Запускаем main.py в отдельном процессе
+                    main_path = os.path.join(current_dir, "main.py")
+                    process = self.spawn_process([sys.executable, main_path])
+            
+            self.update_info(f"Приложение запущено успешно (PID: {process.pid}).")
+            return process
+
+        except Exception as e:
+            self.update_info(f"Ошибка при запуске приложения: {str(e)}")
+            import traceback
+            error_trace = traceback.format_exc()
+            self.update_info(f"Подробная информация об ошибке:\n{error_trace}")
+            
+            # Сохраняем ошибку в лог-файл
+            log_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "launcher_error.txt")
+            with open(log_path, "w", encoding="utf-8") as log_file:
+                log_file.write(f"Ошибка при запуске приложения: {str(e)}\n\n")
+                log_file.write(error_trace)
+            
+            self.update_info(f"Информация об ошибке сохранена в: {log_path}")
+            return None
+    
+    def update_info(self, text):
+        """Вывод информации (без интерфейса — в консоль)"""
+        print(text)
+    
+
+class StarLabsLauncher(StarLabsLauncherCore):
+    """Графический интерфейс лаунчера"""
+    
+    new_console = True
+
+    def __init__(self, settings_path=None):
+        import_gui_modules()
+        
+        # Настройка темы
+        ctk.set_appearance_mode("dark")
+        ctk.set_default_color_theme("blue")
+        
+        # Создание главного окна
+        self.root = ctk.CTk()
+        self.root.title("StarLabs Monad Launcher")
+        self.root.geometry("800x600")
+        self.root.minsize(800, 600)
+        self.root.configure(fg_color=COLORS["bg"])
+        
+        super().__init__(settings_path)
+        
+        # Сообщения лаунчера (и вывод софта, если он читается лаунчером)
+        # показываются в окне лаунчера пачками, полный лог сразу дописывается в файл
+        log_file = open(os.path.join(os.path.dirname(os.path.abspath(__file__)), LOG_FILE), "w", encoding="utf-8")
+        self.output = OutputPump(log_file=log_file)
+        self.process = None
+        
+        # Создание интерфейса
+        self.create_widgets()
+        
+        # Обновление интерфейса в соответствии с загруженными настройками
+        self.update_ui_from_settings()
+        
+        # Привязка обработчика закрытия окна
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+    
+    def sync_settings_from_ui(self):
+        """Перенос состояния чекбоксов и поля часов в настройки"""
+        self.random_modules_enabled = self.random_modules_var.get()
+        self.schedule_enabled = self.schedule_var.get()
+        self.hours_value = self.hours_entry.get()
+        self.schedule_details = self.schedule_details_var.get()
+        self.resume = self.resume_var.get()
+        self.account_duration_minutes = self.duration_entry.get()
+        self.shards = self.shards_entry.get()
+        self.stream_output = self.stream_output_var.get()
+    
+    def update_ui_from_settings(self):
+        """Обновление интерфейса в соответствии с загруженными настройками"""
+        try:
+            # Установка состояния чекбоксов
+            self.random_modules_var.set(self.random_modules_enabled)
+            self.toggle_random_modules()
+            
+            self.schedule_var.set(self.schedule_enabled)
+            self.toggle_schedule()
+            
+            # Установка значения часов для расписания
+            self.hours_entry.delete(0, "end")
+            self.hours_entry.insert(0, self.hours_value)
+            self.schedule_details_var.set(self.schedule_details)
+            self.duration_entry.delete(0, "end")
+            self.duration_entry.insert(0, str(self.account_duration_minutes))
+            self.shards_entry.delete(0, "end")
+            self.shards_entry.insert(0, str(self.shards))
+            self.stream_output_var.set(self.stream_output)
+            
+            # Выводим информацию о загруженных настройках
+            print(f"Интерфейс обновлен: random_modules={self.random_modules_enabled}, schedule={self.schedule_enabled}")
+            
+        except Exception as e:
+            print(f"Ошибка при обновлении интерфейса: {str(e)}")
+            import traceback
+            print(traceback.format_exc())
+    
+    def on_closing(self):
+        """Обработчик закрытия окна"""
+        self.sync_settings_from_ui()
+        self.save_settings()
+        
+        # Вывод софта читает лаунчер: после его закрытия софт упал бы на записи
+        # в закрытый канал, поэтому окно только скрывается до завершения софта
+        if self.streaming and self.process is not None and self.process.poll() is None:
+            from tkinter import messagebox
+            if not messagebox.askyesno(
+                "StarLabs Monad Launcher",
+                "Софт еще работает, его вывод читает лаунчер.\n\n"
+                f"Скрыть окно? Лаунчер продолжит записывать вывод в {LOG_FILE} и завершится вместе с софтом.",
+                parent=self.root
+            ):
+                return
+            self.root.withdraw()
+            self.close_after_process()
+            return
+        self.close()
+    
+    def close_after_process(self):
+        """Закрытие скрытого лаунчера после завершения софта"""
+        if self.process.poll() is None:
+            self.root.after(1000, self.close_after_process)
+            return
+        self.close()
+    
+    def close(self):
+        """Запись остатка лога и закрытие окна"""
+        self.output.join()
+        self.flush_log()
+        self.output.close_log()
+        self.root.destroy()
+    
+    def create_widgets(self):
+        """Создание виджетов интерфейса"""
+        # Создание фрейма для кнопок
+        button_frame = ctk.CTkFrame(self.root, fg_color=COLORS["frame_bg"])
+        button_frame.pack(fill="x", padx=20, pady=20)
+        
+        # Кнопка исправления бага с SelectorEventLoop
+        self.fix_button = ctk.CTkButton(
+            button_frame,
+            text="Исправить баг с SelectorEventLoop",
+            command=self.fix_selector_event_loop,
+            font=("Helvetica", 14, "bold"),
+            height=40,
+            fg_color=COLORS["accent"],
+            hover_color=COLORS["hover"],
+            text_color=COLORS["text"],
+            corner_radius=10
+        )
+        self.fix_button.pack(fill="x", padx=10, pady=10)
+        
+        # Кнопка открытия конфигурации
+        self.config_button = ctk.CTkButton(
+            button_frame,
+            text="Открыть конфигурацию",
+            command=self.open_config,
+            font=("Helvetica", 14, "bold"),
+            height=40,
+            fg_color=COLORS["accent"],
+            hover_color=COLORS["hover"],
+            text_color=COLORS["text"],
+            corner_radius=10
+        )
+        self.config_button.pack(fill="x", padx=10, pady=10)
+        
+        # Фрейм для настроек запуска
+        launch_frame = ctk.CTkFrame(self.root, fg_color=COLORS["frame_bg"])
+        launch_frame.pack(fill="x", padx=20, pady=10)
+        
+        # Чекбокс для рандомных модулей
+        self.random_modules_var = ctk.BooleanVar(value=False)
+        self.random_modules_check = ctk.CTkCheckBox(
+            launch_frame,
+            text="Использовать рандомные модули",
+            variable=self.random_modules_var,
+            font=("Helvetica", 12, "bold"),
+            text_color=COLORS["text"],
+            fg_color=COLORS["accent"],
+            hover_color=COLORS["hover"],
+            border_color=COLORS["accent"],
+            command=self.toggle_random_modules
+        )
+        self.random_modules_check.pack(anchor="w", padx=10, pady=10)
+        
+        # Кнопка настройки рандомных модулей
+        self.random_settings_button = ctk.CTkButton(
+            launch_frame,
+            text="Настройка рандомных модулей",
+            command=self.open_random_settings,
+            font=("Helvetica", 12),
+            height=30,
+            fg_color=COLORS["accent"],
+            hover_color=COLORS["hover"],
+            text_color=COLORS["text"],
+            corner_radius=8
+        )
+        self.random_settings_button.pack(anchor="w", padx=30, pady=5)
+        
+        # Чекбокс для продолжения прерванного запуска
+        self.resume_var = ctk.BooleanVar(value=False)
+        self.resume_check = ctk.CTkCheckBox(
+            launch_frame,
+            text="Продолжить с места остановки (пропустить выполненные задачи)",
+            variable=self.resume_var,
+            font=("Helvetica", 12),
+            text_color=COLORS["text"],
+            fg_color=COLORS["accent"],
+            hover_color=COLORS["hover"],
+            border_color=COLORS["accent"]
+        )
+        self.resume_check.pack(anchor="w", padx=30, pady=5)
+        
+        # Количество процессов, между которыми делятся аккаунты
+        shards_frame = ctk.CTkFrame(launch_frame, fg_color=COLORS["frame_bg"])
+        shards_frame.pack(anchor="w", padx=20, pady=5)
+        shards_label = ctk.CTkLabel(
+            shards_frame,
+            text="Процессов (аккаунты делятся между ними):",
+            font=("Helvetica", 12),
+            text_color=COLORS["text"]
+        )
+        shards_label.pack(side="left", padx=10)
+        
+        self.shards_entry = ctk.CTkEntry(
+            shards_frame,
+            width=60,
+            font=("Helvetica", 12),
+            fg_color=COLORS["entry_bg"],
+            text_color=COLORS["text"],
+            border_color=COLORS["accent"]
+        )
+        self.shards_entry.pack(side="left", padx=10)
+        
+        # Чекбокс для вывода софта в окне лаунчера
+        self.stream_output_var = ctk.BooleanVar(value=False)
+        self.stream_output_check = ctk.CTkCheckBox(
+            launch_frame,
+            text="Показывать вывод софта в окне лаунчера (без отдельной консоли и ввода)",
+            variable=self.stream_output_var,
+            font=("Helvetica", 12),
+            text_color=COLORS["text"],
+            fg_color=COLORS["accent"],
+            hover_color=COLORS["hover"],
+            border_color=COLORS["accent"]
+        )
+        self.stream_output_check.pack(anchor="w", padx=10, pady=5)
+        
+        # Чекбокс для генерации расписания
+        self.schedule_var = ctk.BooleanVar(value=False)
+        self.schedule_check = ctk.CTkCheckBox(
+            launch_frame,
+            text="Сгенерировать расписание",
+            variable=self.schedule_var,
+            font=("Helvetica", 12, "bold"),
+            text_color=COLORS["text"],
+            fg_color=COLORS["accent"],
+            hover_color=COLORS["hover"],
+            border_color=COLORS["accent"],
+            command=self.toggle_schedule
+        )
+        self.schedule_check.pack(anchor="w", padx=10, pady=10)
+        
+        # Фрейм для настройки часов (скрыт по умолчанию)
+        self.hours_frame = ctk.CTkFrame(launch_frame, fg_color=COLORS["frame_bg"])
+        
+        # Метка и поле для ввода часов
+        hours_label = ctk.CTkLabel(
+            self.hours_frame,
+            text="Количество часов:",
+            font=("Helvetica", 12),
+            text_color=COLORS["text"]
+        )
+        hours_label.pack(side="left", padx=10)
+        
+        self.hours_entry = ctk.CTkEntry(
+            self.hours_frame,
+            width=60,
+            font=("Helvetica", 12),
+            fg_color=COLORS["entry_bg"],
+            text_color=COLORS["text"],
+            border_color=COLORS["accent"]
+        )
+        self.hours_entry.pack(side="left", padx=10)
+        self.hours_entry.insert(0, "24")
+        
+        # Метка и поле для ожидаемой длительности одного аккаунта
+        duration_label = ctk.CTkLabel(
+            self.hours_frame,
+            text="Длительность аккаунта (мин):",
+            font=("Helvetica", 12),
+            text_color=COLORS["text"]
+        )
+        duration_label.pack(side="left", padx=10)
+        
+        self.duration_entry = ctk.CTkEntry(
+            self.hours_frame,
+            width=60,
+            font=("Helvetica", 12),
+            fg_color=COLORS["entry_bg"],
+            text_color=COLORS["text"],
+            border_color=COLORS["accent"]
+        )
+        self.duration_entry.pack(side="left", padx=10)
+        
+        # Чекбокс для подробного вывода расписания
+        self.schedule_details_var = ctk.BooleanVar(value=False)
+        self.schedule_details_check = ctk.CTkCheckBox(
+            self.hours_frame,
+            text="Расписание по каждому аккаунту",
+            variable=self.schedule_details_var,
+            font=("Helvetica", 12),
+            text_color=COLORS["text"],
+            fg_color=COLORS["accent"],
+            hover_color=COLORS["hover"],
+            border_color=COLORS["accent"]
+        )
+        self.schedule_details_check.pack(side="left", padx=10)
+        
+        # Кнопка запуска
+        self.launch_button = ctk.CTkButton(
+            self.root,
+            text="Запустить",
+            command=self.launch_app,
+            font=("Helvetica", 16, "bold"),
+            height=50,
+            fg_color=COLORS["accent"],
+            hover_color=COLORS["hover"],
+            text_color=COLORS["text"],
+            corner_radius=10
+        )
+        self.launch_button.pack(fill="x", padx=20, pady=20)
+        
+        # Текстовое поле для вывода информации
+        self.info_text = ctk.CTkTextbox(
+            self.root,
+            font=("Consolas", 12),
+            fg_color=COLORS["entry_bg"],
+            text_color=COLORS["text"],
+            border_color=COLORS["accent"],
+            wrap="word"
+        )
+        self.info_text.pack(fill="both", expand=True, padx=20, pady=10)
+        self.info_text.insert("1.0", "StarLabs Monad Launcher готов к работе.\n")
+        
+        # Добавляем контекстное меню для копирования
+        self.create_context_menu()
+    
+
+    def create_context_menu(self):
+        """Создание контекстного меню для текстового поля"""
+        if platform.system() == "Windows":
+            self.info_text.bind("<Button-3>", self.show_context_menu)
+        else:
+            self.info_text.bind("<Button-2>", self.show_context_menu)
+        
+        self.context_menu = tk.Menu(self.root, tearoff=0)
+        self.context_menu.add_command(label="Копировать", command=self.copy_text)
+        self.context_menu.add_command(label="Выделить всё", command=self.select_all_text)
+    
+    def show_context_menu(self, event):
+        """Показать контекстное меню"""
+        self.context_menu.post(event.x_root, event.y_root)
+
+    def copy_text(self):
+        """Копировать выделенный текст"""
+        try:
+            selected_text = self.info_text.get("sel.first", "sel.last")
+            self.root.clipboard_clear()
+            self.root.clipboard_append(selected_text)
+        except tk.TclError:
+            # Если ничего не выделено
+            pass
+
+    def select_all_text(self):
+        """Выделить весь текст"""
+        self.info_text.tag_add("sel", "1.0", "end")
+        return "break"
+    
+    def toggle_random_modules(self):
+        """Переключение видимости настроек рандомных модулей"""
+        if self.random_modules_var.get():
+            self.random_settings_button.configure(state="normal")
+        else:
+            self.random_settings_button.configure(state="disabled")
+    
+    def toggle_schedule(self):
+        """Переключение видимости настроек расписания"""
+        if self.schedule_var.get():
+            self.hours_frame.pack(fill="x", padx=10, pady=10)
+        else:
+            self.hours_frame.pack_forget()
+    
+    def parse_module_limits(self, text):
+        """Ограничения модулей из строки вида "magiceden=2, izumi=3" """
+        known = {module for modules in self.modules.values() for module in modules}
+        limits = {}
+        for item in text.replace(";", ",").split(","):
+            if not item.strip():
+                continue
+            module, _, limit = item.partition("=")
+            module = module.strip()
+            try:
+                limit = int(limit)
+            except ValueError:
+                self.update_info(f"Ограничение модуля пропущено (нужно модуль=число): {item.strip()}")
+                continue
+            if module not in known:
+                self.update_info(f"Ограничение модуля пропущено, модуль не найден: {module}")
+                continue
+            if limit > 0:
+                limits[module] = limit
+        return limits
+    
+    def module_label(self, module):
+        """Название модуля с оценкой длительности по прошлым запускам"""
+        entry = self.module_stats.get(module)
+        if entry is None:
+            return module
+        return f"{module}  (~{entry['ewma'] / 60:.1f} мин, p90 {entry['p90'] / 60:.1f} мин, замеров: {entry['count']})"
+    
+    def open_random_settings(self):
+        """Открытие окна настроек рандомизации"""
+        self.load_module_stats()
+        settings_window = ctk.CTkToplevel(self.root)
+        settings_window.title("Настройки рандомизации")
+        settings_window.geometry("600x700")
+        settings_window.minsize(600, 700)
+        settings_window.configure(fg_color=COLORS["bg"])
+        settings_window.grab_set()  # Делаем окно модальным
+        
+        # Создаем прокручиваемый фрейм
+        scroll_frame = ctk.CTkScrollableFrame(settings_window, fg_color=COLORS["bg"])
+        scroll_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+        # НОВАЯ СЕКЦИЯ: Начальные модули
+        initial_frame = ctk.CTkFrame(scroll_frame, fg_color=COLORS["frame_bg"])
+        initial_frame.pack(fill="x", padx=10, pady=10)
+        
+        initial_label = ctk.CTkLabel(
+            initial_frame,
+            text="Начальные модули:",
+            font=("Helvetica", 14, "bold"),
+            text_color=COLORS["text"]
+        )
+        initial_label.pack(anchor="w", padx=10, pady=5)
+        
+        # Чекбоксы для начальных модулей
+        self.initial_vars = {}
+        for module in self.modules["INITIAL"]:
+            var = ctk.BooleanVar(value=self.initial_modules.get(module, False))
+            checkbox = ctk.CTkCheckBox(
+                initial_frame,
+                text=self.module_label(module),
+                variable=var,
+                font=("Helvetica", 12),
+                text_color=COLORS["text"],
+                fg_color=COLORS["accent"],
+                hover_color=COLORS["hover"],
+                border_color=COLORS["accent"]
+            )
+            checkbox.pack(anchor="w", padx=30, pady=2)
+            self.initial_vars[module] = var
+
+        # Настройки для SWAPS
+        if "SWAPS" in self.modules:
+            swaps_frame = ctk.CTkFrame(scroll_frame, fg_color=COLORS["frame_bg"])
+            swaps_frame.pack(fill="x", padx=10, pady=10)
+            
+            swaps_label = ctk.CTkLabel(
+                swaps_frame,
+                text="SWAPS (выбрать от-до):",
+                font=("Helvetica", 14, "bold"),
+                text_color=COLORS["text"]
+            )
+            swaps_label.pack(anchor="w", padx=10, pady=5)
+            
+            # Подсчитываем количество доступных модулей SWAPS (без collect_all_to_monad)
+            swaps_count = len([module for module in self.modules["SWAPS"] if module != "collect_all_to_monad"])
+            
+            # Слайдеры для выбора диапазона
+            swaps_range_frame = ctk.CTkFrame(swaps_frame, fg_color=COLORS["frame_bg"])
+            swaps_range_frame.pack(fill="x", padx=10, pady=5)
+            
+            swaps_min_label = ctk.CTkLabel(
+                swaps_range_frame,
+                text="Минимум:",
+                font=("Helvetica", 12),
+                text_color=COLORS["text"]
+            )
+            swaps_min_label.pack(side="left", padx=5)
+            
+            # Используем текущее значение из класса
+            self.swaps_min_var = ctk.IntVar(value=self.swaps_count_min)
+            swaps_min_slider = ctk.CTkSlider(
+                swaps_range_frame,
+                from_=0,
+                to=swaps_count,
+                number_of_steps=swaps_count,
+                variable=self.swaps_min_var,
+                width=100,
+                fg_color=COLORS["entry_bg"],
+                button_color=COLORS["accent"],
+                button_hover_color=COLORS["hover"],
+                progress_color=COLORS["accent"]
+            )
+            swaps_min_slider.pack(side="left", padx=5)
+            
+            swaps_min_value = ctk.CTkLabel(
+                swaps_range_frame,
+                textvariable=self.swaps_min_var,
+                font=("Helvetica", 12),
+                text_color=COLORS["text"],
+                width=20
+            )
+            swaps_min_value.pack(side="left", padx=5)
+            
+            swaps_max_label = ctk.CTkLabel(
+                swaps_range_frame,
+                text="Максимум:",
+                font=("Helvetica", 12),
+                text_color=COLORS["text"]
+            )
+            swaps_max_label.pack(side="left", padx=5)
+            
+            # Используем текущее значение из класса
+            self.swaps_max_var = ctk.IntVar(value=self.swaps_count_max)
+            swaps_max_slider = ctk.CTkSlider(
+                swaps_range_frame,
+                from_=0,
+                to=swaps_count,
+                number_of_steps=swaps_count,
+                variable=self.swaps_max_var,
+                width=100,
+                fg_color=COLORS["entry_bg"],
+                button_color=COLORS["accent"],
+                button_hover_color=COLORS["hover"],
+                progress_color=COLORS["accent"]
+            )
+            swaps_max_slider.pack(side="left", padx=5)
+            
+            swaps_max_value = ctk.CTkLabel(
+                swaps_range_frame,
+                textvariable=self.swaps_max_var,
+                font=("Helvetica", 12),
+                text_color=COLORS["text"],
+                width=20
+            )
+            swaps_max_value.pack(side="left", padx=5)
+            
+            # Чекбоксы для модулей
+            self.swaps_vars = {}
+            for module in self.modules["SWAPS"]:
+                if module != "collect_all_to_monad":  # Этот модуль обрабатывается отдельно
+                    # Используем текущее значение из класса
+                    var = ctk.BooleanVar(value=self.swaps_modules.get(module, True))
+                    checkbox = ctk.CTkCheckBox(
+                        swaps_frame,
+                        text=self.module_label(module),
+                        variable=var,
+                        font=("Helvetica", 12),
+                        text_color=COLORS["text"],
+                        fg_color=COLORS["accent"],
+                        hover_color=COLORS["hover"],
+                        border_color=COLORS["accent"]
+                    )
+                    checkbox.pack(anchor="w", padx=30, pady=2)
+                    self.swaps_vars[module] = var
+        
+        # Настройки для STAKES
+        if "STAKES" in self.modules:
+            stakes_frame = ctk.CTkFrame(scroll_frame, fg_color=COLORS["frame_bg"])
+            stakes_frame.pack(fill="x", padx=10, pady=10)
+            
+            stakes_label = ctk.CTkLabel(
+                stakes_frame,
+                text="STAKES (выбрать от-до):",
+                font=("Helvetica", 14, "bold"),
+                text_color=COLORS["text"]
+            )
+            stakes_label.pack(anchor="w", padx=10, pady=5)
+            
+            # Подсчитываем количество доступных модулей STAKES
+            stakes_count = len(self.modules["STAKES"])
+            
+            # Слайдеры для выбора диапазона
+            stakes_range_frame = ctk.CTkFrame(stakes_frame, fg_color=COLORS["frame_bg"])
+            stakes_range_frame.pack(fill="x", padx=10, pady=5)
+            
+            stakes_min_label = ctk.CTkLabel(
+                stakes_range_frame,
+                text="Минимум:",
+                font=("Helvetica", 12),
+                text_color=COLORS["text"]
+            )
+            stakes_min_label.pack(side="left", padx=5)
+            
+            # Используем текущее значение из класса
+            self.stakes_min_var = ctk.IntVar(value=self.stakes_count_min)
+            stakes_min_slider = ctk.CTkSlider(
+                stakes_range_frame,
+                from_=0,
+                to=stakes_count,
+                number_of_steps=stakes_count,
+                variable=self.stakes_min_var,
+                width=100,
+                fg_color=COLORS["entry_bg"],
+                button_color=COLORS["accent"],
+                button_hover_color=COLORS["hover"],
+                progress_color=COLORS["accent"]
+            )
+            stakes_min_slider.pack(side="left", padx=5)
+            
+            stakes_min_value = ctk.CTkLabel(
+                stakes_range_frame,
+                textvariable=self.stakes_min_var,
+                font=("Helvetica", 12),
+                text_color=COLORS["text"],
+                width=20
+            )
+            stakes_min_value.pack(side="left", padx=5)
+            
+            stakes_max_label = ctk.CTkLabel(
+                stakes_range_frame,
+                text="Максимум:",
+                font=("Helvetica", 12),
+                text_color=COLORS["text"]
+            )
+            stakes_max_label.pack(side="left", padx=5)
+            
+            # Используем текущее значение из класса
+            self.stakes_max_var = ctk.IntVar(value=self.stakes_count_max)
+            stakes_max_slider = ctk.CTkSlider(
+                stakes_range_frame,
+                from_=0,
+                to=stakes_count,
+                number_of_steps=stakes_count,
+                variable=self.stakes_max_var,
+                width=100,
+                fg_color=COLORS["entry_bg"],
+                button_color=COLORS["accent"],
+                button_hover_color=COLORS["hover"],
+                progress_color=COLORS["accent"]
+            )
+            stakes_max_slider.pack(side="left", padx=5)
+            
+            stakes_max_value = ctk.CTkLabel(
+                stakes_range_frame,
+                textvariable=self.stakes_max_var,
+                font=("Helvetica", 12),
+                text_color=COLORS["text"],
+                width=20
+            )
+            stakes_max_value.pack(side="left", padx=5)
+            
+            # Чекбоксы для модулей
+            self.stakes_vars = {}
+            for module in self.modules["STAKES"]:
+                # Используем текущее значение из класса
+                var = ctk.BooleanVar(value=self.stakes_modules.get(module, True))
+                checkbox = ctk.CTkCheckBox(
+                    stakes_frame,
+                    text=self.module_label(module),
+                    variable=var,
+                    font=("Helvetica", 12),
+                    text_color=COLORS["text"],
+                    fg_color=COLORS["accent"],
+                    hover_color=COLORS["hover"],
+                    border_color=COLORS["accent"]
+                )
+                checkbox.pack(anchor="w", padx=30, pady=2)
+                self.stakes_vars[module] = var
+        
+        # Настройки для MINT
+        if "MINT" in self.modules:
+            mint_frame = ctk.CTkFrame(scroll_frame, fg_color=COLORS["frame_bg"])
+            mint_frame.pack(fill="x", padx=10, pady=10)
+            
+            mint_label = ctk.CTkLabel(
+                mint_frame,
+                text="MINT (выбрать от-до):",
+                font=("Helvetica", 14, "bold"),
+                text_color=COLORS["text"]
+            )
+            mint_label.pack(anchor="w", padx=10, pady=5)
+            
+            # Подсчитываем количество доступных модулей MINT
+            mint_count = len(self.modules["MINT"])
+            
+            # Слайдеры для выбора диапазона
+            mint_range_frame = ctk.CTkFrame(mint_frame, fg_color=COLORS["frame_bg"])
+            mint_range_frame.pack(fill="x", padx=10, pady=5)
+            
+            mint_min_label = ctk.CTkLabel(
+                mint_range_frame,
+                text="Минимум:",
+                font=("Helvetica", 12),
+                text_color=COLORS["text"]
+            )
+            mint_min_label.pack(side="left", padx=5)
+            
+            # Используем текущее значение из класса
+            self.mint_min_var = ctk.IntVar(value=self.mint_count_min)
+            mint_min_slider = ctk.CTkSlider(
+                mint_range_frame,
+                from_=0,
+                to=mint_count,
+                number_of_steps=mint_count,
+                variable=self.mint_min_var,
+                width=100,
+                fg_color=COLORS["entry_bg"],
+                button_color=COLORS["accent"],
+                button_hover_color=COLORS["hover"],
+                progress_color=COLORS["accent"]
+            )
+            mint_min_slider.pack(side="left", padx=5)
+            
+            mint_min_value = ctk.CTkLabel(
+                mint_range_frame,
+                textvariable=self.mint_min_var,
+                font=("Helvetica", 12),
+                text_color=COLORS["text"],
+                width=20
+            )
+            mint_min_value.pack(side="left", padx=5)
+            
+            mint_max_label = ctk.CTkLabel(
+                mint_range_frame,
+                text="Максимум:",
+                font=("Helvetica", 12),
+                text_color=COLORS["text"]
+            )
+            mint_max_label.pack(side="left", padx=5)
+            
+            # Используем текущее значение из класса
+            self.mint_max_var = ctk.IntVar(value=self.mint_count_max)
+            mint_max_slider = ctk.CTkSlider(
+                mint_range_frame,
+                from_=0,
+                to=mint_count,
+                number_of_steps=mint_count,
+                variable=self.mint_max_var,
+                width=100,
+                fg_color=COLORS["entry_bg"],
+                button_color=COLORS["accent"],
+                button_hover_color=COLORS["hover"],
+                progress_color=COLORS["accent"]
+            )
+            mint_max_slider.pack(side="left", padx=5)
+            
+            mint_max_value = ctk.CTkLabel(
+                mint_range_frame,
+                textvariable=self.mint_max_var,
+                font=("Helvetica", 12),
+                text_color=COLORS["text"],
+                width=20
+            )
+            mint_max_value.pack(side="left", padx=5)
+            
+            # Чекбоксы для модулей
+            self.mint_vars = {}
+            for module in self.modules["MINT"]:
+                # Используем текущее значение из класса
+                var = ctk.BooleanVar(value=self.mint_modules.get(module, True))
+                checkbox = ctk.CTkCheckBox(
+                    mint_frame,
+                    text=self.module_label(module),
+                    variable=var,
+                    font=("Helvetica", 12),
+                    text_color=COLORS["text"],
+                    fg_color=COLORS["accent"],
+                    hover_color=COLORS["hover"],
+                    border_color=COLORS["accent"]
+                )
+                checkbox.pack(anchor="w", padx=30, pady=2)
+                self.mint_vars[module] = var
+                
+        if "GAMES" in self.modules:
+            games_frame = ctk.CTkFrame(scroll_frame, fg_color=COLORS["frame_bg"])
+            games_frame.pack(fill="x", padx=10, pady=10)
+            
+            games_label = ctk.CTkLabel(
+                games_frame,
+                text="Игровые модули:",
+                font=("Helvetica", 14, "bold"),
+                text_color=COLORS["text"]
+            )
+            games_label.pack(anchor="w", padx=10, pady=5)
+            
+            # Чекбоксы для модулей
+            self.games_vars = {}
+            for module in self.modules["GAMES"]:
+                var = ctk.BooleanVar(value=self.games_modules.get(module, True))
+                checkbox = ctk.CTkCheckBox(
+                    games_frame,
+                    text=self.module_label(module),
+                    variable=var,
+                    font=("Helvetica", 12),
+                    text_color=COLORS["text"],
+                    fg_color=COLORS["accent"],
+                    hover_color=COLORS["hover"],
+                    border_color=COLORS["accent"]
+                )
+                checkbox.pack(anchor="w", padx=30, pady=2)
+                self.games_vars[module] = var
+        
+        # Настройка для OTHER с вероятностью
+        if "OTHER" in self.modules:
+            other_frame = ctk.CTkFrame(scroll_frame, fg_color=COLORS["frame_bg"])
+            other_frame.pack(fill="x", padx=10, pady=10)
+            
+            other_label = ctk.CTkLabel(
+                other_frame,
+                text="Другие модули:",
+                font=("Helvetica", 14, "bold"),
+                text_color=COLORS["text"]
+            )
+            other_label.pack(anchor="w", padx=10, pady=5)
+            
+            # Слайдер для вероятности
+            other_prob_frame = ctk.CTkFrame(other_frame, fg_color=COLORS["frame_bg"])
+            other_prob_frame.pack(fill="x", padx=10, pady=5)
+            
+            other_prob_label = ctk.CTkLabel(
+                other_prob_frame,
+                text="Вероятность (%):",
+                font=("Helvetica", 12),
+                text_color=COLORS["text"]
+            )
+            other_prob_label.pack(side="left", padx=5)
+            
+            # Используем текущее значение из класса
+            self.other_prob_var = ctk.IntVar(value=self.other_probability)
+            other_prob_slider = ctk.CTkSlider(
+                other_prob_frame,
+                from_=0,
+                to=100,
+                number_of_steps=10,
+                variable=self.other_prob_var,
+                width=200,
+                fg_color=COLORS["entry_bg"],
+                button_color=COLORS["accent"],
+                button_hover_color=COLORS["hover"],
+                progress_color=COLORS["accent"]
+            )
+            other_prob_slider.pack(side="left", padx=5)
+            
+            other_prob_value = ctk.CTkLabel(
+                other_prob_frame,
+                textvariable=self.other_prob_var,
+                font=("Helvetica", 12),
+                text_color=COLORS["text"],
+                width=30
+            )
+            other_prob_value.pack(side="left", padx=5)
+            
+            # Чекбоксы для модулей
+            self.other_vars = {}
+            for module in self.modules["OTHER"]:
+                if module != "logs":  # logs всегда будет в конце
+                    # Используем текущее значение из класса
+                    var = ctk.BooleanVar(value=self.other_modules.get(module, True))
+                    checkbox = ctk.CTkCheckBox(
+                        other_frame,
+                        text=self.module_label(module),
+                        variable=var,
+                        font=("Helvetica", 12),
+                        text_color=COLORS["text"],
+                        fg_color=COLORS["accent"],
+                        hover_color=COLORS["hover"],
+                        border_color=COLORS["accent"]
+                    )
+                    checkbox.pack(anchor="w", padx=30, pady=2)
+                    self.other_vars[module] = var
+                    
+        # Настройка для collect_all_to_monad с вероятностью
+        if "SWAPS" in self.modules and "collect_all_to_monad" in self.modules["SWAPS"]:
+            collect_frame = ctk.CTkFrame(scroll_frame, fg_color=COLORS["frame_bg"])
+            collect_frame.pack(fill="x", padx=10, pady=10)
+            
+            collect_label = ctk.CTkLabel(
+                collect_frame,
+                text="Использовать collect_all_to_monad:",
+                font=("Helvetica", 14, "bold"),
+                text_color=COLORS["text"]
+            )
+            collect_label.pack(anchor="w", padx=10, pady=5)
+            
+            # Слайдер для вероятности
+            collect_prob_frame = ctk.CTkFrame(collect_frame, fg_color=COLORS["frame_bg"])
+            collect_prob_frame.pack(fill="x", padx=10, pady=5)
+            
+            collect_prob_label = ctk.CTkLabel(
+                collect_prob_frame,
+                text="Вероятность (%):",
+                font=("Helvetica", 12),
+                text_color=COLORS["text"]
+            )
+            collect_prob_label.pack(side="left", padx=5)
+            
+            # Используем текущее значение из класса
+            self.collect_prob_var = ctk.IntVar(value=self.collect_probability)
+            collect_prob_slider = ctk.CTkSlider(
+                collect_prob_frame,
+                from_=0,
+                to=100,
+                number_of_steps=10,
+                variable=self.collect_prob_var,
+                width=200,
+                fg_color=COLORS["entry_bg"],
+                button_color=COLORS["accent"],
+                button_hover_color=COLORS["hover"],
+                progress_color=COLORS["accent"]
+            )
+            collect_prob_slider.pack(side="left", padx=5)
+            
+            collect_prob_value = ctk.CTkLabel(
+                collect_prob_frame,
+                textvariable=self.collect_prob_var,
+                font=("Helvetica", 12),
+                text_color=COLORS["text"],
+                width=30
+            )
+            collect_prob_value.pack(side="left", padx=5)
+        
+        # Настройка для генерации рандомных задач для каждого аккаунта
+        account_frame = ctk.CTkFrame(scroll_frame, fg_color=COLORS["frame_bg"])
+        account_frame.pack(fill="x", padx=10, pady=10)
+        
+        # Используем текущее значение из класса
+        self.random_account_var = ctk.BooleanVar(value=self.random_for_each_account)
+        random_account_check = ctk.CTkCheckBox(
+            account_frame,
+            text="Генерировать рандомные задачи для каждого аккаунта",
+            variable=self.random_account_var,
+            font=("Helvetica", 12, "bold"),
+            text_color=COLORS["text"],
+            fg_color=COLORS["accent"],
+            hover_color=COLORS["hover"],
+            border_color=COLORS["accent"]
+        )
+        random_account_check.pack(anchor="w", padx=10, pady=10)
+        
+        # Слайдер для срока хранения плана аккаунта
+        plan_cache_frame = ctk.CTkFrame(account_frame, fg_color=COLORS["frame_bg"])
+        plan_cache_frame.pack(fill="x", padx=10, pady=5)
+        
+        plan_cache_label = ctk.CTkLabel(
+            plan_cache_frame,
+            text="Хранить план аккаунта (часов):",
+            font=("Helvetica", 12),
+            text_color=COLORS["text"]
+        )
+        plan_cache_label.pack(side="left", padx=5)
+        
+        # Используем текущее значение из класса
+        self.plan_cache_var = ctk.IntVar(value=self.plan_cache_hours)
+        plan_cache_slider = ctk.CTkSlider(
+            plan_cache_frame,
+            from_=0,
+            to=72,
+            number_of_steps=72,
+            variable=self.plan_cache_var,
+            width=200,
+            fg_color=COLORS["entry_bg"],
+            button_color=COLORS["accent"],
+            button_hover_color=COLORS["hover"],
+            progress_color=COLORS["accent"]
+        )
+        plan_cache_slider.pack(side="left", padx=5)
+        
+        plan_cache_value = ctk.CTkLabel(
+            plan_cache_frame,
+            textvariable=self.plan_cache_var,
+            font=("Helvetica", 12),
+            text_color=COLORS["text"],
+            width=30
+        )
+        plan_cache_value.pack(side="left", padx=5)
+        
+        # Слайдеры для бюджета аккаунта
+        budget_label = ctk.CTkLabel(
+            account_frame,
+            text=f"Бюджет аккаунта (0 — без ограничения, модуль без оценки — {self.default_module_minutes} мин):",
+            font=("Helvetica", 12),
+            text_color=COLORS["text"]
+        )
+        budget_label.pack(anchor="w", padx=10, pady=5)
+        
+        self.budget_minutes_var = ctk.IntVar(value=self.budget_minutes)
+        self.budget_transactions_var = ctk.IntVar(value=self.budget_transactions)
+        for text, variable, limit, steps in (
+            ("Время (минут):", self.budget_minutes_var, 240, 48),
+            ("Транзакций:", self.budget_transactions_var, 50, 50),
+        ):
+            budget_frame = ctk.CTkFrame(account_frame, fg_color=COLORS["frame_bg"])
+            budget_frame.pack(fill="x", padx=10, pady=5)
+            
+            ctk.CTkLabel(
+                budget_frame,
+                text=text,
+                font=("Helvetica", 12),
+                text_color=COLORS["text"],
+                width=120,
+                anchor="w"
+            ).pack(side="left", padx=5)
+            
+            ctk.CTkSlider(
+                budget_frame,
+                from_=0,
+                to=limit,
+                number_of_steps=steps,
+                variable=variable,
+                width=200,
+                fg_color=COLORS["entry_bg"],
+                button_color=COLORS["accent"],
+                button_hover_color=COLORS["hover"],
+                progress_color=COLORS["accent"]
+            ).pack(side="left", padx=5)
+            
+            ctk.CTkLabel(
+                budget_frame,
+                textvariable=variable,
+                font=("Helvetica", 12),
+                text_color=COLORS["text"],
+                width=30
+            ).pack(side="left", padx=5)
+        
+        # Ограничения одновременного выполнения модулей
+        limits_label = ctk.CTkLabel(
+            account_frame,
+            text="Не больше аккаунтов одновременно в модуле (например: magiceden=2, izumi=3):",
+            font=("Helvetica", 12),
+            text_color=COLORS["text"]
+        )
+        limits_label.pack(anchor="w", padx=10, pady=5)
+        
+        self.module_limits_entry = ctk.CTkEntry(
+            account_frame,
+            font=("Helvetica", 12),
+            fg_color=COLORS["entry_bg"],
+            text_color=COLORS["text"],
+            border_color=COLORS["accent"]
+        )
+        self.module_limits_entry.pack(fill="x", padx=10, pady=5)
+        self.module_limits_entry.insert(0, ", ".join(f"{module}={limit}" for module, limit in self.module_limits.items()))
+        
+        # Кнопка сохранения настроек
+        save_button = ctk.CTkButton(
+            settings_window,
+            text="Сохранить настройки",
+            command=lambda: self.save_random_settings(settings_window),
+            font=("Helvetica", 14, "bold"),
+            height=40,
+            fg_color=COLORS["accent"],
+            hover_color=COLORS["hover"],
+            text_color=COLORS["text"],
+            corner_radius=10
+        )
+        save_button.pack(fill="x", padx=20, pady=20)
+    
+    def save_random_settings(self, window):
+        """Сохранение настроек рандомизации"""
+        # Сохраняем настройки начальных модулей
+        if hasattr(self, "initial_vars"):
+            self.initial_modules = {module: var.get() for module, var in self.initial_vars.items()}
+        # Сохраняем настройки SWAPS
+        if hasattr(self, "swaps_min_var") and hasattr(self, "swaps_max_var"):
+            self.swaps_count_min = self.swaps_min_var.get()
+            self.swaps_count_max = self.swaps_max_var.get()
+            
+            # Проверяем, что минимум не больше максимума
+            if self.swaps_count_min > self.swaps_count_max:
+                self.swaps_count_min = self.swaps_count_max
+        
+        if hasattr(self, "swaps_vars"):
+            self.swaps_modules = {module: var.get() for module, var in self.swaps_vars.items()}
+        
+        # Сохраняем настройки STAKES
+        if hasattr(self, "stakes_min_var") and hasattr(self, "stakes_max_var"):
+            self.stakes_count_min = self.stakes_min_var.get()
+            self.stakes_count_max = self.stakes_max_var.get()
+            
+            # Проверяем, что минимум не больше максимума
+            if self.stakes_count_min > self.stakes_count_max:
+                self.stakes_count_min = self.stakes_count_max
+        
+        if hasattr(self, "stakes_vars"):
+            self.stakes_modules = {module: var.get() for module, var in self.stakes_vars.items()}
+        
+        # Сохраняем настройки MINT
+        if hasattr(self, "mint_min_var") and hasattr(self, "mint_max_var"):
+            self.mint_count_min = self.mint_min_var.get()
+            self.mint_count_max = self.mint_max_var.get()
+            
+            # Проверяем, что минимум не больше максимума
+            if self.mint_count_min > self.mint_count_max:
+                self.mint_count_min = self.mint_count_max
+        
+        if hasattr(self, "mint_vars"):
+            self.mint_modules = {module: var.get() for module, var in self.mint_vars.items()}
+        
+        if hasattr(self, "games_vars"):
+            self.games_modules = {module: var.get() for module, var in self.games_vars.items()}
+        
+        # Сохраняем настройки OTHER
+        if hasattr(self, "other_prob_var"):
+            self.other_probability = self.other_prob_var.get()
+        
+        if hasattr(self, "other_vars"):
+            self.other_modules = {module: var.get() for module, var in self.other_vars.items()}
+        
+        # Сохраняем настройки collect_all_to_monad
+        if hasattr(self, "collect_prob_var"):
+            self.collect_probability = self.collect_prob_var.get()
+        
+        # Сохраняем настройку для генерации рандомных задач для каждого аккаунта
+        if hasattr(self, "random_account_var"):
+            self.random_for_each_account = self.random_account_var.get()
+        
+        if hasattr(self, "plan_cache_var"):
+            self.plan_cache_hours = self.plan_cache_var.get()
+        
+        # Сохраняем ограничения модулей
+        if hasattr(self, "module_limits_entry"):
+            self.module_limits = self.parse_module_limits(self.module_limits_entry.get())
+        
+        # Сохраняем бюджет аккаунта
+        if hasattr(self, "budget_minutes_var"):
+            self.budget_minutes = self.budget_minutes_var.get()
+            self.budget_transactions = self.budget_transactions_var.get()
+        
+        # Сразу пишем в файл: запущенный раннер применит изменения к еще не запущенным аккаунтам
+        self.sync_settings_from_ui()
+        self.save_settings()
+        
+        # Закрываем окно настроек
+        window.destroy()
+        
+        self.update_info("Настройки рандомизации сохранены.")
+    
+    def open_config(self):
+        """Открытие конфигурации через интерфейс"""
+        try:
+            # Импортируем ConfigUI
+            spec = importlib.util.spec_from_file_location(
+                "config_ui", 
+                os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "utils", "config_ui.py")
+            )
+            config_ui_module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(config_ui_module)
+            
+            # Создаем и запускаем интерфейс конфигурации
+            self.update_info("Открываю интерфейс конфигурации...")
+            
+            # Сохраняем текущие обработчики after
+            old_after_ids = self.root.tk.call('after', 'info')
+            
+            # Создаем и запускаем интерфейс конфигурации
+            config_ui = config_ui_module.ConfigUI()
+            config_ui.run()
+            
+            # Отменяем все новые обработчики after, которые могли быть созданы
+            new_after_ids = self.root.tk.call('after', 'info')
+            for after_id in new_after_ids:
+                if after_id not in old_after_ids:
+                    try:
+                        self.root.after_cancel(after_id)
+                    except Exception:
+                        pass
+            
+            self.update_info("Конфигурация сохранена.")
+        
+        except Exception as e:
+            self.update_info(f"Ошибка при открытии конфигурации: {str(e)}")
+    
+    def launch_app(self):
+        """Запуск приложения с текущими настройками интерфейса"""
+        self.sync_settings_from_ui()
+        self.process = super().launch_app()
+        return self.process
+    
+    def update_info(self, text):
+        """Сообщение в окно лаунчера (можно вызывать из любого потока)
+
+        Текст сразу пишется в файл лога и выводится в окно при ближайшем flush_log.
+        """
+        self.output.message(text)
+    
+    def flush_log(self):
+        """Перенос накопленных сообщений в окно одной вставкой"""
+        lines = self.output.drain()
+        if not lines:
+            return
+        
+        text = "\n".join(lines)
+        # В окно попадает не больше MAX_LOG_LINES последних строк пачки
+        if text.count("\n") >= MAX_LOG_LINES:
+            text = "\n".join(text.split("\n")[-MAX_LOG_LINES:])
+        self.info_text.configure(state="normal")
+        self.info_text.insert("end", f"\n{text}")
+        # Старые строки вытесняются, полный лог остается в файле
+        excess = int(self.info_text.index("end-1c").split(".")[0]) - MAX_LOG_LINES
+        if excess > 0:
+            self.info_text.delete("1.0", f"{excess + 1}.0")
+        self.info_text.see("end")
+    
+    def drain_output(self):
+        """Периодический вывод накопленных сообщений (одна вставка за период)"""
+        self.flush_log()
+        self.root.after(LOG_FLUSH_INTERVAL, self.drain_output)
+    
+    def run(self):
+        """Запуск лаунчера"""
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.root.after(LOG_FLUSH_INTERVAL, self.drain_output)
+        self.root.mainloop()
+
+def parse_args(argv=None):
+    """Разбор аргументов командной строки"""
+    parser = argparse.ArgumentParser(description="StarLabs Monad Launcher")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    run_parser = subparsers.add_parser("run", help="Запуск без графического интерфейса по launcher_settings.json")
+    run_parser.add_argument("--settings", help="Путь к файлу настроек (по умолчанию launcher_settings.json)")
+    
+    schedule_group = run_parser.add_mutually_exclusive_group()
+    schedule_group.add_argument("--schedule", type=int, metavar="HOURS", help="Сгенерировать расписание на указанное количество часов")
+    schedule_group.add_argument("--no-schedule", action="store_true", help="Запуск без расписания")
+    run_parser.add_argument("--schedule-details", action="store_true", help="Вывести расписание по каждому аккаунту")
+    run_parser.add_argument("--account-duration", type=float, metavar="MINUTES", help="Ожидаемая длительность работы одного аккаунта")
+    
+    random_group = run_parser.add_mutually_exclusive_group()
+    random_group.add_argument("--random-per-account", action="store_true", help="Рандомные задачи для каждого аккаунта")
+    random_group.add_argument("--random-shared", action="store_true", help="Одни рандомные задачи для всех аккаунтов")
+    random_group.add_argument("--no-random", action="store_true", help="Запуск без рандомных модулей")
+    
+    run_parser.add_argument("--resume", action="store_true", help="Продолжить прерванный запуск, пропуская выполненные задачи")
+    run_parser.add_argument("--seed", type=int, help="Сид запуска: повторяет расписание и планы задач прошлого запуска")
+    run_parser.add_argument("--shards", type=int, metavar="N", help="Разделить аккаунты между N процессами")
+    run_parser.add_argument("--profile", choices=("cprofile", "sampling"), help="Профилировать запуск: cProfile (.pstats) или сэмплирование стеков (.collapsed)")
+    run_parser.add_argument("--profile-shard", type=int, metavar="K", help="Профилировать только K-й процесс (с 1) при --shards")
+    run_parser.add_argument("--profile-accounts", type=int, metavar="N", help="Профилировать только первые N аккаунтов")
+    run_parser.add_argument("--adaptive-concurrency", action="store_true", help="Регулировать количество аккаунтов в работе по доле ошибок и длительности")
+    run_parser.add_argument("--stream", action="store_true", help="Читать вывод процессов через лаунчер (строки шардов помечаются номером)")
+    run_parser.add_argument("--detach", action="store_true", help="Не ждать завершения запущенного процесса")
+    return parser.parse_args(argv)
+
+def run_headless(args):
+    """Запуск того же конвейера, что и кнопка «Запустить», без tkinter"""
+    launcher = StarLabsLauncherCore(args.settings)
+    
+    # Аргументы командной строки перекрывают сохраненные настройки
+    if args.schedule is not None:
+        launcher.schedule_enabled = True
+        launcher.hours_value = str(args.schedule)
+    elif args.no_schedule:
+        launcher.schedule_enabled = False
+    if args.schedule_details:
+        launcher.schedule_details = True
+    if args.account_duration is not None:
+        launcher.account_duration_minutes = args.account_duration
+    launcher.resume = args.resume
+    launcher.seed = args.seed
+    launcher.stream_output = args.stream and not args.detach
+    if launcher.stream_output:
+        launcher.output = OutputPump()
+        launcher.output.print_forever()
+    if args.shards is not None:
+        launcher.shards = args.shards
+    if args.profile:
+        launcher.profile = args.profile
+    if args.profile_shard is not None:
+        launcher.profile_shard = args.profile_shard
+    if args.profile_accounts is not None:
+        launcher.profile_accounts = args.profile_accounts
+    if args.adaptive_concurrency:
+        launcher.concurrency["enabled"] = True
+    
+    if args.random_per_account:
+        launcher.random_modules_enabled = True
+        launcher.random_for_each_account = True
+    elif args.random_shared:
+        launcher.random_modules_enabled = True
+        launcher.random_for_each_account = False
+    elif args.no_random:
+        launcher.random_modules_enabled = False
+    
+    if launcher.schedule_enabled and not check_dependencies(SCHEDULE_DEPENDENCIES):
+        return 1
+    
+    process = launcher.launch_app()
+    if process is None:
+        return 1
+    if args.detach:
+        return 0
+    code = process.wait()
+    if launcher.output is not None:
+        launcher.output.finish()
+    return code
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == "run":
+        return run_headless(args)
+    
+    if not check_dependencies(GUI_DEPENDENCIES):
+        return 1
+    
+    launcher = StarLabsLauncher()
+    launcher.run()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
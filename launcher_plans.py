@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Генерация планов задач StarLabs Monad.
+
+Общий код лаунчера и раннера: выборка рандомных модулей по настройкам,
+сидированные генераторы и формат файла plans.json.
+"""
+
+import os
+import json
+import random
+
+# Разделы настроек, от которых зависит план задач
+SAMPLING_KEYS = ("initial", "swaps", "stakes", "mint", "games", "other", "collect", "budget")
+
+# Ожидаемая длительность модуля вместе с паузой после него (в минутах), если оценки нет
+DEFAULT_MODULE_MINUTES = 3
+
+def seeded_rng(seed, stream):
+    """Независимый генератор для потока stream (номер аккаунта, "schedule", ...)
+
+    Зависит только от сида и имени потока, поэтому план аккаунта не зависит
+    от порядка генерации и количества процессов.
+    """
+    return random.Random(f"{seed}:{stream}")
+
+# Количество аккаунтов, начиная с которого планы генерируются в нескольких процессах
+PARALLEL_PLANS_THRESHOLD = 20000
+
+class TaskSampler:
+    """Генерация рандомных планов задач по настройкам
+
+    Списки включенных модулей собираются один раз при создании, поэтому
+    генерация планов для большого числа аккаунтов не повторяет эту работу.
+    """
+
+    def __init__(self, settings, modules, estimates=None):
+        self.initial = [module for module in modules.get("INITIAL", []) if settings["initial"]["modules"].get(module, False)]
+        
+        # Категории с количеством модулей от-до
+        self.ranges = []
+        for category, key in (("SWAPS", "swaps"), ("STAKES", "stakes"), ("MINT", "mint")):
+            if category in modules:
+                enabled = [module for module, on in settings[key]["modules"].items() if on and module != "collect_all_to_monad"]
+                self.ranges.append((enabled, settings[key]["min"], settings[key]["max"]))
+        
+        self.games = [module for module, on in settings["games"]["modules"].items() if on] if "GAMES" in modules else []
+        self.other = [module for module, on in settings["other"]["modules"].items() if on] if "OTHER" in modules else []
+        self.other_probability = settings["other"]["probability"]
+        self.collect_probability = settings["collect"]["probability"] if "collect_all_to_monad" in modules.get("SWAPS", []) else 0
+        self.logs = "logs" in modules.get("OTHER", [])
+        
+        # Бюджет аккаунта: время (в секундах) и количество транзакций, 0 — без ограничения
+        budget = settings.get("budget") or {}
+        self.budget_seconds = float(budget.get("minutes", 0) or 0) * 60
+        self.budget_transactions = int(budget.get("transactions", 0) or 0)
+        self.default_seconds = float(budget.get("default_minutes", DEFAULT_MODULE_MINUTES)) * 60
+        # Заданные вручную длительности важнее оценок по прошлым запускам
+        self.module_seconds = dict(estimates or {})
+        self.module_seconds.update({module: float(minutes) * 60 for module, minutes in budget.get("module_minutes", {}).items()})
+        self.module_transactions = budget.get("module_transactions", {})
+
+    def sample(self, rng=random):
+        """План для одного аккаунта"""
+        tasks = list(self.initial)
+        other_tasks = []
+        
+        # Выбираем рандомные модули из SWAPS, STAKES и MINT
+        picked = []
+        for enabled, count_min, count_max in self.ranges:
+            if enabled:
+                count = min(rng.randint(count_min, count_max), len(enabled))
+                if count > 0:
+                    chosen = rng.sample(enabled, count)
+                    other_tasks.extend(chosen)
+                    picked.append((chosen, min(count_min, len(enabled)), enabled))
+        
+        other_tasks.extend(self.games)
+        
+        # Добавляем OTHER модули с заданной вероятностью
+        optional = []
+        if self.other and rng.random() * 100 < self.other_probability:
+            optional.append(rng.choice(self.other))
+            other_tasks.append(optional[-1])
+        
+        # Перемешиваем только остальные задачи и добавляем их после начальных
+        rng.shuffle(other_tasks)
+        tasks.extend(other_tasks)
+        
+        # Добавляем collect_all_to_monad с заданной вероятностью
+        if self.collect_probability and rng.random() * 100 < self.collect_probability:
+            tasks.append("collect_all_to_monad")
+            optional.append("collect_all_to_monad")
+        
+        # Всегда добавляем logs в конец
+        if self.logs:
+            tasks.append("logs")
+        
+        if self.budget_seconds or self.budget_transactions:
+            self.fit_budget(tasks, picked, optional)
+        return tasks
+
+    def seconds(self, module):
+        return self.module_seconds.get(module, self.default_seconds)
+
+    def transactions(self, module):
+        return self.module_transactions.get(module, 1)
+
+    def weight(self, module):
+        """Доля бюджета, которую занимает модуль"""
+        weight = 0
+        if self.budget_seconds:
+            weight += self.seconds(module) / self.budget_seconds
+        if self.budget_transactions:
+            weight += self.transactions(module) / self.budget_transactions
+        return weight
+
+    def fit_budget(self, tasks, picked, optional):
+        """Сокращение плана до бюджета аккаунта (на месте)
+
+        Сначала убираются самые тяжелые модули сверх минимума своей категории
+        и необязательные модули (OTHER, collect_all_to_monad), затем тяжелые
+        модули на минимуме заменяются более легкими из той же категории.
+        Минимумы SWAPS, STAKES и MINT не нарушаются, поэтому план может
+        остаться больше бюджета.
+        """
+        def over_budget():
+            if self.budget_seconds and sum(self.seconds(task) for task in tasks) > self.budget_seconds:
+                return True
+            return bool(self.budget_transactions) and sum(self.transactions(task) for task in tasks) > self.budget_transactions
+        
+        while over_budget():
+            removable = [(module, chosen) for chosen, count_min, _ in picked if len(chosen) > count_min for module in chosen]
+            removable += [(module, optional) for module in optional]
+            if removable:
+                module, source = max(removable, key=lambda item: self.weight(item[0]))
+                source.remove(module)
+                tasks.remove(module)
+                continue
+            
+            # Замена самого тяжелого модуля на самый легкий из невыбранных в той же категории
+            best = None
+            for chosen, _, enabled in picked:
+                spare = [module for module in enabled if module not in tasks]
+                if not chosen or not spare:
+                    continue
+                heavy = max(chosen, key=self.weight)
+                light = min(spare, key=self.weight)
+                gain = self.weight(heavy) - self.weight(light)
+                if gain > 0 and (best is None or gain > best[0]):
+                    best = (gain, chosen, heavy, light)
+            if best is None:
+                return
+            _, chosen, heavy, light = best
+            chosen[chosen.index(heavy)] = light
+            tasks[tasks.index(heavy)] = light
+
+def sample_plan_chunk(settings, modules, seed, accounts, estimates=None):
+    """Генерация пачки планов (выполняется в отдельном процессе)"""
+    sampler = TaskSampler(settings, modules, estimates)
+    return [sampler.sample(seeded_rng(seed, account)) for account in accounts]
+
+def build_plans(accounts, settings, modules, seed, workers=None, estimates=None):
+    """Планы для всех аккаунтов за один проход, для больших диапазонов — на всех ядрах"""
+    workers = workers or os.cpu_count() or 1
+    if len(accounts) < PARALLEL_PLANS_THRESHOLD or workers <= 1:
+        return sample_plan_chunk(settings, modules, seed, accounts, estimates), 1
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    chunk = -(-len(accounts) // workers)
+    chunks = [accounts[start:start + chunk] for start in range(0, len(accounts), chunk)]
+    plans = []
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        for part in executor.map(sample_plan_chunk, [settings] * len(chunks), [modules] * len(chunks), [seed] * len(chunks), chunks,
+                                 [estimates] * len(chunks)):
+            plans.extend(part)
+    return plans, len(chunks)
+
+def save_plans(path, accounts, plans, seed, estimates=None):
+    """Сохранение планов: имена модулей хранятся один раз, планы — индексами
+
+    estimates — оценки длительности модулей, по которым сгенерированы планы
+    (записываются рядом с сидом, чтобы запуск можно было повторить).
+    """
+    names = sorted({task for plan in plans for task in plan})
+    index = {name: i for i, name in enumerate(names)}
+    data = {
+        "version": 1,
+        "seed": seed,
+        "estimates": estimates or {},
+        "modules": names,
+        "accounts": accounts,
+        "plans": [[index[task] for task in plan] for plan in plans],
+    }
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(data, file, separators=(",", ":"))
+    os.replace(temp_path, path)
+
+def load_plans(path):
+    """Загрузка plans.json: номер аккаунта -> список задач"""
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    names = data["modules"]
+    return {account: [names[i] for i in plan] for account, plan in zip(data["accounts"], data["plans"])}
+
+def settings_fingerprint(settings, seed=None):
+    """Отпечаток настроек рандомизации и сида запуска: при их изменении
+    сохраненные планы не используются"""
+    import hashlib
+    sampling = {key: settings.get(key) for key in SAMPLING_KEYS}
+    sampling["seed"] = seed
+    return hashlib.sha1(json.dumps(sampling, sort_keys=True).encode()).hexdigest()
+
+def load_module_stats(directory):
+    """Оценки длительности модулей по прошлым запускам (module_stats*.json всех шардов)
+
+    Возвращает {модуль: {"ewma", "p50", "p90", "count"}} в секундах; оценки
+    шардов усредняются с весом по количеству замеров.
+    """
+    merged = {}
+    for name in os.listdir(directory):
+        if not (name.startswith("module_stats") and name.endswith(".json")):
+            continue
+        try:
+            with open(os.path.join(directory, name), "r", encoding="utf-8") as file:
+                modules = json.load(file)["modules"]
+        except (OSError, ValueError, KeyError):
+            continue
+        for module, entry in modules.items():
+            total = merged.setdefault(module, {"ewma": 0.0, "p50": 0.0, "p90": 0.0, "count": 0})
+            count = entry["count"]
+            weight = count / (total["count"] + count) if count else 0
+            for key in ("ewma", "p50", "p90"):
+                total[key] += (entry[key] - total[key]) * weight
+            total["count"] += count
+    return merged
@@ -0,0 +1,1184 @@
+#!/usr/bin/env python3
+"""
+Раннер StarLabs Monad: запуск бота с рандомными задачами для каждого аккаунта
+и/или по расписанию.
+
+Настройки передаются данными (файл, который пишет лаунчер), поэтому модуль
+не генерируется заново при каждом запуске. Пример:
+  python launcher_runner.py --settings run_settings.json --random --schedule schedule.json --seed 42
+"""
+
+import os
+import sys
+import json
+import random
+import asyncio
+import platform
+import time
+import itertools
+import atexit
+import argparse
+import hashlib
+import traceback
+import logging
+import bisect
+
+from launcher_plans import TaskSampler, seeded_rng, load_plans, settings_fingerprint, SAMPLING_KEYS
+
+# Путь к директории проекта
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+logger = logging.getLogger("RandomTasks")
+
+def shard_path(name, shard, shards):
+    """Имя файла шарда: random_tasks_log.txt -> random_tasks_log-1.txt (без шардов — как есть)"""
+    if shards <= 1:
+        return os.path.join(PROJECT_DIR, name)
+    base, ext = os.path.splitext(name)
+    return os.path.join(PROJECT_DIR, f"{base}-{shard}{ext}")
+
+def setup_logging(log_path):
+    """Логирование в консоль и в файл"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_path, mode='w'),
+            logging.StreamHandler()
+        ]
+    )
+
+# Адрес кошелька по приватному ключу (без eth_account — отпечаток ключа)
+wallet_addresses = {}
+
+def wallet_address(private_key):
+    address = wallet_addresses.get(private_key)
+    if address is None:
+        try:
+            from eth_account import Account
+            address = Account.from_key(private_key).address
+        except Exception:
+            address = "key:" + hashlib.sha256(str(private_key).encode()).hexdigest()[:40]
+        wallet_addresses[private_key] = address
+    return address
+
+class PlanCache:
+    """Планы задач по адресам кошельков, сохраняются на диск между перезапусками
+
+    Файл дописывается по строке на план, при загрузке последняя запись побеждает.
+    """
+
+    def __init__(self, path, horizon_hours, fingerprint, compact=True):
+        self.path = path
+        self.horizon = horizon_hours * 3600
+        self.fingerprint = fingerprint
+        # Шарды дописывают файл одновременно, поэтому сжимает его только одиночный раннер
+        self.compact = compact
+        self.plans = {}
+        self.load()
+
+    def valid(self, entry, now):
+        return now - entry["created"] < self.horizon and entry.get("settings") == self.fingerprint
+
+    def load(self):
+        if self.horizon <= 0 or not os.path.exists(self.path):
+            return
+        lines = 0
+        with open(self.path, "r", encoding="utf-8") as file:
+            for line in file:
+                lines += 1
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Недописанная строка после аварийного завершения
+                    continue
+                self.plans[entry["wallet"]] = entry
+
+        now = time.time()
+        self.plans = {wallet: entry for wallet, entry in self.plans.items() if self.valid(entry, now)}
+        logger.info(f"Загружено сохраненных планов: {len(self.plans)}")
+
+        # Сжимаем файл, если в нем накопились устаревшие записи
+        if self.compact and lines > 2 * len(self.plans) + 100:
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                for entry in self.plans.values():
+                    file.write(json.dumps(entry) + "\n")
+            os.replace(temp_path, self.path)
+
+    def get(self, wallet):
+        entry = self.plans.get(wallet)
+        if entry is not None and self.valid(entry, time.time()):
+            return entry["tasks"]
+        return None
+
+    def put(self, wallet, tasks):
+        entry = {"wallet": wallet, "tasks": tasks, "created": time.time(), "settings": self.fingerprint}
+        self.plans[wallet] = entry
+        if self.horizon > 0:
+            with open(self.path, "a", encoding="utf-8") as file:
+                file.write(json.dumps(entry) + "\n")
+
+class TaskJournal:
+    """Журнал выполненных задач (строка на задачу)
+
+    Строки пишутся сразу, а fsync делается пачками — по количеству записей
+    или по времени, и при выходе.
+    """
+
+    def __init__(self, path, resume, batch_size=50, sync_interval=2.0):
+        self.path = path
+        self.directory = os.path.dirname(path)
+        self.batch_size = batch_size
+        self.sync_interval = sync_interval
+        self.completed = set()
+        self.pending = 0
+        self.last_sync = time.monotonic()
+        torn_tail = False
+
+        if resume:
+            torn_tail = self.load()
+        elif os.path.exists(path):
+            # Новый запуск: предыдущий журнал сохраняем рядом
+            os.replace(path, path + ".prev")
+        self.file = open(path, "a", encoding="utf-8")
+        if torn_tail:
+            # Завершаем недописанную строку, чтобы не склеить ее с новой записью
+            self.file.write("\n")
+        atexit.register(self.close)
+
+    def load(self):
+        # Читаем журналы всех шардов: количество процессов могло измениться
+        paths = [os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                 if name.startswith("task_journal") and name.endswith(".jsonl")]
+        if not paths:
+            logger.info("Журнал задач не найден, продолжать нечего")
+            return False
+        torn_tail = False
+        for path in paths:
+            line = "\n"
+            with open(path, "r", encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Недописанная строка после аварийного завершения
+                        continue
+                    if entry["status"] == "ok":
+                        self.completed.add((entry["wallet"], entry["index"], entry["task"]))
+            if path == self.path:
+                torn_tail = not line.endswith("\n")
+        logger.info(f"Продолжение по журналу: уже выполнено задач — {len(self.completed)}")
+        return torn_tail
+
+    def is_done(self, wallet, index, task):
+        return (wallet, index, task) in self.completed
+
+    def record(self, account_index, wallet, index, task, status):
+        entry = {"account": account_index, "wallet": wallet, "index": index, "task": task, "status": status, "ts": round(time.time(), 3)}
+        self.file.write(json.dumps(entry) + "\n")
+        # Строка сразу уходит в ОС (переживет завершение процесса), fsync — пачками
+        self.file.flush()
+        self.pending += 1
+        if self.pending >= self.batch_size or time.monotonic() - self.last_sync >= self.sync_interval:
+            self.sync()
+
+    def sync(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.pending = 0
+        self.last_sync = time.monotonic()
+
+    def close(self):
+        if not self.file.closed:
+            self.sync()
+            self.file.close()
+
+class TaskMetrics:
+    """Длительность и результаты задач по модулям
+
+    Запись задачи — несколько операций со словарями; файлы метрик
+    (JSON и текстовый формат Prometheus) перезаписываются не чаще раза
+    в interval секунд и при выходе. Итоги по аккаунтам растут с их
+    количеством, поэтому попадают в JSON только при выходе.
+    """
+
+    # Верхние границы корзин гистограммы длительности (в секундах)
+    BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600, 1800)
+
+    def __init__(self, path, shard=0, interval=15.0):
+        self.path = path
+        self.shard = shard
+        self.interval = interval
+        self.modules = {}
+        self.accounts = {}
+        self.last_write = time.monotonic()
+        atexit.register(self.write, final=True)
+
+    def record(self, account_index, task, status, seconds):
+        module = task if isinstance(task, str) else "|".join(map(str, task))
+        stats = self.modules.get(module)
+        if stats is None:
+            stats = self.modules[module] = {"ok": 0, "failed": 0, "error": 0, "seconds": 0.0, "max": 0.0, "buckets": [0] * (len(self.BUCKETS) + 1)}
+        stats[status] += 1
+        stats["seconds"] += seconds
+        if seconds > stats["max"]:
+            stats["max"] = seconds
+        stats["buckets"][bisect.bisect_left(self.BUCKETS, seconds)] += 1
+
+        account = self.accounts.get(account_index)
+        if account is None:
+            account = self.accounts[account_index] = {"tasks": 0, "failed": 0, "seconds": 0.0}
+        account["tasks"] += 1
+        if status != "ok":
+            account["failed"] += 1
+        account["seconds"] += seconds
+
+        if time.monotonic() - self.last_write >= self.interval:
+            self.write()
+
+    def prometheus(self):
+        """Метрики в текстовом формате Prometheus (для textfile-коллектора)"""
+        lines = [
+            "# HELP starlabs_task_duration_seconds Длительность задач по модулям",
+            "# TYPE starlabs_task_duration_seconds histogram",
+        ]
+        for module, stats in sorted(self.modules.items()):
+            labels = f'module="{module}",shard="{self.shard}"'
+            cumulative = 0
+            for bound, count in zip(self.BUCKETS + ("+Inf",), stats["buckets"]):
+                cumulative += count
+                lines.append(f'starlabs_task_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"starlabs_task_duration_seconds_sum{{{labels}}} {stats['seconds']:.3f}")
+            lines.append(f"starlabs_task_duration_seconds_count{{{labels}}} {cumulative}")
+        lines.append("# HELP starlabs_tasks_total Количество задач по модулям и результату")
+        lines.append("# TYPE starlabs_tasks_total counter")
+        for module, stats in sorted(self.modules.items()):
+            for status in ("ok", "failed", "error"):
+                lines.append(f'starlabs_tasks_total{{module="{module}",shard="{self.shard}",status="{status}"}} {stats[status]}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, final=False):
+        self.last_write = time.monotonic()
+        if not self.modules:
+            return
+        data = {
+            "updated": round(time.time(), 3),
+            "shard": self.shard,
+            "buckets": list(self.BUCKETS),
+            "modules": self.modules,
+        }
+        if final:
+            data["accounts"] = self.accounts
+        base = os.path.splitext(self.path)[0]
+        for path, text in ((self.path, json.dumps(data)), (base + ".prom", self.prometheus())):
+            # Атомарная замена: сборщик не увидит недописанный файл
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                file.write(text)
+            os.replace(tmp_path, path)
+
+class ModuleStats:
+    """Оценки длительности модулей между запусками (module_stats.json)
+
+    Для каждого модуля — экспоненциальное скользящее среднее и перцентили по
+    последним WINDOW замерам: выполнение задачи вместе с паузой после нее.
+    Файл загружается при старте и перезаписывается не чаще раза в interval
+    секунд и при выходе.
+    """
+
+    ALPHA = 0.2
+    WINDOW = 100
+
+    def __init__(self, path, interval=60.0):
+        self.path = path
+        self.interval = interval
+        self.modules = {}
+        self.changed = False
+        self.last_write = time.monotonic()
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                self.modules = json.load(file)["modules"]
+        except (OSError, ValueError, KeyError):
+            pass
+        atexit.register(self.write)
+
+    def record(self, task, seconds):
+        module = task if isinstance(task, str) else "|".join(map(str, task))
+        entry = self.modules.get(module)
+        if entry is None:
+            entry = self.modules[module] = {"ewma": seconds, "count": 0, "samples": []}
+        entry["ewma"] += (seconds - entry["ewma"]) * self.ALPHA
+        entry["count"] += 1
+        entry["samples"] = entry["samples"][-(self.WINDOW - 1):] + [round(seconds, 2)]
+        self.changed = True
+        if time.monotonic() - self.last_write >= self.interval:
+            self.write()
+
+    def write(self):
+        self.last_write = time.monotonic()
+        if not self.changed:
+            return
+        for entry in self.modules.values():
+            samples = sorted(entry["samples"])
+            entry["p50"] = samples[len(samples) // 2]
+            entry["p90"] = samples[min(len(samples) - 1, len(samples) * 9 // 10)]
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump({"version": 1, "modules": self.modules}, file)
+        os.replace(temp_path, self.path)
+        self.changed = False
+
+def try_lock_file(path):
+    """Открытый файл с захваченной блокировкой или None, если его держит другой"""
+    file = open(path, "a+b")
+    try:
+        if platform.system() == "Windows":
+            import msvcrt
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return file
+    except OSError:
+        file.close()
+        return None
+
+def unlock_file(file):
+    if platform.system() == "Windows":
+        import msvcrt
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+    file.close()
+
+class SharedSlots:
+    """K мест модуля, общих для всех процессов-шардов
+
+    Место — файл <модуль>-<i>.lock в каталоге directory, занятое место —
+    удерживаемая блокировка файла. ОС снимает блокировки при завершении
+    процесса, поэтому места упавшего шарда освобождаются сами. Интерфейс —
+    как у asyncio.Semaphore (acquire, release, locked).
+    """
+
+    # Как часто (в секундах) проверять, не освободилось ли место в другом процессе
+    POLL_INTERVAL = 0.5
+
+    def __init__(self, directory, module, limit):
+        self.paths = [os.path.join(directory, f"{module}-{i}.lock") for i in range(limit)]
+        # Внутри процесса больше K аккаунтов не ждут места у файлов
+        self.local = asyncio.Semaphore(limit)
+        self.held = []
+
+    def try_acquire(self):
+        for path in self.paths:
+            file = try_lock_file(path)
+            if file is not None:
+                self.held.append(file)
+                return True
+        return False
+
+    async def acquire(self):
+        await self.local.acquire()
+        try:
+            while not self.try_acquire():
+                await asyncio.sleep(self.POLL_INTERVAL)
+        except BaseException:
+            self.local.release()
+            raise
+
+    def release(self):
+        # Места равноценны: освобождается любое из занятых
+        unlock_file(self.held.pop())
+        self.local.release()
+
+    def locked(self):
+        """Все места заняты — в этом процессе или в других шардах"""
+        if self.local.locked():
+            return True
+        if self.try_acquire():
+            unlock_file(self.held.pop())
+            return False
+        return True
+
+class ModuleLimiter:
+    """Ограничение количества аккаунтов, одновременно выполняющих модуль
+
+    limits — {модуль: K}; модули без ограничения (или с K <= 0) не ждут.
+    Лимит общий для всех процессов: при shards > 1 места модуля — блокировки
+    файлов в lock_dir (SharedSlots), и одновременно модуль выполняют не
+    больше K аккаунтов всех шардов.
+    """
+
+    def __init__(self, limits, shards=1, lock_dir=None):
+        self.limits = {module: int(limit) for module, limit in (limits or {}).items() if int(limit) > 0}
+        self.lock_dir = None
+        if shards > 1 and self.limits:
+            self.lock_dir = lock_dir or os.path.join(PROJECT_DIR, "module_locks")
+            os.makedirs(self.lock_dir, exist_ok=True)
+        self.semaphores = {}
+
+    def semaphore(self, task):
+        if not isinstance(task, str) or task not in self.limits:
+            return None
+        semaphore = self.semaphores.get(task)
+        if semaphore is None:
+            if self.lock_dir is not None:
+                semaphore = SharedSlots(self.lock_dir, task, self.limits[task])
+            else:
+                semaphore = asyncio.Semaphore(self.limits[task])
+            self.semaphores[task] = semaphore
+        return semaphore
+
+    def busy(self, task):
+        """Все места модуля заняты"""
+        semaphore = self.semaphore(task)
+        return semaphore is not None and semaphore.locked()
+
+    def next_task(self, pending, movable):
+        """Позиция следующей задачи в pending
+
+        Если у первой задачи заняты все места, берется первая свободная из
+        movable — перемешанной середины плана (начальные модули и
+        collect_all_to_monad/logs в конце не переставляются).
+        """
+        if not self.limits or not self.busy(pending[0][1]) or pending[0][0] not in movable:
+            return 0
+        for position, (index, task) in enumerate(pending):
+            if index in movable and not self.busy(task):
+                return position
+        return 0
+
+class PlanSource:
+    """Выбор плана аккаунта: кэш по кошельку, затем plans.json, иначе генерация
+
+    Кэш действует только для того же сида: перезапуск раннера продолжает
+    прежние планы, а запуск с другим сидом выполняет планы из своего
+    plans.json. Пока планы не устарели, лаунчер запускает раннер с их сидом.
+
+    Если задан watch_path, изменения настроек рандомизации в этом файле
+    применяются к аккаунтам, которые еще не запускались.
+    """
+
+    # Как часто (в секундах) проверять время изменения файла настроек
+    RELOAD_INTERVAL = 5
+
+    def __init__(self, settings, modules, seed=None, plans_path=None, accounts=None, compact=True, watch_path=None, estimates=None):
+        self.sampler = TaskSampler(settings, modules, estimates)
+        self.settings = settings
+        self.modules = modules
+        self.estimates = estimates
+        self.seed = seed
+        self.watch_path = watch_path
+        # Первая проверка — сразу: после перезапуска раннера файл мог уже измениться
+        self.watch_checked = time.monotonic() - self.RELOAD_INTERVAL
+        self.watch_mtime = None
+        self.cache = PlanCache(os.path.join(PROJECT_DIR, "random_tasks_cache.jsonl"), settings.get("plan_cache_hours", 24),
+                               settings_fingerprint(settings, seed), compact)
+        self.precomputed = {}
+        if plans_path:
+            try:
+                self.precomputed = load_plans(plans_path)
+                if accounts is not None:
+                    # Шард хранит только планы своих аккаунтов
+                    own = set(accounts)
+                    self.precomputed = {account: tasks for account, tasks in self.precomputed.items() if account in own}
+                logger.info(f"Загружено заранее сгенерированных планов: {len(self.precomputed)}")
+            except (OSError, ValueError, KeyError) as e:
+                logger.error(f"Не удалось загрузить планы из {plans_path}: {e}")
+
+    def merge(self, changed):
+        """Настройки из файла поверх текущих (как при загрузке в лаунчере):
+        разделов, которых нет в файле старого формата, изменения не касаются"""
+        settings = dict(self.settings)
+        for key in SAMPLING_KEYS:
+            if isinstance(changed.get(key), dict):
+                settings[key] = {**(self.settings.get(key) or {}), **changed[key]}
+        return settings
+
+    def reload(self):
+        """Перечитать настройки рандомизации, если файл изменился (не чаще RELOAD_INTERVAL)"""
+        now = time.monotonic()
+        if not self.watch_path or now - self.watch_checked < self.RELOAD_INTERVAL:
+            return
+        self.watch_checked = now
+        try:
+            mtime = os.stat(self.watch_path).st_mtime_ns
+        except OSError:
+            return
+        if mtime == self.watch_mtime:
+            return
+        
+        try:
+            with open(self.watch_path, "r", encoding="utf-8") as file:
+                settings = self.merge(json.load(file))
+            sampler = TaskSampler(settings, self.modules, self.estimates)
+            fingerprint = settings_fingerprint(settings, self.seed)
+        except (OSError, ValueError, KeyError) as e:
+            # Файл мог быть прочитан в момент записи — повторим при следующей проверке
+            logger.warning(f"Не удалось перечитать настройки из {self.watch_path}: {e}")
+            return
+        self.watch_mtime = mtime
+        if fingerprint == self.cache.fingerprint:
+            return
+        
+        # Планы уже запущенных аккаунтов (они в кэше) не меняются, заранее
+        # сгенерированные планы остальных аккаунтов сделаны по старым настройкам
+        for entry in self.cache.plans.values():
+            entry["settings"] = fingerprint
+        self.sampler = sampler
+        self.settings = settings
+        self.cache.fingerprint = fingerprint
+        self.precomputed = {}
+        logger.info("Настройки рандомизации изменены: новые планы для еще не запущенных аккаунтов")
+
+    def get(self, account_index, wallet):
+        """Возвращает (задачи, источник)"""
+        self.reload()
+        tasks = self.cache.get(wallet)
+        if tasks is not None:
+            return tasks, "cache"
+
+        tasks = self.precomputed.get(account_index)
+        source = "plans"
+        if tasks is None:
+            # Без сида план берется из общего генератора random
+            tasks = self.sampler.sample(seeded_rng(self.seed, account_index) if self.seed is not None else random)
+            source = "generated"
+        self.cache.put(wallet, tasks)
+        return tasks, source
+
+def patch_start_module(plan_source, journal, metrics, module_stats, limiter, controller=None):
+    """Патч Start.flow: задачи аккаунта берутся из его плана, а не из tasks.py"""
+    try:
+        # Импортируем модуль start
+        from src.model import start
+
+        # Счетчик для аккаунтов, у которых Start не задал account_index
+        account_counter = itertools.count()
+        initial_modules = set(plan_source.modules.get("INITIAL", []))
+
+        async def patched_flow(self):
+            try:
+                monad = start.MonadXYZ(
+                    self.account_index,
+                    self.proxy,
+                    self.private_key,
+                    self.discord_token,
+                    self.config,
+                    self.session,
+                )
+
+                if "farm_faucet" in self.config.FLOW.TASKS:
+                    await monad.faucet()
+                    return True
+
+                wallet = wallet_address(self.private_key)
+                tasks, source = plan_source.get(self.account_index, wallet)
+                if source == "cache":
+                    logger.info(f"[{self.account_index}] Используется сохраненный план для {wallet}")
+                else:
+                    title = "Сгенерированы задачи" if source == "generated" else "Заранее сгенерированные задачи"
+                    formatted_tasks = str(tasks).replace("'", '"')
+                    print(f"\n{title} для аккаунта {self.account_index}:\n{formatted_tasks}\n")
+                    logger.info(f"{title} для аккаунта {self.account_index}: {tasks}")
+
+                task_plan_msg = [f"{i}. {task}" for i, task in enumerate(tasks, start=1)]
+                logger.info(
+                    f"[{self.account_index}] Task execution plan: {' | '.join(task_plan_msg)}"
+                )
+
+                pending = []
+                for i, task in enumerate(tasks, start=1):
+                    if journal.is_done(wallet, i, task):
+                        logger.info(f"[{self.account_index}] Task {i}: {task} already completed, skipping")
+                        continue
+                    pending.append((i, task))
+
+                # Середина плана (между начальными модулями и collect_all_to_monad/logs)
+                # перемешана при генерации, поэтому ее можно переставлять
+                head = 0
+                while head < len(tasks) and isinstance(tasks[head], str) and tasks[head] in initial_modules:
+                    head += 1
+                tail = len(tasks)
+                while tail > head and tasks[tail - 1] in ("collect_all_to_monad", "logs"):
+                    tail -= 1
+                movable = range(head + 1, tail + 1)
+
+                while pending:
+                    i, task = pending.pop(limiter.next_task(pending, movable))
+                    semaphore = limiter.semaphore(task)
+                    if semaphore is not None:
+                        await semaphore.acquire()
+
+                    logger.info(f"[{self.account_index}] Executing task {i}: {task}")
+                    started = time.perf_counter()
+                    try:
+                        result = await self.execute_task(task, monad)
+                    except Exception:
+                        metrics.record(self.account_index, task, "error", time.perf_counter() - started)
+                        journal.record(self.account_index, wallet, i, task, "error")
+                        if controller is not None:
+                            controller.record_task(False)
+                        raise
+                    finally:
+                        if semaphore is not None:
+                            semaphore.release()
+                    status = "failed" if result is False else "ok"
+                    metrics.record(self.account_index, task, status, time.perf_counter() - started)
+                    journal.record(self.account_index, wallet, i, task, status)
+                    if controller is not None:
+                        controller.record_task(status == "ok")
+                    await self.sleep(task)
+                    module_stats.record(task, time.perf_counter() - started)
+
+                return True
+            except Exception as e:
+                logger.error(f"[{self.account_index}] | Error: {e}")
+                return False
+
+        original_init = start.Start.__init__
+
+        def patched_init(self, *args, **kwargs):
+            original_init(self, *args, **kwargs)
+
+            # Индекс аккаунта из Start не перезаписываем, счетчик — только если его нет
+            if "account_index" not in self.__dict__:
+                self.account_index = next(account_counter)
+
+        start.Start.__init__ = patched_init
+        start.Start.flow = patched_flow
+
+        logger.info("Модуль start успешно пропатчен")
+        return True
+    except Exception as e:
+        logger.error(f"Ошибка при патче модуля start: {e}")
+        logger.error(traceback.format_exc())
+        return False
+
+def patch_config_module():
+    """Патч Config: задачи из tasks.py не нужны, они заменяются в Start.flow"""
+    try:
+        from src.utils import config
+
+        original_load = config.Config.load
+
+        def patched_load(cls):
+            try:
+                # Пытаемся загрузить конфигурацию обычным способом
+                return original_load.__func__(cls)
+            except Exception as e:
+                logger.info(f"Перехвачена ошибка при загрузке конфигурации: {e}")
+                # Возвращаем конфигурацию с пустыми задачами
+                config_obj = cls()
+                config_obj.preset = "CUSTOM_TASK"
+                return config_obj
+
+        def patched_get_tasks(self):
+            # Возвращаем пустой список задач, который будет заменен в методе flow
+            return []
+
+        config.Config.load = classmethod(patched_load)
+        config.Config.get_tasks = patched_get_tasks
+
+        logger.info("Модуль config успешно пропатчен")
+        return True
+    except Exception as e:
+        logger.error(f"Ошибка при патче модуля config: {e}")
+        logger.error(traceback.format_exc())
+        return False
+
+def patch_config_accounts(accounts, shards):
+    """Патч Config.load: бот запускает только аккаунты шарда
+
+    THREADS делится между шардами, чтобы всего одновременно работало
+    не больше аккаунтов, чем указано в config.yaml.
+    """
+    try:
+        from src.utils import config
+
+        original_load = config.Config.load
+
+        def patched_load(cls, *args, **kwargs):
+            config_obj = original_load.__func__(cls, *args, **kwargs)
+            settings = config_obj.SETTINGS
+            settings.ACCOUNTS_RANGE = type(settings.ACCOUNTS_RANGE)((0, 0))
+            settings.EXACT_ACCOUNTS_TO_USE = list(accounts)
+            settings.THREADS = max(1, -(-int(settings.THREADS) // shards))
+            return config_obj
+
+        config.Config.load = classmethod(patched_load)
+        return True
+    except Exception as e:
+        print(f"Ошибка при патче модуля config для шарда: {e}")
+        print(traceback.format_exc())
+        return False
+
+def patch_config_threads(threads):
+    """Патч Config.load: THREADS задает регулятор параллельности (верхняя граница)"""
+    try:
+        from src.utils import config
+
+        original_load = config.Config.load
+
+        def patched_load(cls, *args, **kwargs):
+            config_obj = original_load.__func__(cls, *args, **kwargs)
+            config_obj.SETTINGS.THREADS = threads
+            return config_obj
+
+        config.Config.load = classmethod(patched_load)
+        return True
+    except Exception as e:
+        print(f"Ошибка при патче THREADS в модуле config: {e}")
+        print(traceback.format_exc())
+        return False
+
+class ConcurrencyController:
+    """Регулятор количества одновременно работающих аккаунтов (AIMD)
+
+    После каждых window завершенных аккаунтов лимит умножается на decrease,
+    если доля успешных аккаунтов или задач (record_task) ниже target_success
+    или медианная длительность аккаунта выше target_latency (0 — не
+    учитывается). Иначе лимит растет на 1, но только если за окно все места
+    были заняты: пока лимит не мешает, повышать его незачем.
+    """
+
+    def __init__(self, initial, minimum, maximum, target_success=0.9, target_latency=0, window=10, decrease=0.5):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(self.maximum, max(self.minimum, initial))
+        self.target_success = target_success
+        self.target_latency = target_latency
+        self.window = max(1, window)
+        self.decrease = decrease
+        self.in_flight = 0
+        self.outcomes = []
+        # Задачи за окно и были ли заняты все места
+        self.tasks = 0
+        self.failed_tasks = 0
+        self.saturated = False
+        self.condition = None
+
+    async def acquire(self):
+        # Условие создается в работающем цикле событий бота
+        if self.condition is None:
+            self.condition = asyncio.Condition()
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+            if self.in_flight >= self.limit:
+                self.saturated = True
+
+    def record_task(self, ok):
+        """Результат задачи: ошибки RPC и лимитов обычно не завершают аккаунт с ошибкой"""
+        self.tasks += 1
+        if not ok:
+            self.failed_tasks += 1
+
+    async def release(self, ok, seconds):
+        async with self.condition:
+            self.in_flight -= 1
+            self.outcomes.append((ok, seconds))
+            if len(self.outcomes) >= self.window:
+                self.adjust()
+            self.condition.notify_all()
+
+    def adjust(self):
+        success = sum(ok for ok, _ in self.outcomes) / len(self.outcomes)
+        if self.tasks:
+            success = min(success, 1 - self.failed_tasks / self.tasks)
+        latency = sorted(seconds for _, seconds in self.outcomes)[len(self.outcomes) // 2]
+        saturated = self.saturated
+        self.outcomes = []
+        self.tasks = self.failed_tasks = 0
+        self.saturated = self.in_flight >= self.limit
+        healthy = success >= self.target_success and (not self.target_latency or latency <= self.target_latency)
+        if not healthy:
+            limit = max(self.minimum, int(self.limit * self.decrease))
+        elif saturated:
+            limit = min(self.maximum, self.limit + 1)
+        else:
+            limit = self.limit
+        if limit != self.limit:
+            print(f"Параллельность: {self.limit} -> {limit} (успешно {success:.0%}, медиана {latency:.0f} с)")
+            self.limit = limit
+
+def load_schedule(path):
+    """Смещения запуска (в секундах от первого аккаунта) из schedule.json"""
+    with open(path, "r", encoding="utf-8") as file:
+        schedule_data = json.load(file)
+    if isinstance(schedule_data, list):
+        # Старый формат: список смещений от начала
+        return schedule_data
+    # Компактный формат: интервалы между запусками, первый аккаунт — сразу
+    return [0] + list(itertools.accumulate(schedule_data["gaps"]))
+
+# Часы для дедлайнов расписания: не зависят от перевода системного времени
+# (NTP, ручная установка) и продолжают идти во время сна системы.
+# Linux — CLOCK_BOOTTIME; macOS — CLOCK_MONOTONIC (в отличие от time.monotonic()
+# учитывает сон); Windows — time.monotonic() (QueryPerformanceCounter/GetTickCount64
+# учитывают сон)
+if hasattr(time, "CLOCK_BOOTTIME"):
+    def schedule_clock():
+        return time.clock_gettime(time.CLOCK_BOOTTIME)
+elif sys.platform == "darwin":
+    def schedule_clock():
+        return time.clock_gettime(time.CLOCK_MONOTONIC)
+else:
+    schedule_clock = time.monotonic
+
+# Ждем короткими шагами: таймеры asyncio идут по monotonic и после сна системы
+# могут "проспать" дедлайн, поэтому после каждого шага сверяемся с часами
+MAX_SLEEP_STEP = 30
+# Опоздание (в секундах), после которого запуск считается несвоевременным
+LATE_THRESHOLD = 5
+
+class ScheduleDispatcher:
+    """Запуск аккаунтов по абсолютным дедлайнам: начало работы + смещение из schedule.json"""
+
+    def __init__(self, offsets, elapsed=0, skip_started=False):
+        self.offsets = offsets
+        # После перезапуска: сколько секунд расписания уже прошло и пропускать ли
+        # аккаунты, чей слот уже наступил (без журнала задач их нельзя продолжить)
+        self.elapsed = elapsed
+        self.skip_started = skip_started
+        self.start = None
+        self.next_slot = 0
+        self.report = []
+
+    def now(self):
+        return schedule_clock()
+
+    def take_slot(self):
+        """Выдача следующего слота расписания в порядке обращения аккаунтов"""
+        if self.start is None:
+            # Отсчет начинается с первого аккаунта, а не с загрузки скрипта
+            self.start = self.now()
+        slot = self.next_slot
+        self.next_slot += 1
+        return slot
+
+    async def sleep_until(self, deadline):
+        while True:
+            remaining = deadline - self.now()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(remaining, MAX_SLEEP_STEP))
+
+    def started_before_restart(self, slot):
+        """Слот наступил до перезапуска раннера, и аккаунт нужно пропустить"""
+        return self.skip_started and slot < len(self.offsets) and self.offsets[slot] < self.elapsed
+
+    async def wait_for_slot(self, slot, account_index):
+        """Ожидание дедлайна слота и учет опоздания"""
+        if slot >= len(self.offsets):
+            print(f"Аккаунт {account_index} (#{slot+1}) вне расписания, запуск сразу")
+            return
+
+        offset = self.offsets[slot]
+        deadline = self.start + max(0, offset - self.elapsed)
+        remaining = max(0, int(deadline - self.now()))
+        if remaining > 0:
+            hours = remaining // 3600
+            minutes = (remaining % 3600) // 60
+            seconds = remaining % 60
+            print(f"Ожидание перед запуском аккаунта {account_index} (#{slot+1}): {hours}ч {minutes}м {seconds}с")
+
+        await self.sleep_until(deadline)
+
+        lateness = self.now() - deadline
+        self.report.append({"slot": slot, "account": account_index, "offset": offset, "lateness": round(lateness, 3)})
+        if lateness > LATE_THRESHOLD:
+            print(f"Аккаунт {account_index} (#{slot+1}) запущен с опозданием {lateness:.1f}с")
+        else:
+            print(f"Запуск аккаунта {account_index} (#{slot+1}) по расписанию")
+
+    def save_report(self, path):
+        """Сохранение отчета об опозданиях по слотам"""
+        if not self.report:
+            return
+        lateness = sorted(entry["lateness"] for entry in self.report)
+        summary = {
+            "slots": len(self.report),
+            "late": sum(1 for value in lateness if value > LATE_THRESHOLD),
+            "max_lateness": lateness[-1],
+            "mean_lateness": round(sum(lateness) / len(lateness), 3),
+            "p95_lateness": lateness[min(len(lateness) - 1, int(len(lateness) * 0.95))],
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"summary": summary, "slots": self.report}, file, separators=(",", ":"))
+        print(f"Опоздания по расписанию: {summary} (отчет: {path})")
+
+def patch_process_module(dispatcher=None, controller=None):
+    """Патч account_flow: каждый аккаунт ждет свой абсолютный дедлайн (по расписанию),
+    затем место у регулятора параллельности"""
+    try:
+        import process
+
+        original_account_flow = process.account_flow
+
+        async def patched_account_flow(account_index, proxy, private_key, discord_token, twitter_token, email, config, lock, progress_tracker):
+            if dispatcher is not None:
+                slot = dispatcher.take_slot()
+                if dispatcher.started_before_restart(slot):
+                    print(f"Аккаунт {account_index} (#{slot+1}) запускался до перезапуска, пропускаем")
+                    return None
+                await dispatcher.wait_for_slot(slot, account_index)
+
+            # Вызываем оригинальный метод со всеми параметрами
+            if controller is None:
+                return await original_account_flow(account_index, proxy, private_key, discord_token, twitter_token, email, config, lock, progress_tracker)
+
+            await controller.acquire()
+            started = time.monotonic()
+            ok = False
+            try:
+                result = await original_account_flow(account_index, proxy, private_key, discord_token, twitter_token, email, config, lock, progress_tracker)
+                ok = result is not False
+                return result
+            finally:
+                await controller.release(ok, time.monotonic() - started)
+
+        process.account_flow = patched_account_flow
+
+        if dispatcher is not None:
+            print("Модуль process.py успешно пропатчен для работы с расписанием")
+        if controller is not None:
+            print(f"Регулятор параллельности: от {controller.minimum} до {controller.maximum} аккаунтов, начало — {controller.limit}")
+        return True
+    except Exception as e:
+        print(f"Ошибка при патче модуля process.py: {e}")
+        print(traceback.format_exc())
+        return False
+
+class RunProfiler:
+    """Профилирование запуска бота
+
+    cprofile — детерминированный профиль в .pstats (для pstats/snakeviz),
+    sampling — сэмплирование стека основного потока в .collapsed
+    (формат flamegraph.pl/speedscope), с меньшими накладными расходами.
+    """
+
+    def __init__(self, mode, path, interval=0.005):
+        self.mode = mode
+        self.path = path
+        self.interval = interval
+        self.profile = None
+        self.sampler = None
+        self.samples = {}
+
+    def start(self):
+        if self.mode == "cprofile":
+            import cProfile
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        else:
+            import threading
+            self.thread_id = threading.get_ident()
+            self.stopped = threading.Event()
+            self.sampler = threading.Thread(target=self.sample_loop, daemon=True)
+            self.sampler.start()
+        print(f"Профилирование ({self.mode}) включено")
+
+    def sample_loop(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            key = ";".join(reversed(stack))
+            self.samples[key] = self.samples.get(key, 0) + 1
+
+    def stop(self):
+        """Остановка и сохранение результата (повторный вызов ничего не делает)"""
+        if self.profile is not None:
+            self.profile.disable()
+            path = self.path + ".pstats"
+            self.profile.dump_stats(path)
+            self.profile = None
+        elif self.sampler is not None:
+            self.stopped.set()
+            self.sampler.join()
+            self.sampler = None
+            path = self.path + ".collapsed"
+            with open(path, "w", encoding="utf-8") as file:
+                for stack, count in sorted(self.samples.items(), key=lambda item: -item[1]):
+                    file.write(f"{stack} {count}\n")
+        else:
+            return
+        print(f"Профиль сохранен в {path}")
+
+def patch_profile_limit(profiler, limit):
+    """Профилирование только первых limit аккаунтов: профиль сохраняется, когда они завершены"""
+    try:
+        from src.model import start
+
+        original_flow = start.Start.flow
+        finished = itertools.count(1)
+
+        async def limited_flow(self):
+            try:
+                return await original_flow(self)
+            finally:
+                if next(finished) == limit:
+                    profiler.stop()
+
+        start.Start.flow = limited_flow
+        return True
+    except Exception as e:
+        print(f"Не удалось ограничить профилирование аккаунтами: {e}")
+        return False
+
+def inject_tasks_module(custom_task):
+    """Модуль tasks с общим планом в CUSTOM_TASK: бот импортирует его вместо tasks.py
+
+    Выбранный пресет — CUSTOM_TASK (как в temp_tasks.py раньше), остальные
+    пресеты берутся из tasks.py, сам файл не меняется.
+    """
+    import importlib.util
+    spec = importlib.util.spec_from_file_location("tasks", os.path.join(PROJECT_DIR, "tasks.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.TASKS = ["CUSTOM_TASK"]
+    module.CUSTOM_TASK = custom_task
+    sys.modules["tasks"] = module
+
+def run(settings, modules, *, random_tasks=False, schedule_path=None, seed=None, plans_path=None, resume=False, shared_tasks=None,
+        accounts=None, shard=0, shards=1, elapsed=0, profile=None, profile_accounts=0, settings_path=None, estimates=None):
+    """Запуск бота с рандомными задачами для каждого аккаунта и/или по расписанию
+
+    settings — настройки в формате launcher_settings.json, modules — каталог
+    модулей из tasks.py; остальные параметры передаются только по имени.
+    shared_tasks — общий план для всех аккаунтов.
+    При shards > 1 раннер берет каждый shards-й аккаунт из accounts и слот
+    расписания, начиная с shard. elapsed — сколько секунд расписания прошло
+    до перезапуска раннера. profile — режим профилирования (cprofile или
+    sampling), profile_accounts — профилировать только первые N аккаунтов.
+    settings_path — файл настроек лаунчера: его изменения применяются к еще
+    не запущенным аккаунтам. estimates — ожидаемые длительности модулей
+    (в секундах) для бюджета аккаунта. Возвращает код выхода.
+    """
+    # Исправляем SelectorEventLoop на Windows
+    if platform.system() == "Windows":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+    sys.path.insert(0, PROJECT_DIR)
+
+    shard_accounts = None
+    if shards > 1:
+        shard_accounts = accounts[shard::shards]
+        print(f"Шард {shard + 1}/{shards}: аккаунтов — {len(shard_accounts)}")
+        if not patch_config_accounts(shard_accounts, shards):
+            return 1
+
+    dispatcher = None
+    if schedule_path:
+        try:
+            offsets = load_schedule(schedule_path)[shard::shards]
+            print(f"Загружено расписание с {len(offsets)} задержками")
+        except Exception as e:
+            print(f"Ошибка при загрузке расписания: {e}")
+            print(traceback.format_exc())
+            return 1
+
+        print("=== Запуск аккаунтов по расписанию ===")
+        if elapsed:
+            print(f"Продолжение расписания после перезапуска: прошло {elapsed // 60} мин")
+        # Без журнала (общие или обычные задачи) уже запускавшиеся аккаунты не повторяем
+        dispatcher = ScheduleDispatcher(offsets, elapsed, skip_started=not random_tasks)
+
+    # Регулятор параллельности: THREADS бота — только верхняя граница
+    controller = None
+    concurrency = settings.get("concurrency") or {}
+    if concurrency.get("enabled"):
+        controller = ConcurrencyController(
+            -(-concurrency["initial"] // shards), -(-concurrency["min"] // shards), -(-concurrency["max"] // shards),
+            concurrency.get("target_success", 0.9), concurrency.get("target_latency_minutes", 0) * 60, concurrency.get("window", 10))
+        if not patch_config_threads(controller.maximum):
+            return 1
+
+    if (dispatcher is not None or controller is not None) and not patch_process_module(dispatcher, controller):
+        return 1
+
+    if shared_tasks is not None:
+        print(f"Общие задачи для всех аккаунтов: {shared_tasks}")
+        inject_tasks_module(shared_tasks)
+    elif random_tasks:
+        setup_logging(shard_path("random_tasks_log.txt", shard, shards))
+        logger.info("Запуск с рандомными задачами для каждого аккаунта")
+        plan_source = PlanSource(settings, modules, seed, plans_path, shard_accounts, compact=shards <= 1, watch_path=settings_path,
+                                 estimates=estimates)
+        journal = TaskJournal(shard_path("task_journal.jsonl", shard, shards), resume)
+        metrics = TaskMetrics(shard_path("task_metrics.json", shard, shards), shard, settings.get("metrics_interval", 15))
+        module_stats = ModuleStats(shard_path("module_stats.json", shard, shards))
+        limiter = ModuleLimiter(settings.get("module_limits"), shards)
+        if not patch_config_module() or not patch_start_module(plan_source, journal, metrics, module_stats, limiter, controller):
+            print("Не удалось пропатчить модули бота. Проверьте лог-файл.")
+            return 1
+
+    profiler = None
+    if profile:
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        profiler = RunProfiler(profile, os.path.splitext(shard_path(f"profile_{stamp}.txt", shard, shards))[0])
+        if profile_accounts and not patch_profile_limit(profiler, profile_accounts):
+            return 1
+
+    try:
+        # Импортируем main и запускаем все аккаунты
+        import main
+        if profiler is not None:
+            profiler.start()
+        asyncio.run(main.main())
+    except KeyboardInterrupt:
+        print("\nПрограмма остановлена пользователем")
+    except Exception as e:
+        print(f"Ошибка при запуске main.py: {e}")
+        print(traceback.format_exc())
+        return 1
+    finally:
+        if profiler is not None:
+            profiler.stop()
+        if dispatcher is not None:
+            dispatcher.save_report(shard_path("schedule_report.json", shard, shards))
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Раннер StarLabs Monad")
+    parser.add_argument("--settings", required=True, help="Файл настроек запуска (пишет лаунчер)")
+    parser.add_argument("--random", action="store_true", help="Рандомные задачи для каждого аккаунта")
+    parser.add_argument("--schedule", metavar="PATH", help="Запуск по расписанию из файла")
+    parser.add_argument("--seed", type=int, help="Сид запуска")
+    parser.add_argument("--plans", metavar="PATH", help="Заранее сгенерированные планы задач")
+    parser.add_argument("--resume", action="store_true", help="Пропускать задачи, выполненные по журналу")
+    parser.add_argument("--tasks", type=json.loads, metavar="JSON", help="Общий план задач для всех аккаунтов (CUSTOM_TASK)")
+    parser.add_argument("--shard", type=int, default=0, help="Номер шарда (с 0)")
+    parser.add_argument("--shards", type=int, default=1, help="Количество шардов")
+    parser.add_argument("--elapsed", type=int, default=0, help="Сколько секунд расписания прошло до перезапуска")
+    parser.add_argument("--profile", choices=("cprofile", "sampling"), help="Профилировать запуск (profile_*.pstats или profile_*.collapsed)")
+    parser.add_argument("--profile-accounts", type=int, default=0, metavar="N", help="Профилировать только первые N аккаунтов")
+    parser.add_argument("--no-pause", action="store_true", help="Не ждать Enter при завершении (раннер под надзором лаунчера)")
+    args = parser.parse_args(argv)
+
+    with open(args.settings, "r", encoding="utf-8") as file:
+        run_settings = json.load(file)
+
+    try:
+        return run(
+            run_settings["settings"], run_settings["modules"],
+            random_tasks=args.random, schedule_path=args.schedule, seed=args.seed, plans_path=args.plans, resume=args.resume,
+            shared_tasks=args.tasks, accounts=run_settings.get("accounts"), shard=args.shard, shards=args.shards,
+            elapsed=args.elapsed, profile=args.profile, profile_accounts=args.profile_accounts,
+            settings_path=run_settings.get("settings_path"), estimates=run_settings.get("estimates"),
+        )
+    finally:
+        # Пауза, чтобы консоль не закрывалась (только в интерактивной консоли).
+        # Шарды вне Windows делят один терминал — ждет только первый
+        own_console = args.shard == 0 or platform.system() == "Windows"
+        if own_console and not args.no_pause and sys.stdin is not None and sys.stdin.isatty():
+            print("\nНажмите Enter для выхода...")
+            input()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+import os
+import sys
+
+import pytest
+
+# Модули лаунчера лежат в корне проекта
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def modules():
+    """Каталог модулей в формате tasks.py"""
+    return {
+        "INITIAL": ["faucet"],
+        "SWAPS": ["swap_a", "swap_b", "swap_c", "collect_all_to_monad"],
+        "STAKES": ["stake_a", "stake_b"],
+        "MINT": ["mint_a", "mint_b"],
+        "GAMES": ["game_a"],
+        "OTHER": ["other_a", "logs"],
+    }
+
+
+@pytest.fixture
+def make_settings():
+    """Настройки рандомизации в формате launcher_settings.json; разделы можно заменить"""
+    def make(**sections):
+        settings = {
+            "initial": {"modules": {"faucet": True}},
+            "swaps": {"min": 1, "max": 3, "modules": {"swap_a": True, "swap_b": True, "swap_c": True, "collect_all_to_monad": True}},
+            "stakes": {"min": 1, "max": 2, "modules": {"stake_a": True, "stake_b": True}},
+            "mint": {"min": 0, "max": 1, "modules": {"mint_a": True, "mint_b": True}},
+            "games": {"modules": {"game_a": False}},
+            "other": {"probability": 50, "modules": {"other_a": True, "logs": False}},
+            "collect": {"probability": 50},
+        }
+        settings.update(sections)
+        return settings
+    return make
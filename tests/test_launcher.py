@@ -0,0 +1,169 @@
+"""Тесты вспомогательных функций лаунчера (launcher.py)"""
+
+import time
+import random
+
+import pytest
+
+import launcher
+from launcher_plans import save_plans
+from launcher import generate_schedule_offsets, build_schedule, count_nonblank_lines, TasksFile, OutputPump, RunnerSupervisor, StarLabsLauncherCore
+
+
+@pytest.mark.parametrize("accounts, total, min_gap", [(1, 3600, 300), (2, 3600, 300), (100, 86400, 300), (50, 1000, 300)])
+def test_schedule_offsets_gaps(accounts, total, min_gap):
+    offsets, gap = generate_schedule_offsets(accounts, total, min_gap, random.Random(1))
+    assert len(offsets) == accounts
+    assert offsets[0] == 0
+    assert offsets[-1] <= total
+    assert all(b - a >= gap for a, b in zip(offsets, offsets[1:]))
+    # Интервал уменьшается, только если не помещается в окно
+    assert gap == min(min_gap, total // max(1, accounts - 1))
+
+
+def test_schedule_offsets_are_seeded():
+    first, _ = generate_schedule_offsets(20, 86400, 300, random.Random("7:schedule"))
+    second, _ = generate_schedule_offsets(20, 86400, 300, random.Random("7:schedule"))
+    assert first == second
+
+
+def test_build_schedule_respects_threads():
+    offsets, gap, completion = build_schedule(100, 3600, 4, 1200, random.Random(1))
+    # Все аккаунты не успевают: запуски подряд с интервалом длительность / потоки
+    assert gap == 300
+    assert offsets == [i * 300 for i in range(100)]
+    assert completion == offsets[-1] + 1200
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 64])
+def test_count_nonblank_lines_chunk_boundaries(tmp_path, chunk_size):
+    content = b"\n\nkey1\r\n  \t\r\nkey2\n\n\n   \nkey3  \n\x0c\nkey4"
+    path = tmp_path / "keys.txt"
+    path.write_bytes(content)
+    expected = sum(1 for line in content.decode().splitlines() if line.strip())
+    assert count_nonblank_lines(str(path), chunk_size) == expected == 4
+
+
+def test_count_nonblank_lines_trailing_blank(tmp_path):
+    path = tmp_path / "keys.txt"
+    path.write_bytes(b"key1\nkey2\n   ")
+    assert count_nonblank_lines(str(path), 4) == 2
+
+
+def test_tasks_file_update_nested_lists(tmp_path):
+    path = tmp_path / "tasks.py"
+    path.write_text(
+        '# Пресеты\nTASKS = ["CUSTOM_TASK"]\n\nCUSTOM_TASK = [\n    "faucet",\n]\n\nOTHER = [1, 2]  # не трогать\n',
+        encoding="utf-8",
+    )
+    tasks_file = TasksFile(str(path))
+    assert tasks_file.get("CUSTOM_TASK") == ["faucet"]
+
+    plan = ["faucet", ["izumi", "bean"], "logs"]
+    assert tasks_file.update(CUSTOM_TASK=plan) is True
+    assert TasksFile(str(path)).get("CUSTOM_TASK") == plan
+    text = path.read_text(encoding="utf-8")
+    assert text.startswith('# Пресеты\nTASKS = ["CUSTOM_TASK"]\n')
+    assert text.endswith("OTHER = [1, 2]  # не трогать\n")
+
+    # Те же задачи — файл не перезаписывается
+    assert tasks_file.update(CUSTOM_TASK=plan) is False
+    with pytest.raises(KeyError):
+        tasks_file.update(MISSING=[])
+
+
+def test_output_pump_log_file_keeps_dropped_lines(tmp_path):
+    path = tmp_path / "launcher_log.txt"
+    pump = OutputPump(capacity=10, log_file=open(path, "w", encoding="utf-8"))
+    pump.message("запуск")
+    for i in range(100):
+        pump.push(f"line {i}")
+
+    lines = pump.drain()
+    # В окно — только последние строки буфера и сообщения лаунчера
+    assert lines[0] == "... пропущено строк вывода: 90"
+    assert lines[1:] == [f"line {i}" for i in range(90, 100)] + ["запуск"]
+    pump.close_log()
+    assert path.read_text(encoding="utf-8").splitlines() == ["запуск"] + [f"line {i}" for i in range(100)]
+
+
+class FakeProcess:
+    pid = 1
+
+    def __init__(self, code):
+        self.code = code
+
+    def wait(self):
+        return self.code
+
+
+def test_supervisor_resume_continues_schedule(monkeypatch):
+    monkeypatch.setattr(RunnerSupervisor, "BACKOFF_BASE", 0)
+    codes = iter([1, 0])
+    commands = []
+
+    def spawn(command):
+        commands.append(command)
+        return FakeProcess(next(codes))
+
+    supervisor = RunnerSupervisor(spawn, [["runner"]], lambda elapsed: ["--elapsed", str(elapsed)], log=lambda text: None, elapsed=3600)
+    assert supervisor.start().wait() == 0
+    # Продолжение сразу получает прошедшее время, перезапуск после сбоя — не меньше
+    assert commands[0] == ["runner", "--elapsed", "3600"]
+    assert commands[1][:2] == ["runner", "--elapsed"] and int(commands[1][2]) >= 3600
+
+
+def test_schedule_elapsed_after_interruption(tmp_path, monkeypatch):
+    core = StarLabsLauncherCore.__new__(StarLabsLauncherCore)
+    core.run_seed = 5
+    core.update_info = lambda text: None
+    core.schedule_start_path = lambda: str(tmp_path / "schedule_start.json")
+    core.record_schedule_start()
+
+    started = time.time()
+    monkeypatch.setattr(time, "time", lambda: started + 7200)
+    assert 7199 <= core.schedule_elapsed() <= 7200
+    # Время начала другого запуска не подходит
+    core.run_seed = 6
+    assert core.schedule_elapsed() == 0
+
+
+def make_core(tmp_path, monkeypatch):
+    """Лаунчер без чтения tasks.py и настроек, файлы запуска — в tmp_path"""
+    monkeypatch.setattr(launcher, "__file__", str(tmp_path / "launcher.py"))
+    core = StarLabsLauncherCore.__new__(StarLabsLauncherCore)
+    core.update_info = lambda text: None
+    core.seed = None
+    core.resume = False
+    core.random_modules_enabled = core.random_for_each_account = True
+    core.plan_cache_hours = 24
+    core.module_stats = {}
+    return core
+
+
+def test_plan_seed_reused_within_cache_horizon(tmp_path, monkeypatch):
+    core = make_core(tmp_path, monkeypatch)
+    seed, replay = core.resolve_run_seed()
+    assert not replay
+    # Пока сохраненные планы действуют, запуск берет их сид
+    assert core.resolve_run_seed() == (seed, True)
+    core.seed = 5
+    assert core.resolve_run_seed() == (5, True)
+    core.seed = None
+    started = time.time()
+    monkeypatch.setattr(time, "time", lambda: started + 25 * 3600)
+    assert core.resolve_run_seed()[0] != seed
+
+
+def test_resume_replays_seed_and_estimates(tmp_path, monkeypatch):
+    core = make_core(tmp_path, monkeypatch)
+    core.module_stats = {"izumi": {"ewma": 50.0}}
+    save_plans(str(tmp_path / "plans.json"), [1], [["izumi"]], 11, {"izumi": 30.0})
+    core.resume = True
+    core.run_seed, replay = core.resolve_run_seed()
+    assert (core.run_seed, replay) == (11, True)
+    # Повтор берет оценки, записанные рядом с сидом, новый запуск — текущие
+    assert core.resolve_estimates(replay) == {"izumi": 30.0}
+    assert core.resolve_estimates() == {"izumi": 50.0}
+    core.run_seed = 12
+    assert core.resolve_estimates(replay=True) == {"izumi": 50.0}
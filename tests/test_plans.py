@@ -0,0 +1,127 @@
+"""Тесты генерации планов (launcher_plans.py)"""
+
+import json
+
+import launcher_plans
+from launcher_plans import TaskSampler, seeded_rng, build_plans, sample_plan_chunk, save_plans, load_plans, settings_fingerprint
+
+def count_in(plan, category):
+    """Количество модулей категории в плане (без collect_all_to_monad)"""
+    return sum(1 for task in plan if task in category and task != "collect_all_to_monad")
+
+
+def test_min_zero_picks_up_to_max(modules, make_settings):
+    """При минимуме 0 количество модулей — от 0 до максимума, а не всегда 0"""
+    sampler = TaskSampler(make_settings(swaps={"min": 0, "max": 2, "modules": {"swap_a": True, "swap_b": True, "swap_c": True}}), modules)
+    counts = {count_in(sampler.sample(seeded_rng(1, account)), modules["SWAPS"]) for account in range(200)}
+    assert counts == {0, 1, 2}
+
+
+def test_count_clamped_to_enabled_modules(modules, make_settings):
+    sampler = TaskSampler(make_settings(swaps={"min": 5, "max": 10, "modules": {"swap_a": True, "swap_b": True, "swap_c": False}}), modules)
+    for account in range(50):
+        assert count_in(sampler.sample(seeded_rng(1, account)), modules["SWAPS"]) == 2
+
+
+def test_plan_order(modules, make_settings):
+    """Начальные модули в начале, collect_all_to_monad и logs в конце"""
+    sampler = TaskSampler(make_settings(collect={"probability": 100}), modules)
+    for account in range(50):
+        plan = sampler.sample(seeded_rng(7, account))
+        assert plan[0] == "faucet"
+        assert plan[-2:] == ["collect_all_to_monad", "logs"]
+        assert plan.count("collect_all_to_monad") == 1
+
+
+def test_seeded_plans_are_deterministic(modules, make_settings):
+    settings = make_settings()
+    accounts = list(range(1, 101))
+    plans, _ = build_plans(accounts, settings, modules, 42, workers=1)
+    again, _ = build_plans(accounts, settings, modules, 42, workers=1)
+    other, _ = build_plans(accounts, settings, modules, 43, workers=1)
+    assert plans == again
+    assert plans != other
+    # План аккаунта не зависит от того, в какой пачке он сгенерирован
+    assert sample_plan_chunk(settings, modules, 42, accounts[50:60]) == plans[50:60]
+
+
+def test_parallel_plans_match_serial(monkeypatch, modules, make_settings):
+    settings = make_settings()
+    accounts = list(range(1, 41))
+    serial, _ = build_plans(accounts, settings, modules, 5, workers=1)
+    monkeypatch.setattr(launcher_plans, "PARALLEL_PLANS_THRESHOLD", 1)
+    parallel, workers = build_plans(accounts, settings, modules, 5, workers=2)
+    assert workers == 2
+    assert parallel == serial
+
+
+def test_budget_off_keeps_plans(modules, make_settings):
+    """Нулевой бюджет не меняет планы"""
+    accounts = list(range(1, 51))
+    plain, _ = build_plans(accounts, make_settings(), modules, 3, workers=1)
+    budget = {"minutes": 0, "transactions": 0, "default_minutes": 3, "module_minutes": {}, "module_transactions": {}}
+    with_budget, _ = build_plans(accounts, make_settings(budget=budget), modules, 3, workers=1)
+    assert plain == with_budget
+
+
+def test_budget_fits_time(modules, make_settings):
+    budget = {"minutes": 10, "default_minutes": 3, "module_minutes": {"swap_a": 10, "logs": 0, "faucet": 1}}
+    sampler = TaskSampler(make_settings(budget=budget), modules)
+    for account in range(100):
+        plan = sampler.sample(seeded_rng(9, account))
+        assert sum(sampler.seconds(task) for task in plan) <= 10 * 60
+        # Минимумы категорий не нарушаются
+        assert count_in(plan, modules["SWAPS"]) >= 1
+        assert count_in(plan, modules["STAKES"]) >= 1
+        # Тяжелый swap_a заменяется более легким модулем
+        assert "swap_a" not in plan
+
+
+def test_budget_keeps_minimums_when_infeasible(modules, make_settings):
+    budget = {"minutes": 1, "default_minutes": 3}
+    sampler = TaskSampler(make_settings(budget=budget), modules)
+    for account in range(50):
+        plan = sampler.sample(seeded_rng(2, account))
+        assert count_in(plan, modules["SWAPS"]) == 1
+        assert count_in(plan, modules["STAKES"]) == 1
+        assert count_in(plan, modules["MINT"]) == 0
+        assert "other_a" not in plan and "collect_all_to_monad" not in plan
+
+
+def test_budget_fits_transactions(modules, make_settings):
+    budget = {"transactions": 8, "module_transactions": {"stake_a": 3, "stake_b": 3}}
+    sampler = TaskSampler(make_settings(budget=budget), modules)
+    for account in range(50):
+        plan = sampler.sample(seeded_rng(4, account))
+        assert count_in(plan, modules["STAKES"]) == 1
+        assert sum(sampler.transactions(task) for task in plan) <= 8
+
+
+def test_estimates_used_unless_overridden(modules, make_settings):
+    budget = {"minutes": 10, "module_minutes": {"swap_a": 1}}
+    sampler = TaskSampler(make_settings(budget=budget), modules, {"swap_a": 600, "swap_b": 30})
+    assert sampler.seconds("swap_a") == 60
+    assert sampler.seconds("swap_b") == 30
+    assert sampler.seconds("swap_c") == 180
+
+
+def test_plans_file_round_trip(tmp_path):
+    accounts = [3, 1, 7]
+    plans = [["faucet", "swap_a", "logs"], ["faucet", "logs"], ["swap_b", "swap_a"]]
+    path = str(tmp_path / "plans.json")
+    save_plans(path, accounts, plans, 42)
+    assert load_plans(path) == dict(zip(accounts, plans))
+    # Записанный файл полностью заменяет прежний, оценки модулей хранятся рядом с сидом
+    save_plans(path, [1], [["logs"]], 43, {"logs": 12.5})
+    assert load_plans(path) == {1: ["logs"]}
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    assert (data["seed"], data["estimates"]) == (43, {"logs": 12.5})
+
+
+def test_fingerprint_tracks_sampling_settings_and_seed(make_settings):
+    settings = make_settings()
+    base = settings_fingerprint(settings, 1)
+    assert settings_fingerprint(dict(settings, shards=4, hours_value="12"), 1) == base
+    assert settings_fingerprint(dict(settings, collect={"probability": 10}), 1) != base
+    assert settings_fingerprint(settings, 2) != base
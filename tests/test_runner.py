@@ -0,0 +1,226 @@
+"""Тесты раннера (launcher_runner.py) без запуска бота"""
+
+import sys
+import json
+import asyncio
+
+import pytest
+
+import launcher_runner
+from launcher_runner import ScheduleDispatcher, ModuleLimiter, ConcurrencyController, TaskMetrics, PlanSource, LATE_THRESHOLD, inject_tasks_module
+from launcher_plans import build_plans, save_plans
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_dispatcher_records_lateness(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(launcher_runner, "schedule_clock", clock)
+    dispatcher = ScheduleDispatcher([0, 10, 20])
+
+    async def scenario():
+        for account, moment in ((1, 0), (2, 25), (3, 26)):
+            clock.now = 1000.0 + moment
+            await dispatcher.wait_for_slot(dispatcher.take_slot(), account)
+
+    # Отсчет начинается с первого аккаунта
+    clock.now = 1000.0
+    asyncio.run(scenario())
+    assert [entry["lateness"] for entry in dispatcher.report] == [0, 15, 6]
+    assert sum(entry["lateness"] > LATE_THRESHOLD for entry in dispatcher.report) == 2
+
+
+def test_dispatcher_continues_after_restart(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(launcher_runner, "schedule_clock", clock)
+    # Короткие шаги ожидания: после каждого дедлайн сверяется с часами
+    monkeypatch.setattr(launcher_runner, "MAX_SLEEP_STEP", 0.01)
+    dispatcher = ScheduleDispatcher([0, 50, 150], elapsed=100, skip_started=True)
+
+    slots = [dispatcher.take_slot() for _ in range(3)]
+    assert [dispatcher.started_before_restart(slot) for slot in slots] == [True, True, False]
+
+    async def scenario():
+        # Слот 150 при прошедших 100 секундах наступает через 50 секунд
+        waiting = asyncio.ensure_future(dispatcher.wait_for_slot(2, 3))
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+        clock.now += 50
+        await asyncio.wait_for(waiting, 1)
+
+    asyncio.run(scenario())
+    assert dispatcher.report[-1]["lateness"] == 0
+
+
+def test_limiter_moves_only_middle_tasks():
+    async def scenario():
+        limiter = ModuleLimiter({"izumi": 1, "bean": 0})
+        assert limiter.semaphore("bean") is None
+        await limiter.semaphore("izumi").acquire()
+
+        pending = [(2, "izumi"), (3, "bean"), (4, "logs")]
+        # izumi занят: берется следующая свободная задача середины плана
+        assert limiter.next_task(pending, range(2, 4)) == 1
+        # Вне середины задачи не переставляются
+        assert limiter.next_task(pending, range(3, 4)) == 0
+        limiter.semaphore("izumi").release()
+        assert limiter.next_task(pending, range(2, 4)) == 0
+
+    asyncio.run(scenario())
+
+
+def test_limiter_shares_slots_between_shards(tmp_path, monkeypatch):
+    monkeypatch.setattr(launcher_runner.SharedSlots, "POLL_INTERVAL", 0.01)
+
+    async def scenario():
+        # Два шарда с одним местом izumi на всех
+        first = ModuleLimiter({"izumi": 1, "bean": 0}, shards=2, lock_dir=str(tmp_path))
+        second = ModuleLimiter({"izumi": 1, "bean": 0}, shards=2, lock_dir=str(tmp_path))
+        assert second.semaphore("bean") is None
+        await first.semaphore("izumi").acquire()
+        assert second.busy("izumi")
+
+        waiting = asyncio.ensure_future(second.semaphore("izumi").acquire())
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+        first.semaphore("izumi").release()
+        await asyncio.wait_for(waiting, 1)
+        assert first.busy("izumi")
+        second.semaphore("izumi").release()
+        assert not first.busy("izumi")
+
+    asyncio.run(scenario())
+
+
+def test_concurrency_controller_aimd():
+    async def scenario():
+        controller = ConcurrencyController(4, 1, 6, target_success=0.9, window=4)
+        for _ in range(4):
+            await controller.acquire()
+        for _ in range(4):
+            await controller.release(True, 1.0)
+        assert controller.limit == 5
+
+        for _ in range(5):
+            await controller.acquire()
+        for ok in (True, False, False, True):
+            await controller.release(ok, 1.0)
+        assert controller.limit == 2
+
+    asyncio.run(scenario())
+
+
+def test_concurrency_controller_grows_only_when_saturated():
+    async def scenario():
+        controller = ConcurrencyController(4, 1, 6, window=2)
+        # Работает не больше двух аккаунтов из четырех мест — лимит не растет
+        for _ in range(3):
+            await controller.acquire()
+            await controller.acquire()
+            await controller.release(True, 1.0)
+            await controller.release(True, 1.0)
+        assert controller.limit == 4
+
+    asyncio.run(scenario())
+
+
+def test_concurrency_controller_backs_off_on_task_failures():
+    """Аккаунты завершились без ошибок, но большая часть их задач не выполнена"""
+    async def scenario():
+        controller = ConcurrencyController(4, 1, 6, target_success=0.9, window=2)
+        for _ in range(2):
+            await controller.acquire()
+        for ok in (True, True, False, False, True, False):
+            controller.record_task(ok)
+        for _ in range(2):
+            await controller.release(True, 1.0)
+        assert controller.limit == 2
+
+    asyncio.run(scenario())
+
+
+def test_metrics_accounts_written_at_exit_only(tmp_path):
+    path = tmp_path / "task_metrics.json"
+    metrics = TaskMetrics(str(path), interval=0)
+    metrics.record(1, "izumi", "ok", 2.0)
+    metrics.record(2, ["swaps", "bean"], "failed", 40.0)
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert "accounts" not in data
+    assert data["modules"]["izumi"]["ok"] == 1
+    assert data["modules"]["swaps|bean"]["failed"] == 1
+    assert data["modules"]["swaps|bean"]["buckets"][TaskMetrics.BUCKETS.index(60)] == 1
+    assert (tmp_path / "task_metrics.prom").exists()
+
+    metrics.write(final=True)
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["accounts"]["2"] == {"tasks": 1, "failed": 1, "seconds": 40.0}
+
+
+@pytest.fixture
+def make_plan_source(tmp_path, monkeypatch, modules, make_settings):
+    """PlanSource с plans.json на 3 аккаунта и файлом настроек лаунчера"""
+    monkeypatch.setattr(launcher_runner, "PROJECT_DIR", str(tmp_path))
+
+    def make(file_settings, seed=1):
+        settings = make_settings(budget={"minutes": 0, "transactions": 0, "default_minutes": 3, "module_minutes": {}, "module_transactions": {}})
+        plans, _ = build_plans([1, 2, 3], settings, modules, seed, workers=1)
+        save_plans(str(tmp_path / "plans.json"), [1, 2, 3], plans, seed)
+        watch_path = tmp_path / "launcher_settings.json"
+        watch_path.write_text(json.dumps(file_settings), encoding="utf-8")
+        source = PlanSource(settings, modules, seed, str(tmp_path / "plans.json"), watch_path=str(watch_path))
+        return source, plans, watch_path
+    return make
+
+
+def test_plan_source_ignores_missing_sections(make_plan_source, make_settings):
+    """Файл настроек без раздела budget (старый формат) — не изменение настроек"""
+    source, plans, _ = make_plan_source(make_settings())
+    assert source.get(1, "w1") == (plans[0], "plans")
+    assert len(source.precomputed) == 3
+
+
+def test_plan_source_reloads_changed_settings(make_plan_source, make_settings):
+    source, plans, watch_path = make_plan_source(make_settings())
+    assert source.get(1, "w1") == (plans[0], "plans")
+
+    watch_path.write_text(json.dumps(make_settings(swaps={"min": 0, "max": 0, "modules": {}})), encoding="utf-8")
+    source.watch_checked -= PlanSource.RELOAD_INTERVAL
+    source.watch_mtime = None
+    tasks, origin = source.get(2, "w2")
+    assert origin == "generated"
+    assert not any(task.startswith("swap_") for task in tasks)
+    # План уже запущенного аккаунта не меняется
+    assert source.get(1, "w1") == (plans[0], "cache")
+
+
+def test_plan_cache_is_per_seed(make_plan_source, make_settings):
+    source, plans, _ = make_plan_source(make_settings(), seed=1)
+    assert source.get(1, "w1") == (plans[0], "plans")
+    # Перезапуск с тем же сидом продолжает план из кэша, новый сид — план из своего plans.json
+    again, _, _ = make_plan_source(make_settings(), seed=1)
+    assert again.get(1, "w1") == (plans[0], "cache")
+    other, other_plans, _ = make_plan_source(make_settings(), seed=2)
+    assert other.get(1, "w1") == (other_plans[0], "plans")
+
+
+def test_inject_tasks_module_selects_custom_task(tmp_path, monkeypatch):
+    monkeypatch.setattr(launcher_runner, "PROJECT_DIR", str(tmp_path))
+    # После теста sys.modules восстанавливается
+    monkeypatch.setitem(sys.modules, "tasks", None)
+    tasks_path = tmp_path / "tasks.py"
+    tasks_path.write_text('TASKS = ["SWAPS_PRESET"]\n\nCUSTOM_TASK = ["faucet"]\n\nSWAPS_PRESET = ["izumi"]\n', encoding="utf-8")
+
+    inject_tasks_module(["faucet", ["izumi", "bean"], "logs"])
+    import tasks
+    # Общий план выполняется при любом пресете в tasks.py, сам файл не меняется
+    assert tasks.TASKS == ["CUSTOM_TASK"]
+    assert tasks.CUSTOM_TASK == ["faucet", ["izumi", "bean"], "logs"]
+    assert tasks.SWAPS_PRESET == ["izumi"]
+    assert tasks_path.read_text(encoding="utf-8").startswith('TASKS = ["SWAPS_PRESET"]')